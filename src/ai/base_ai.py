@@ -6,6 +6,7 @@ from enum import Enum
 
 from src.core.card import Card
 from src.algorithms.hand_evaluator import HandEvaluator
+from src.algorithms.hand_potential import get_hand_strength_engine
 
 class Position(Enum):
     SB = "sb"
@@ -48,9 +49,16 @@ class AIPlayer(ABC):
   
     def hand_strength(self, hole_cards: List[Card], board_cards: List[Card]) -> float:
 
+        # 플랍 이후에는 드로우까지 반영한 EHS (랜덤 상대 1명 기준)
+        if len(hole_cards) == 2 and len(board_cards) >= 3:
+            try:
+                return get_hand_strength_engine().evaluate(hole_cards, board_cards).ehs
+            except ValueError:
+                pass
+
         try:
             seven = hole_cards + board_cards  # List[Card]
-            rank, kickers, _ = HandEvaluator.evaluate_hand(seven)
+            rank, kickers = HandEvaluator.rank_hand(seven)
 
             # 랭크 정규화 (1~10 → 0~1)
             rank_score = (rank.value - 1) / 9
@@ -40,19 +40,6 @@ with open(pre_path, "r", encoding="utf-8") as f:
 
         PRE_TABLE[(hi, lo, suited)] = win
 
-# 포스트플랍 handrank 테이블 로드
-POST_TABLE = {}  # key = (HandRank, Phase)
-post_path = os.path.join(DATA_DIR, "handrank_winrates.csv")
-
-with open(post_path, "r", encoding="utf-8") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        rank = row["HandRank"]    # 예: "ONE_PAIR"
-        phase = row["Phase"]      # 예: "Flop"
-        win = float(row["WinRate"])
-
-        POST_TABLE[(rank, phase)] = win
-
 def card_to_code(card: Card) -> str:
     r = card.rank.symbol
     if r == "10":
@@ -148,6 +135,7 @@ from random import random
 
 from src.core.card import Card
 from src.ai.base_ai import Action, AIPlayer
+from src.algorithms.flop_database import get_flop_database
 
 RANKS = "23456789TJQKA"
 
@@ -182,19 +170,6 @@ with open(pre_path, "r", encoding="utf-8") as f:
 
         PRE_TABLE[(hi, lo, suited)] = win
 
-# 포스트플랍 handrank 테이블 로드
-POST_TABLE = {}  # key = (HandRank, Phase)
-post_path = os.path.join(DATA_DIR, "handrank_winrates.csv")
-
-with open(post_path, "r", encoding="utf-8") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        rank = row["HandRank"]    # 예: "ONE_PAIR"
-        phase = row["Phase"]      # 예: "Flop"
-        win = float(row["WinRate"])
-
-        POST_TABLE[(rank, phase)] = win
-
 def card_to_code(card: Card) -> str:
     r = card.rank.symbol
     if r == "10":
@@ -239,6 +214,13 @@ def get_preflop_strength(hole_cards):
     # CSV에 없을 경우 기본값 사용
     return 0.50 if suited else 0.45
 
+def get_flop_strength(hole_cards, community_cards):
+    """플랍 데이터베이스에서 이 보드의 정확한 승률 조회 (데이터베이스가 없으면 None)"""
+    database = get_flop_database(build=False)  # 게임 중에는 생성하지 않고 없으면 기존 강도로 대체
+    if database is None or len(hole_cards) != 2 or len(community_cards) != 3:
+        return None
+    return database.equity(hole_cards, community_cards)
+
 def pot_odds(pot: int, to_call: int):
     if to_call <= 0:
         return 0.0
@@ -293,15 +275,11 @@ class TightStrategy(Strategy):
             if pre >= 0.55 and po <= 0.40: return Action.CALL, to_call
             return Action.FOLD, 0
 
-        # 플랍 이후
-        strength = ai.hand_strength(ai.hole_cards, community_cards)
-
-        rank, _, _ = ai.evaluator.evaluate_hand(ai.hole_cards + community_cards)
-        phase = stage.capitalize()
-
-        key = (rank.name, phase)
-        if key in POST_TABLE:
-            strength = POST_TABLE[key]
+        # 플랍 이후 - 플랍은 보드별로 미리 계산한 승률이 있으면 그 값을 쓰고,
+        # 없거나 턴/리버면 드로우까지 반영한 EHS를 계산 (족보 등급별 평균 승률 표보다 정확)
+        strength = get_flop_strength(ai.hole_cards, community_cards) if stage == "flop" else None
+        if strength is None:
+            strength = ai.hand_strength(ai.hole_cards, community_cards)
 
         po = pot_odds(pot, to_call)
 
@@ -352,15 +330,11 @@ class LooseStrategy(Strategy):
             if pre >= 0.40 and po < 0.50: return Action.CALL, to_call
             return Action.FOLD, 0
 
-        # 플랍 이후
-        strength = ai.hand_strength(ai.hole_cards, community_cards)
-        
-        rank, _, _ = ai.evaluator.evaluate_hand(ai.hole_cards + community_cards)
-        phase = stage.capitalize()    # flop → Flop, turn → Turn, river → River (대소문자 변환)
-
-        key = (rank.name, phase)
-        if key in POST_TABLE:
-            strength = POST_TABLE[key]
+        # 플랍 이후 - 플랍은 보드별로 미리 계산한 승률이 있으면 그 값을 쓰고,
+        # 없거나 턴/리버면 드로우까지 반영한 EHS를 계산 (족보 등급별 평균 승률 표보다 정확)
+        strength = get_flop_strength(ai.hole_cards, community_cards) if stage == "flop" else None
+        if strength is None:
+            strength = ai.hand_strength(ai.hole_cards, community_cards)
         
         po = pot_odds(pot, to_call)
 
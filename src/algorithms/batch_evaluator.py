@@ -0,0 +1,230 @@
+"""
+NumPy 배치 족보 판정 - 문현준 담당
+정수 카드 배열(N x 5~7)을 파이썬 루프 없이 테이블 조회만으로 한 번에 점수화
+
+점수 형식은 HandEvaluator.score()와 같습니다 (src/algorithms/lookup_evaluator.py 참고).
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from src.algorithms import lookup_evaluator
+
+
+# 랭크 키(5진수, 13자리)를 하위 7랭크 / 상위 6랭크 두 부분으로 나눠 2차원 표로 조회
+_LOW_BASE = 5 ** 7
+
+# 지연 생성 배열 테이블
+_LOW_INDEX: Optional[np.ndarray] = None      # 하위 키 -> 행 번호
+_HIGH_INDEX: Optional[np.ndarray] = None     # 상위 키 -> 열 번호
+_RANK_CLASS: Optional[np.ndarray] = None     # (행, 열) -> 점수 번호 (uint16)
+_CLASS_SCORES: Optional[np.ndarray] = None   # 점수 번호 -> 점수
+_FLUSH_TABLE: Optional[np.ndarray] = None    # 13비트 랭크 마스크 -> 점수
+_FLUSH_SUIT: Optional[np.ndarray] = None     # 무늬 키 -> 플러시 무늬 (-1: 없음)
+_BOARD_FLUSH_SUIT: Optional[np.ndarray] = None  # 보드 무늬 키 -> 3장 이상인 무늬 (-1: 없음)
+
+_CARD_RANK_KEY = np.array(lookup_evaluator.RANK_KEY, dtype=np.int64)
+_CARD_SUIT_KEY = np.array(lookup_evaluator.SUIT_KEY, dtype=np.int64)
+_CARD_RANK_BIT = np.array(lookup_evaluator.RANK_BIT, dtype=np.int64)
+
+
+def _build_arrays() -> None:
+    global _LOW_INDEX, _HIGH_INDEX, _RANK_CLASS, _CLASS_SCORES, _FLUSH_TABLE, _FLUSH_SUIT
+    global _BOARD_FLUSH_SUIT
+
+    rank_table, flush_table, flush_suit = lookup_evaluator.get_tables()
+    keys = np.fromiter(rank_table.keys(), dtype=np.int64, count=len(rank_table))
+    scores = np.fromiter(rank_table.values(), dtype=np.int32, count=len(rank_table))
+
+    # 서로 다른 점수는 7,462개뿐이므로 표에는 uint16 번호만 저장
+    class_scores, class_ids = np.unique(scores, return_inverse=True)
+
+    low_keys, low_rows = np.unique(keys % _LOW_BASE, return_inverse=True)
+    high_keys, high_cols = np.unique(keys // _LOW_BASE, return_inverse=True)
+
+    low_index = np.zeros(_LOW_BASE, dtype=np.int32)
+    low_index[low_keys] = np.arange(len(low_keys))
+    high_index = np.zeros(5 ** 6, dtype=np.int32)
+    high_index[high_keys] = np.arange(len(high_keys))
+
+    rank_class = np.zeros((len(low_keys), len(high_keys)), dtype=np.uint16)
+    rank_class[low_rows, high_cols] = class_ids
+
+    _CLASS_SCORES = class_scores
+    _RANK_CLASS = rank_class
+    _HIGH_INDEX = high_index
+    _FLUSH_TABLE = np.array(flush_table, dtype=np.int32)
+    _FLUSH_SUIT = np.array(flush_suit, dtype=np.int8)
+    _BOARD_FLUSH_SUIT = np.array(lookup_evaluator.get_board_flush_suit_table(), dtype=np.int8)
+    _LOW_INDEX = low_index
+
+
+def ensure_arrays() -> None:
+    """배열 테이블이 아직 없으면 생성합니다 (프로세스당 한 번)."""
+    if _LOW_INDEX is None:
+        _build_arrays()
+
+
+def _score_rank_keys(rank_key: np.ndarray) -> np.ndarray:
+    """랭크 키 배열 -> 플러시를 제외한 점수 배열"""
+    rows = _LOW_INDEX[rank_key % _LOW_BASE]
+    cols = _HIGH_INDEX[rank_key // _LOW_BASE]
+    return _CLASS_SCORES[_RANK_CLASS[rows, cols]]
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """
+    여러 핸드를 한 번에 평가합니다.
+
+    Args:
+        cards: (N, 5~7) 정수 카드 id 배열 (한 행 = 한 핸드, 행 안의 카드는 서로 달라야 함)
+
+    Returns:
+        (N,) int32 점수 배열 - HandEvaluator.score()와 같은 값
+    """
+    if _LOW_INDEX is None:
+        _build_arrays()
+
+    cards = np.asarray(cards, dtype=np.intp)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError("(N, 5~7) 형태의 카드 배열이 필요합니다.")
+
+    # 열(카드 위치) 단위로 누적하는 편이 행 단위 sum(axis=1)보다 빠름
+    rank_key = _CARD_RANK_KEY[cards[:, 0]]
+    suit_key = _CARD_SUIT_KEY[cards[:, 0]]
+    for column in range(1, cards.shape[1]):
+        rank_key += _CARD_RANK_KEY[cards[:, column]]
+        suit_key += _CARD_SUIT_KEY[cards[:, column]]
+
+    scores = _score_rank_keys(rank_key)
+
+    flush_suit = _FLUSH_SUIT[suit_key]
+    flush_rows = np.flatnonzero(flush_suit >= 0)
+    if flush_rows.size:
+        # 플러시가 있는 행만 해당 무늬의 랭크 비트를 모아 플러시 테이블 조회
+        flush_cards = cards[flush_rows]
+        in_suit = (flush_cards & 3) == flush_suit[flush_rows, None]
+        mask = np.where(in_suit, _CARD_RANK_BIT[flush_cards], 0).sum(axis=1)
+        scores[flush_rows] = _FLUSH_TABLE[mask]
+
+    return scores
+
+
+class BoardBatch:
+    """
+    여러 보드(N x 3~5)를 한 번 분석해 두고 홀카드 2장을 배열 연산으로 점수화
+    (lookup_evaluator.BoardState의 배열 버전)
+
+    - rank_key: 보드별 랭크 키
+    - flush_suit / flush_mask / flush_count: 보드별 플러시 후보 무늬와 그 랭크 마스크/장수
+    - card_mask: 보드별 사용 카드 비트 (1 << 카드 id), 홀카드와 겹치는 보드를 거를 때 사용
+    """
+
+    def __init__(self, boards: np.ndarray):
+        if _LOW_INDEX is None:
+            _build_arrays()
+
+        boards = np.asarray(boards, dtype=np.intp)
+        if boards.ndim != 2 or not 3 <= boards.shape[1] <= 5:
+            raise ValueError("(N, 3~5) 형태의 보드 배열이 필요합니다.")
+
+        rank_key = _CARD_RANK_KEY[boards[:, 0]]
+        suit_key = _CARD_SUIT_KEY[boards[:, 0]]
+        card_mask = np.left_shift(np.uint64(1), boards[:, 0].astype(np.uint64))
+        for column in range(1, boards.shape[1]):
+            rank_key += _CARD_RANK_KEY[boards[:, column]]
+            suit_key += _CARD_SUIT_KEY[boards[:, column]]
+            card_mask |= np.left_shift(np.uint64(1), boards[:, column].astype(np.uint64))
+
+        flush_suit = _BOARD_FLUSH_SUIT[suit_key]
+        in_suit = (boards & 3) == flush_suit[:, None]
+        self.rank_key = rank_key
+        self.flush_suit = flush_suit
+        self.flush_mask = np.where(in_suit, _CARD_RANK_BIT[boards], 0).sum(axis=1)
+        self.flush_count = in_suit.sum(axis=1).astype(np.int8)
+        self.card_mask = card_mask
+
+    def __len__(self) -> int:
+        return len(self.rank_key)
+
+    def subset(self, rows: np.ndarray) -> "BoardBatch":
+        """일부 보드(행 번호 또는 불리언 마스크)만 담은 BoardBatch"""
+        batch = object.__new__(BoardBatch)
+        batch.rank_key = self.rank_key[rows]
+        batch.flush_suit = self.flush_suit[rows]
+        batch.flush_mask = self.flush_mask[rows]
+        batch.flush_count = self.flush_count[rows]
+        batch.card_mask = self.card_mask[rows]
+        return batch
+
+    def avoiding(self, card_ids) -> np.ndarray:
+        """주어진 카드를 하나도 쓰지 않는 보드의 불리언 마스크"""
+        mask = np.uint64(0)
+        for card_id in card_ids:
+            mask |= np.uint64(1) << np.uint64(card_id)
+        return (self.card_mask & mask) == 0
+
+    def score_hole(self, first_id, second_id) -> np.ndarray:
+        """
+        보드마다 홀카드 2장을 더한 최상의 점수 (BoardState.score_hole과 같은 값)
+
+        first_id / second_id는 정수 하나(모든 보드에 같은 홀카드) 또는
+        보드 수와 같은 길이의 배열(보드마다 다른 홀카드)입니다.
+        홀카드가 보드와 겹치지 않는지는 호출하는 쪽에서 확인합니다.
+        """
+        first_id = np.broadcast_to(np.asarray(first_id, dtype=np.intp), self.rank_key.shape)
+        second_id = np.broadcast_to(np.asarray(second_id, dtype=np.intp), self.rank_key.shape)
+        scores = _score_rank_keys(
+            self.rank_key + _CARD_RANK_KEY[first_id] + _CARD_RANK_KEY[second_id]
+        )
+
+        # 보드의 플러시 후보 무늬에 홀카드를 더해 5장 이상인 보드만 플러시 테이블 조회
+        first_in = (first_id & 3) == self.flush_suit
+        second_in = (second_id & 3) == self.flush_suit
+        count = self.flush_count + first_in + second_in
+        flush_rows = np.flatnonzero(count >= 5)
+        if flush_rows.size:
+            mask = (
+                self.flush_mask[flush_rows]
+                | np.where(first_in[flush_rows], _CARD_RANK_BIT[first_id[flush_rows]], 0)
+                | np.where(second_in[flush_rows], _CARD_RANK_BIT[second_id[flush_rows]], 0)
+            )
+            scores[flush_rows] = _FLUSH_TABLE[mask]
+        return scores
+
+
+def deal_batch(
+    rng: np.random.Generator,
+    num_deals: int,
+    num_cards: int,
+    available: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    겹치지 않는 카드 num_cards장짜리 무작위 딜을 num_deals개 만듭니다.
+
+    Args:
+        rng: NumPy 난수 생성기
+        num_deals: 딜 개수 (행 수)
+        num_cards: 딜당 카드 수 (열 수)
+        available: 뽑을 수 있는 카드 id 배열 (기본값: 52장 전체)
+
+    Returns:
+        (num_deals, num_cards) 정수 카드 id 배열
+    """
+    if available is None:
+        available = np.arange(52)
+    available = np.asarray(available)
+    num_available = len(available)
+
+    # 행마다 독립적인 부분 Fisher-Yates 셔플 (앞 num_cards 자리만 섞음)
+    perm = np.empty((num_deals, num_available), dtype=np.uint8)
+    perm[:] = np.arange(num_available, dtype=np.uint8)
+    rows = np.arange(num_deals)
+    for position in range(num_cards):
+        swap = rng.integers(position, num_available, size=num_deals)
+        current = perm[:, position].copy()
+        perm[:, position] = perm[rows, swap]
+        perm[rows, swap] = current
+
+    return available[perm[:, :num_cards]]
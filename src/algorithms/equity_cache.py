@@ -0,0 +1,137 @@
+"""
+무늬 동형(suit isomorphism) 정규화와 LRU 승률 캐시
+
+A♠K♠ / Q♠J♠2♦ 와 A♥K♥ / Q♥J♥2♣ 처럼 무늬 이름만 바꾼 스팟은 승률이 같습니다.
+(홀카드, 보드, 상대 수)를 무늬 치환 24가지 중 가장 작은 표현으로 바꾼 키로 묶어
+같은 스팟의 승률을 메모리에서 바로 돌려줍니다.
+"""
+
+import threading
+from collections import OrderedDict
+from itertools import permutations
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from src.core.card import Card
+
+
+# 무늬 치환 24가지를 카드 id -> 카드 id 표로 미리 계산 (id = 랭크 인덱스 * 4 + 무늬 인덱스)
+_SUIT_MAPS: List[List[int]] = [
+    [(card_id & ~3) | perm[card_id & 3] for card_id in range(52)]
+    for perm in permutations(range(4))
+]
+
+SpotKey = Tuple[Tuple[int, ...], Tuple[int, ...], int]
+
+
+def canonical_key(
+    hole_ids: Sequence[int],
+    board_ids: Sequence[int],
+    num_opponents: int
+) -> SpotKey:
+    """
+    (홀카드 id, 보드 id, 상대 수)를 무늬 치환과 카드 순서에 무관한 정규 키로 바꿉니다.
+
+    홀카드/보드 안의 순서는 승률과 무관하므로 정렬하고,
+    무늬 치환 24가지 중 사전순으로 가장 작은 표현을 고릅니다.
+    """
+    best = None
+    for suit_map in _SUIT_MAPS:
+        candidate = (
+            tuple(sorted(suit_map[card_id] for card_id in hole_ids)),
+            tuple(sorted(suit_map[card_id] for card_id in board_ids)),
+        )
+        if best is None or candidate < best:
+            best = candidate
+    return best[0], best[1], num_opponents
+
+
+def canonical_spot(
+    hole_cards: Sequence[Card],
+    community_cards: Sequence[Card],
+    num_opponents: int
+) -> SpotKey:
+    """canonical_key의 Card 버전"""
+    return canonical_key(
+        [card.id for card in hole_cards], [card.id for card in community_cards], num_opponents
+    )
+
+
+def canonical_hands_key(
+    hand_ids: Sequence[Sequence[int]],
+    board_ids: Sequence[int]
+) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]:
+    """
+    홀카드가 모두 알려진 여러 핸드 + 보드의 정규 키 (equities_for_hands 결과 캐시용)
+
+    결과가 핸드 순서를 따르므로 핸드끼리의 순서는 유지하고, 핸드 안/보드 안만 정렬합니다.
+    """
+    best = None
+    for suit_map in _SUIT_MAPS:
+        candidate = (
+            tuple(tuple(sorted(suit_map[card_id] for card_id in hand)) for hand in hand_ids),
+            tuple(sorted(suit_map[card_id] for card_id in board_ids)),
+        )
+        if best is None or candidate < best:
+            best = candidate
+    return best
+
+
+class EquityCache:
+    """
+    크기가 제한된 LRU 승률 캐시
+
+    가장 오래 쓰이지 않은 항목부터 버리며, 적중/실패/제거 횟수를 셉니다.
+    웹 게임 스레드 여러 개가 같은 캐시를 쓸 수 있도록 잠금으로 보호합니다.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("캐시 크기는 1 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """키에 저장된 값 (없으면 None). 적중하면 가장 최근 항목으로 옮깁니다."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """값을 저장하고 그대로 돌려줍니다. 크기를 넘으면 가장 오래된 항목을 버립니다."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """저장된 항목과 통계를 모두 지웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계 (size, maxsize, hits, misses, evictions)"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
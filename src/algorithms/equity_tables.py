@@ -0,0 +1,113 @@
+"""
+사전 계산 승률 테이블 파일 형식
+버전이 있는 작은 헤더 + 리틀 엔디언 C 순서 배열 (np.memmap으로 바로 열 수 있음)
+
+헤더 (64바이트 고정):
+    magic "HEQT" | 형식 버전 u16 | 테이블 종류 4바이트 | dtype 문자 | 차원 수 u8
+    | 메타 값 u64 (시행 수, 보드 수 등) | 차원 크기 u32 x 최대 8
+
+생성된 테이블 파일은 git에 넣지 않고 DATA_DIR에 캐시합니다 (처음 사용할 때 ensure_table로 생성).
+"""
+
+import os
+import struct
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+MAGIC = b"HEQT"
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+MAX_DIMS = 8
+
+_HEADER = struct.Struct("<4sH4scBQ8I")
+
+# 생성된 테이블 파일을 두는 디렉터리 (환경 변수 POKER_TABLE_DIR로 바꿀 수 있음)
+DATA_DIR = os.environ.get("POKER_TABLE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ai", "data"
+)
+
+
+def data_path(filename: str) -> str:
+    """DATA_DIR 안의 테이블 파일 경로"""
+    return os.path.join(DATA_DIR, filename)
+
+
+def write_table(path: str, kind: bytes, array: np.ndarray, meta: int = 0) -> None:
+    """
+    배열을 테이블 파일로 저장합니다.
+
+    Args:
+        kind: 테이블 종류를 나타내는 4바이트 태그 (예: b"PFEQ")
+        meta: 테이블과 함께 기록할 정수 (생성에 쓴 시행 수 등)
+    """
+    array = np.ascontiguousarray(array)
+    if array.dtype.byteorder == ">":
+        array = array.astype(array.dtype.newbyteorder("<"))
+    if len(kind) != 4 or array.ndim > MAX_DIMS:
+        raise ValueError("테이블 종류는 4바이트, 차원은 8 이하여야 합니다.")
+    shape = list(array.shape) + [0] * (MAX_DIMS - array.ndim)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, kind, array.dtype.char.encode(), array.ndim, meta, *shape
+    )
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(array.tobytes())
+
+
+def open_table(path: str, kind: bytes, mmap: bool = True) -> Tuple[np.ndarray, int]:
+    """
+    테이블 파일을 엽니다.
+
+    Args:
+        kind: 기대하는 테이블 종류 (다르면 ValueError)
+        mmap: True면 읽기 전용 np.memmap으로 열어 필요한 부분만 메모리에 올림
+
+    Returns:
+        (배열, 메타 값)
+    """
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"테이블 파일 헤더가 잘렸습니다: {path}")
+    magic, version, file_kind, dtype_char, ndim, meta, *shape = _HEADER.unpack(
+        raw[:_HEADER.size]
+    )
+    if magic != MAGIC:
+        raise ValueError(f"승률 테이블 파일이 아닙니다: {path}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 테이블 형식 버전입니다: {version}")
+    if file_kind != kind:
+        raise ValueError(f"테이블 종류가 다릅니다: {file_kind!r} (기대값 {kind!r})")
+
+    dtype = np.dtype(dtype_char.decode()).newbyteorder("<")
+    shape = tuple(shape[:ndim])
+    if mmap:
+        array = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=shape)
+    else:
+        array = np.fromfile(path, dtype=dtype, offset=HEADER_SIZE).reshape(shape)
+    return array, meta
+
+
+def ensure_table(path: str, kind: bytes, build: Callable[[], Tuple[np.ndarray, int]]) -> bool:
+    """
+    테이블 파일이 없으면 build()가 돌려준 (배열, 메타 값)으로 만들어 둡니다.
+
+    임시 파일에 쓴 뒤 이름을 바꾸므로 생성이 중간에 끊겨도 반쯤 쓴 파일이 남지 않습니다.
+
+    Returns:
+        이번 호출에서 새로 만들었으면 True
+    """
+    if os.path.exists(path):
+        return False
+    array, meta = build()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        write_table(temp_path, kind, array, meta)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return True
@@ -0,0 +1,295 @@
+"""
+플랍 승률 데이터베이스 - 무늬 동형 기준 1,755개 플랍 x 1,326개 홀카드 조합
+턴/리버 C(49,2) = 1,176가지와 상대 홀카드를 전부 나열한 정확한 값
+
+조합마다 두 값을 저장합니다.
+- equity: 랜덤 상대 1명에 대한 승률 (무승부 0.5)
+- ehs2:   리버 핸드 강도(HS)의 제곱 평균 E[HS²] - 드로우처럼 분산이 큰 핸드를 구분할 때 사용
+
+값은 0~1을 uint16(0~65535)으로 양자화해 (1755, 1326, 2) 배열로 저장하며 (약 9MB),
+게임 중에는 np.memmap으로 열어 인덱싱 한 번으로 조회합니다.
+플랍과 겹치는 조합 칸은 0입니다.
+
+파일은 저장소에 넣지 않습니다. get_flop_database()를 처음 부를 때 만들어 데이터 디렉터리에
+캐시하며 (CPU 코어 하나로 약 45분), 미리 만들어 두려면:
+생성: python -m src.algorithms.flop_database [--workers N]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, permutations
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms import equity_tables
+from src.algorithms.batch_evaluator import BoardBatch
+from src.algorithms.hand_classes import NUM_COMBOS, combo_index
+
+
+TABLE_KIND = b"FLEQ"
+NUM_FLOPS = 1755
+QUANT_SCALE = 65535
+
+DEFAULT_PATH = equity_tables.data_path("flop_equity.bin")
+
+# 무늬 치환 24가지 (카드 id -> 카드 id)
+_SUIT_MAPS = np.array([
+    [(card_id & ~3) | perm[card_id & 3] for card_id in range(52)]
+    for perm in permutations(range(4))
+], dtype=np.int16)
+
+# 점수는 2^24 미만이므로 (구간 번호 << 24) | 점수 로 여러 구간을 한 번에 정렬
+_SCORE_BITS = 24
+_SENTINEL = (1 << _SCORE_BITS) - 1
+
+# 지연 생성: 정렬된 플랍 코드 -> (정규 플랍 번호, 무늬 치환 번호)
+_FLOP_INDEX: Optional[np.ndarray] = None
+_FLOP_PERM: Optional[np.ndarray] = None
+_CANONICAL_FLOPS: Optional[np.ndarray] = None
+
+
+def _flop_code(flops: np.ndarray) -> np.ndarray:
+    """정렬된 플랍 (N, 3) -> 정수 코드"""
+    return (flops[:, 0] * 52 + flops[:, 1]) * 52 + flops[:, 2]
+
+
+def _build_flop_index() -> None:
+    """22,100개 플랍 각각의 정규 플랍 번호와, 그 정규형으로 옮기는 무늬 치환을 계산합니다."""
+    global _FLOP_INDEX, _FLOP_PERM, _CANONICAL_FLOPS
+
+    flops = np.array(list(combinations(range(52), 3)), dtype=np.int64)
+    # 치환마다 플랍을 옮겨 정렬한 코드 (24, 22100) 중 가장 작은 것이 정규형
+    codes = np.stack([
+        _flop_code(np.sort(suit_map[flops], axis=1).astype(np.int64)) for suit_map in _SUIT_MAPS
+    ])
+    best_perm = codes.argmin(axis=0)
+    canonical_codes = codes[best_perm, np.arange(len(flops))]
+    unique_codes, flop_ids = np.unique(canonical_codes, return_inverse=True)
+
+    flop_index = np.full(52 ** 3, -1, dtype=np.int16)
+    flop_perm = np.zeros(52 ** 3, dtype=np.int8)
+    own_codes = _flop_code(flops)
+    flop_index[own_codes] = flop_ids
+    flop_perm[own_codes] = best_perm
+
+    _CANONICAL_FLOPS = np.stack(
+        [unique_codes // 2704, unique_codes // 52 % 52, unique_codes % 52], axis=1
+    )
+    _FLOP_PERM = flop_perm
+    _FLOP_INDEX = flop_index
+
+
+def canonical_flops() -> np.ndarray:
+    """정규 플랍 1,755개 (N, 3) - 데이터베이스의 행 순서"""
+    if _FLOP_INDEX is None:
+        _build_flop_index()
+    return _CANONICAL_FLOPS
+
+
+def canonical_flop(flop_ids: Sequence[int]) -> Tuple[int, int]:
+    """
+    플랍 카드 id 3장 -> (정규 플랍 번호, 무늬 치환 번호)
+
+    무늬 치환 번호의 표(_SUIT_MAPS)를 홀카드에도 똑같이 적용하면 정규 플랍 기준의 홀카드가 됩니다.
+    """
+    if _FLOP_INDEX is None:
+        _build_flop_index()
+    first, second, third = sorted(flop_ids)
+    code = (first * 52 + second) * 52 + third
+    return int(_FLOP_INDEX[code]), int(_FLOP_PERM[code])
+
+
+def _grouped_counts(keys: np.ndarray, group_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (구간 번호 << 24) | 점수 키 배열에서 원소마다 같은 구간 안의 더 작은 키 수와 같은 키 수를 셉니다.
+
+    구간 번호는 0부터 빠짐없이 쓰이고 구간마다 원소가 group_size개씩 있어야 합니다.
+    """
+    flat = keys.ravel()
+    order = np.argsort(flat)
+    ordered = flat[order]
+    run_start = np.concatenate(([True], ordered[1:] != ordered[:-1]))
+    starts = np.flatnonzero(run_start)
+    ends = np.append(starts[1:], len(flat))
+    run = np.cumsum(run_start) - 1
+
+    # 구간 번호 g의 원소는 정렬 후 [g * group_size, (g + 1) * group_size) 위치에 모임
+    lower = np.empty(len(flat), dtype=np.int64)
+    equal = np.empty(len(flat), dtype=np.int64)
+    lower[order] = starts[run] - (ordered >> _SCORE_BITS) * group_size
+    equal[order] = (ends - starts)[run]
+    return lower.reshape(keys.shape), equal.reshape(keys.shape)
+
+
+def flop_equities(flop: Sequence[int]) -> np.ndarray:
+    """
+    플랍 하나에 대해 모든 조합의 (equity, ehs2)를 정확히 계산합니다.
+
+    런아웃(턴, 리버)마다 유효한 모든 조합을 점수화한 뒤 정렬 한 번으로 각 조합보다 낮은/같은
+    조합 수를 세고, 내 카드와 겹치는 상대 조합은 카드별로 따로 센 값을 빼서 보정합니다.
+    모든 런아웃을 (런아웃 번호 << 24) | 점수 키로 묶어 한 번에 정렬합니다.
+    (카드 제거 없이 조합쌍마다 비교하면 런아웃당 1,081² 번이 필요합니다.)
+
+    Returns:
+        (1326, 2) float64 배열 - 플랍과 겹치는 조합은 0
+    """
+    flop = [int(card_id) for card_id in flop]
+    remaining = np.array([card_id for card_id in range(52) if card_id not in flop], dtype=np.intp)
+    num_cards = len(remaining)                         # 49
+    hero_pairs = np.array(list(combinations(range(num_cards), 2)), dtype=np.intp)
+    hero_cards = remaining[hero_pairs]                 # (1176, 2) - 조합의 카드 id
+    runouts = hero_cards                               # 턴/리버도 같은 49장에서 2장
+    num_heroes, num_runouts = len(hero_cards), len(runouts)
+
+    # 모든 (런아웃, 조합) 점수 - 런아웃과 겹치는 조합은 점수화하지 않고 어떤 점수보다 큰 값으로 표시
+    pair_masks = (np.int64(1) << hero_pairs[:, 0]) | (np.int64(1) << hero_pairs[:, 1])
+    dead = (pair_masks[:, None] & pair_masks[None, :]) != 0   # (런아웃, 조합) 카드 겹침
+    rows, cols = np.nonzero(~dead)
+    boards = np.concatenate([np.tile(flop, (num_runouts, 1)), runouts], axis=1)
+    scores = np.full((num_runouts, num_heroes), _SENTINEL, dtype=np.int64)
+    scores[rows, cols] = BoardBatch(boards).subset(rows).score_hole(
+        hero_cards[cols, 0], hero_cards[cols, 1]
+    )
+
+    runout_ids = np.arange(num_runouts, dtype=np.int64)[:, None]
+
+    # 1) 런아웃별 전체 조합 중 더 낮은/같은 점수의 수
+    lower, equal = _grouped_counts((runout_ids << _SCORE_BITS) | scores, num_heroes)
+
+    # 2) 카드별로 그 카드를 포함한 조합 중 더 낮은/같은 점수의 수 (카드 제거 보정)
+    #    card_combos[c] = 카드 c를 포함한 조합 48개, slots[h, k] = 조합 h가 그 카드 목록에서 몇 번째인지
+    card_combos = np.array([
+        np.flatnonzero((hero_pairs == card).any(axis=1)) for card in range(num_cards)
+    ])                                                 # (49, 48)
+    per_card = card_combos.shape[1]
+    slots = np.empty((num_heroes, 2), dtype=np.intp)
+    for column in range(2):
+        cards = hero_pairs[:, column]
+        slots[:, column] = np.argmax(card_combos[cards] == np.arange(num_heroes)[:, None], axis=1)
+
+    group_ids = runout_ids[:, :, None] * num_cards + np.arange(num_cards)[None, :, None]
+    card_lower, card_equal = _grouped_counts(
+        (group_ids << _SCORE_BITS) | scores[:, card_combos], per_card
+    )
+    for column in range(2):
+        lower -= card_lower[:, hero_pairs[:, column], slots[:, column]]
+        equal -= card_equal[:, hero_pairs[:, column], slots[:, column]]
+
+    # 자기 자신은 equal에서 세 번(전체 1, 카드별 2) 다뤄졌으므로 +1 하면 무승부 상대 수가 됨
+    villains = (num_cards - 4) * (num_cards - 5) // 2  # 990
+    hs = (lower + 0.5 * (equal + 1)) / villains
+    hs[dead] = 0.0
+
+    live = (~dead).sum(axis=0)                         # 조합마다 1,081
+    result = np.zeros((NUM_COMBOS, 2))
+    indices = [combo_index(first, second) for first, second in hero_cards]
+    result[indices, 0] = hs.sum(axis=0) / live
+    result[indices, 1] = (hs * hs).sum(axis=0) / live
+    return result
+
+
+def _quantized_flop(flop_number: int) -> np.ndarray:
+    """정규 플랍 한 개의 양자화된 행 (프로세스 워커에서 실행)"""
+    values = flop_equities(canonical_flops()[flop_number])
+    return np.rint(values * QUANT_SCALE).astype(np.uint16)
+
+
+def build_flop_database(
+    workers: Optional[int] = None,
+    flop_numbers: Optional[Sequence[int]] = None,
+    verbose: bool = False
+) -> np.ndarray:
+    """
+    정규 플랍 전체(또는 flop_numbers만)의 데이터베이스 배열을 만듭니다.
+
+    플랍 단위로 프로세스 풀에 나눠 계산합니다.
+
+    Returns:
+        (1755, 1326, 2) uint16 배열 (계산하지 않은 플랍 행은 0)
+    """
+    numbers = list(range(NUM_FLOPS)) if flop_numbers is None else list(flop_numbers)
+    database = np.zeros((NUM_FLOPS, NUM_COMBOS, 2), dtype=np.uint16)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        rows = executor.map(_quantized_flop, numbers, chunksize=8)
+        for done, (flop_number, row) in enumerate(zip(numbers, rows), 1):
+            database[flop_number] = row
+            if verbose and done % 50 == 0:
+                print(f"{done:4d}/{len(numbers)} 플랍")
+    return database
+
+
+class FlopEquityDatabase:
+    """플랍 승률 데이터베이스 조회 (mmap, O(1))"""
+
+    def __init__(self, data: np.ndarray):
+        """
+        Args:
+            data: (1755, 1326, 2) uint16 배열
+        """
+        self.data = data
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH, mmap: bool = True) -> "FlopEquityDatabase":
+        data, _ = equity_tables.open_table(path, TABLE_KIND, mmap=mmap)
+        return cls(data)
+
+    def save(self, path: str = DEFAULT_PATH) -> None:
+        equity_tables.write_table(path, TABLE_KIND, self.data)
+
+    def lookup_ids(self, hole_ids: Sequence[int], flop_ids: Sequence[int]) -> Tuple[float, float]:
+        """홀카드 2장 + 플랍 3장(카드 id) -> (equity, ehs2)"""
+        if len(hole_ids) != 2 or len(flop_ids) != 3:
+            raise ValueError("홀카드 2장과 플랍 3장이 필요합니다.")
+        flop_number, perm = canonical_flop(flop_ids)
+        suit_map = _SUIT_MAPS[perm]
+        equity, ehs2 = self.data[flop_number, combo_index(suit_map[hole_ids[0]], suit_map[hole_ids[1]])]
+        return equity / QUANT_SCALE, ehs2 / QUANT_SCALE
+
+    def lookup(self, hole_cards: Sequence[Card], flop_cards: Sequence[Card]) -> Tuple[float, float]:
+        """lookup_ids의 Card 버전"""
+        return self.lookup_ids([card.id for card in hole_cards], [card.id for card in flop_cards])
+
+    def equity(self, hole_cards: Sequence[Card], flop_cards: Sequence[Card]) -> float:
+        """랜덤 상대 1명에 대한 플랍 승률"""
+        return self.lookup(hole_cards, flop_cards)[0]
+
+    def ehs2(self, hole_cards: Sequence[Card], flop_cards: Sequence[Card]) -> float:
+        """리버 핸드 강도 제곱의 기댓값 E[HS²]"""
+        return self.lookup(hole_cards, flop_cards)[1]
+
+
+_default_database: Optional[FlopEquityDatabase] = None
+
+
+def get_flop_database(build: bool = True) -> Optional[FlopEquityDatabase]:
+    """
+    기본 경로의 데이터베이스 (처음 호출 시 mmap으로 한 번 열기)
+
+    파일이 없으면 build=True일 때 build_flop_database로 만들어 캐시하고,
+    build=False면 None을 돌려줍니다 (응답 시간이 중요한 호출용).
+    """
+    global _default_database
+    if _default_database is None:
+        if build:
+            equity_tables.ensure_table(
+                DEFAULT_PATH, TABLE_KIND, lambda: (build_flop_database(verbose=True), 0)
+            )
+        if os.path.exists(DEFAULT_PATH):
+            _default_database = FlopEquityDatabase.load(DEFAULT_PATH)
+    return _default_database
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="플랍 승률 데이터베이스 생성")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    start = time.time()
+    result = build_flop_database(args.workers, verbose=True)
+    FlopEquityDatabase(result).save(args.output)
+    print(f"저장 완료: {args.output} ({time.time() - start:.1f}초)")
@@ -0,0 +1,89 @@
+"""
+프리플랍 핸드 클래스 (169개)
+홀카드 2장을 무늬 동형 기준의 169개 클래스(AA, AKs, AKo ...)로 묶는 인덱싱
+
+클래스 번호는 13 x 13 격자 위치입니다 (행/열 0 = ACE ... 12 = TWO).
+- 페어: 대각선 (r, r)
+- 수딧: 높은 랭크 행, 낮은 랭크 열 (대각선 위)
+- 오프수딧: 낮은 랭크 행, 높은 랭크 열 (대각선 아래)
+"""
+
+from itertools import combinations
+from typing import List, Sequence, Tuple
+
+from src.core.card import Card
+
+
+NUM_CLASSES = 169
+NUM_COMBOS = 1326
+
+# 홀카드 조합 번호 순서 (카드 id 오름차순 쌍, combinations(range(52), 2)와 같은 순서)
+ALL_COMBOS: List[Tuple[int, int]] = list(combinations(range(52), 2))
+
+# 클래스 이름에 쓰는 랭크 기호 (랭크 인덱스 TWO=0 ... ACE=12)
+RANK_SYMBOLS = "23456789TJQKA"
+
+
+def class_index_from_ranks(high: int, low: int, suited: bool) -> int:
+    """랭크 인덱스(TWO=0 ... ACE=12) 두 개와 수딧 여부로 클래스 번호를 계산합니다."""
+    if high < low:
+        high, low = low, high
+    row, col = 12 - high, 12 - low
+    if suited and high != low:
+        return row * 13 + col
+    return col * 13 + row
+
+
+def hand_class(first_id: int, second_id: int) -> int:
+    """홀카드 2장(카드 id)의 클래스 번호"""
+    return class_index_from_ranks(
+        first_id >> 2, second_id >> 2, (first_id & 3) == (second_id & 3)
+    )
+
+
+def hand_class_of_cards(hole_cards: Sequence[Card]) -> int:
+    """hand_class의 Card 버전"""
+    return hand_class(hole_cards[0].id, hole_cards[1].id)
+
+
+def class_ranks(index: int) -> Tuple[int, int, bool]:
+    """클래스 번호 -> (높은 랭크 인덱스, 낮은 랭크 인덱스, 수딧 여부)"""
+    row, col = divmod(index, 13)
+    if row < col:
+        return 12 - row, 12 - col, True
+    return 12 - col, 12 - row, False
+
+
+def class_name(index: int) -> str:
+    """클래스 번호 -> "AA", "AKs", "T9o" 형태의 이름"""
+    high, low, suited = class_ranks(index)
+    name = RANK_SYMBOLS[high] + RANK_SYMBOLS[low]
+    if high == low:
+        return name
+    return name + ("s" if suited else "o")
+
+
+def class_combos(index: int) -> List[Tuple[int, int]]:
+    """클래스에 속한 모든 홀카드 조합 (카드 id 쌍, 페어 6 / 수딧 4 / 오프수딧 12개)"""
+    high, low, suited = class_ranks(index)
+    combos = []
+    for first_suit in range(4):
+        for second_suit in range(4):
+            if high == low and second_suit <= first_suit:
+                continue
+            if high != low and (first_suit == second_suit) != suited:
+                continue
+            combos.append((high * 4 + first_suit, low * 4 + second_suit))
+    return combos
+
+
+def representative_combo(index: int) -> Tuple[int, int]:
+    """클래스를 대표하는 조합 하나 (랜덤 상대 상대 승률은 클래스 안에서 모두 같음)"""
+    return class_combos(index)[0]
+
+
+def combo_index(first_id: int, second_id: int) -> int:
+    """홀카드 2장(카드 id, 순서 무관)의 조합 번호 0~1325 (ALL_COMBOS의 위치)"""
+    if first_id > second_id:
+        first_id, second_id = second_id, first_id
+    return first_id * (101 - first_id) // 2 + second_id - 1
@@ -1,13 +1,13 @@
 """
 족보 판정 알고리즘 - 문현준 담당
-C(7,5) 조합을 통한 족보 판정
+룩업 테이블을 통한 족보 판정 (5장 단위 판정은 참조 구현으로 유지)
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from enum import Enum
-from itertools import combinations
 
 from src.core.card import Card, Rank
+from src.algorithms import lookup_evaluator
 
 
 class HandRank(Enum):
@@ -44,6 +44,7 @@ class HandEvaluator:
     def evaluate_hand(seven_cards: List[Card]) -> Tuple[HandRank, List[int], List[Card]]:
         """
         5장 이상 7장 이하의 카드 중 5장을 뽑아 만들 수 있는 최상의 조합을 찾습니다.
+        (룩업 테이블 백엔드 사용 - src/algorithms/lookup_evaluator.py)
         
         Returns:
             (HandRank, Kickers, BestHandCards)
@@ -54,27 +55,85 @@ class HandEvaluator:
         if len(seven_cards) < 5 or len(seven_cards) > 7:
             raise ValueError("5장 이상 7장 이하의 카드가 필요합니다.")
 
-        best_hand_rank = HandRank.HIGH_CARD
-        best_kickers = []
-        best_hand_cards = []
-        
-        # (족보 순위, 키커) 튜플 비교용
-        best_score_key = (-1, [])
+        score = lookup_evaluator.score_cards(seven_cards)
+        best_hand_rank, best_kickers = HandEvaluator.decode_score(score)
+        best_hand_cards = lookup_evaluator.best_five_cards(seven_cards, score)
 
-        for hand_combination in combinations(seven_cards, 5):
-            current_rank, kickers = HandEvaluator._evaluate_5_card_hand(list(hand_combination))
-            
-            # 비교: 족보 순위 우선, 그 다음 키커
-            current_score_key = (current_rank.value, kickers)
-
-            if current_score_key > best_score_key:
-                best_score_key = current_score_key
-                best_hand_rank = current_rank
-                best_kickers = kickers
-                best_hand_cards = list(hand_combination)
-        
         return best_hand_rank, best_kickers, best_hand_cards
 
+    @staticmethod
+    def rank_hand(cards: List[Card]) -> Tuple[HandRank, List[int]]:
+        """
+        족보와 키커만 평가합니다 (최상 5장 복원 생략).
+
+        evaluate_hand의 BestHandCards를 쓰지 않는 시뮬레이션/AI 경로용입니다.
+        최상 5장이 필요해지면 best_hand_cards()로 따로 계산합니다.
+        """
+        return HandEvaluator.decode_score(HandEvaluator.score(cards))
+
+    @staticmethod
+    def best_hand_cards(cards: List[Card], score: Optional[int] = None) -> List[Card]:
+        """
+        최상의 족보를 구성하는 5장을 계산합니다 (쇼다운 표시용).
+
+        Args:
+            cards: 5~7장의 카드
+            score: 이미 계산한 score(cards) 값 (없으면 새로 계산)
+        """
+        if score is None:
+            score = HandEvaluator.score(cards)
+        return lookup_evaluator.best_five_cards(cards, score)
+
+    @staticmethod
+    def score(cards: List[Card]) -> int:
+        """
+        5장 이상 7장 이하의 카드를 하나의 정수 점수로 평가합니다.
+
+        점수가 클수록 강한 패이며, 두 패의 점수 비교는
+        (HandRank.value, kickers) 튜플 비교와 같은 결과를 냅니다.
+        리스트를 만들지 않으므로 시뮬레이션 같은 반복 비교에 사용합니다.
+        """
+        if len(cards) < 5 or len(cards) > 7:
+            raise ValueError("5장 이상 7장 이하의 카드가 필요합니다.")
+        return lookup_evaluator.score_cards(cards)
+
+    @staticmethod
+    def score_ids(card_ids: List[int]) -> int:
+        """
+        score()의 정수 카드 id(0~51) 버전입니다.
+
+        Card 객체 없이 id만 다루는 시뮬레이션 엔진용이며, 장수 검사는 생략합니다.
+        """
+        return lookup_evaluator.score_ids(card_ids)
+
+    @staticmethod
+    def prepare_board(community_cards: List[Card]) -> lookup_evaluator.BoardState:
+        """
+        커뮤니티 카드(3~5장)를 한 번 분석해 재사용 가능한 보드 상태를 만듭니다.
+
+        쇼다운처럼 여러 플레이어가 같은 보드를 공유할 때,
+        board.score_cards(hole_cards)는 score(hole_cards + community_cards)와
+        같은 값을 보드 재분석 없이 돌려줍니다.
+        """
+        if len(community_cards) < 3 or len(community_cards) > 5:
+            raise ValueError("커뮤니티 카드는 3장 이상 5장 이하여야 합니다.")
+        return lookup_evaluator.BoardState([card.id for card in community_cards])
+
+    @staticmethod
+    def decode_score(score: int) -> Tuple[HandRank, List[int]]:
+        """
+        정수 점수를 (HandRank, Kickers)로 되돌립니다 (화면 표시용).
+        """
+        return (
+            HandRank(lookup_evaluator.score_category(score)),
+            lookup_evaluator.score_kickers(score),
+        )
+
+    @staticmethod
+    def encode_score(rank: HandRank, kickers: List[int]) -> int:
+        """(HandRank, Kickers)를 정수 점수로 묶습니다 (decode_score의 역변환)."""
+        return lookup_evaluator.make_score(rank.value, kickers)
+
     @staticmethod
     def _evaluate_5_card_hand(five_cards: List[Card]) -> Tuple[HandRank, List[int]]:
         """5장의 카드로 패를 평가합니다."""
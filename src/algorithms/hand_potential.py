@@ -0,0 +1,171 @@
+"""
+핸드 강도 / 포텐셜 엔진 - HS, PPot/NPot, EHS, EHS²
+
+Billings 등의 방식으로 랜덤 상대 1명을 기준으로 계산합니다.
+- HS (hand strength):   지금 보드에서 상대 조합 전체 대비 앞서는 비율 (무승부 0.5)
+- PPot / NPot:          지금 뒤지거나 비긴 핸드가 리버까지 역전할 확률 / 앞선 핸드가 역전당할 확률
+- EHS:                  HS + (1 - HS) x PPot - HS x NPot
+- EHS²:                 리버 HS 제곱의 기댓값 (드로우처럼 결과가 갈리는 핸드일수록 큼)
+- histogram:            리버 HS 분포 (10구간 비율)
+
+런아웃은 항상 전부 나열하고, 런아웃 수 x 상대 조합 수가 max_work를 넘으면
+포텐셜 계산에 쓸 상대 조합만 무작위로 줄입니다 (HS는 항상 전체 조합 기준).
+결과는 무늬 동형 정규 키로 캐시합니다.
+"""
+
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms.batch_evaluator import BoardBatch
+from src.algorithms.equity_cache import EquityCache, canonical_key
+from src.algorithms.hand_range import COMBO_CARDS
+from src.algorithms.range_equity import score_runouts
+
+
+AHEAD, TIED, BEHIND = 0, 1, 2
+HISTOGRAM_BINS = 10
+
+
+class HandStrength(NamedTuple):
+    """핸드 강도 계산 결과"""
+    hand_strength: float
+    ppot: float
+    npot: float
+    ehs: float
+    ehs2: float
+    histogram: np.ndarray
+
+
+def _outcomes(hero_scores: np.ndarray, villain_scores: np.ndarray) -> np.ndarray:
+    """점수 비교 -> AHEAD / TIED / BEHIND"""
+    return np.where(
+        hero_scores > villain_scores, AHEAD, np.where(hero_scores == villain_scores, TIED, BEHIND)
+    )
+
+
+class HandStrengthEngine:
+    """HS / 포텐셜 / EHS 계산 클래스"""
+
+    # 런아웃 수 x 상대 조합 수 상한 (턴은 전수, 플랍은 상대 조합 약 90개 표본)
+    MAX_WORK = 100000
+
+    def __init__(
+        self,
+        max_work: int = MAX_WORK,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+        cache: Optional[EquityCache] = None
+    ):
+        """
+        Args:
+            max_work: 한 번에 점수화할 (런아웃, 상대 조합) 칸 수 상한
+            rng: 상대 조합 표본에 쓸 NumPy 난수 생성기 또는 시드
+            cache: 결과 캐시 (기본값: 엔진 전용 캐시)
+        """
+        self.max_work = max_work
+        self.rng = np.random.default_rng(rng)
+        self.cache = cache if cache is not None else EquityCache(maxsize=4096)
+
+    def evaluate(self, hole_cards: Sequence[Card], community_cards: Sequence[Card]) -> HandStrength:
+        """홀카드 2장 + 보드 3~5장의 핸드 강도"""
+        return self.evaluate_ids(
+            [card.id for card in hole_cards], [card.id for card in community_cards]
+        )
+
+    def evaluate_ids(self, hole_ids: Sequence[int], board_ids: Sequence[int]) -> HandStrength:
+        """evaluate의 정수 카드 id 버전 (무늬만 다른 같은 스팟은 캐시에서 바로 반환)"""
+        if len(hole_ids) != 2 or not 3 <= len(board_ids) <= 5:
+            raise ValueError("홀카드 2장과 보드 3~5장이 필요합니다.")
+        if len(set(hole_ids) | set(board_ids)) != len(hole_ids) + len(board_ids):
+            raise ValueError("같은 카드가 두 번 쓰였습니다.")
+
+        key = ("strength",) + canonical_key(hole_ids, board_ids, 1)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._compute(list(hole_ids), list(board_ids))
+        self.cache.put(key, result)
+        return result
+
+    def _compute(self, hole_ids: list, board_ids: list) -> HandStrength:
+        dead = np.zeros(52, dtype=bool)
+        dead[hole_ids + board_ids] = True
+        villains = COMBO_CARDS[~dead[COMBO_CARDS].any(axis=1)]
+
+        # 지금 보드 기준 승/무/패
+        now = BoardBatch(np.array([board_ids]))
+        hero_now = now.score_hole(hole_ids[0], hole_ids[1])
+        villain_now = now.subset(np.zeros(len(villains), dtype=np.intp)).score_hole(
+            villains[:, 0], villains[:, 1]
+        )
+        current = _outcomes(hero_now, villain_now)
+        hand_strength = float(np.mean(np.where(current == AHEAD, 1.0, np.where(current == TIED, 0.5, 0.0))))
+
+        missing = 5 - len(board_ids)
+        if missing == 0:
+            histogram = np.histogram([hand_strength], bins=HISTOGRAM_BINS, range=(0.0, 1.0))[0].astype(float)
+            return HandStrength(hand_strength, 0.0, 0.0, hand_strength, hand_strength ** 2, histogram)
+
+        runouts = self._runouts(np.flatnonzero(~dead), missing)
+        sample = self._villain_sample(len(villains), len(runouts))
+        current = current[sample]
+        batch, villain_final, alive = score_runouts(board_ids, runouts, villains[sample])
+        hero_final = batch.score_hole(hole_ids[0], hole_ids[1])[:, None]
+        final = _outcomes(hero_final, villain_final)
+
+        # HP[지금 상태][리버 상태] (런아웃 카드와 겹치는 상대 조합은 제외)
+        transitions = np.bincount(
+            (current[None, :] * 3 + final)[alive], minlength=9
+        ).reshape(3, 3).astype(float)
+        totals = transitions.sum(axis=1)
+
+        ppot_base = totals[BEHIND] + totals[TIED] / 2
+        npot_base = totals[AHEAD] + totals[TIED] / 2
+        ppot = (
+            transitions[BEHIND, AHEAD] + transitions[BEHIND, TIED] / 2 + transitions[TIED, AHEAD] / 2
+        ) / ppot_base if ppot_base > 0 else 0.0
+        npot = (
+            transitions[AHEAD, BEHIND] + transitions[TIED, BEHIND] / 2 + transitions[AHEAD, TIED] / 2
+        ) / npot_base if npot_base > 0 else 0.0
+
+        river_hs = (
+            np.where(alive, np.where(final == AHEAD, 1.0, np.where(final == TIED, 0.5, 0.0)), 0.0).sum(axis=1)
+            / alive.sum(axis=1)
+        )
+        histogram = np.histogram(river_hs, bins=HISTOGRAM_BINS, range=(0.0, 1.0))[0] / len(river_hs)
+        ehs = hand_strength + (1 - hand_strength) * ppot - hand_strength * npot
+        return HandStrength(
+            hand_strength, float(ppot), float(npot), float(ehs), float(np.mean(river_hs ** 2)), histogram
+        )
+
+    @staticmethod
+    def _runouts(live_cards: np.ndarray, missing: int) -> np.ndarray:
+        """리버까지의 모든 런아웃 (R, missing)"""
+        if missing == 1:
+            return live_cards[:, None]
+        first, second = np.triu_indices(len(live_cards), k=1)
+        return np.stack([live_cards[first], live_cards[second]], axis=1)
+
+    def _villain_sample(self, num_villains: int, num_runouts: int) -> np.ndarray:
+        """
+        포텐셜 계산에 쓸 상대 조합 번호
+
+        런아웃을 뽑으면 드로우가 완성되는 카드에서 모든 상대 결과가 함께 바뀌어 분산이 크므로,
+        런아웃은 전부 나열하고 max_work를 넘는 만큼 상대 조합 쪽을 무작위로 줄입니다.
+        """
+        size = max(1, self.max_work // num_runouts)
+        if size >= num_villains:
+            return np.arange(num_villains)
+        return np.sort(self.rng.choice(num_villains, size=size, replace=False))
+
+
+_default_engine: Optional[HandStrengthEngine] = None
+
+
+def get_hand_strength_engine() -> HandStrengthEngine:
+    """AI들이 캐시를 공유하도록 프로세스당 하나 만드는 기본 엔진"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = HandStrengthEngine()
+    return _default_engine
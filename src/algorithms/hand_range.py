@@ -0,0 +1,183 @@
+"""
+핸드 레인지 - 1,326개 홀카드 조합마다 가중치(0~1)를 둔 벡터
+
+"QQ+,AKs,ATo+" 같은 표기를 파싱합니다.
+- 페어:       "QQ", "QQ+" (QQ~AA), "22-55"
+- 논페어:     "AKs", "AKo", "AK" (수딧+오프수딧), "ATo+" (ATo~AKo), "A2s-A5s"
+- 특정 조합:  "AsKs", "AhKd" (무늬 s/h/d/c)
+- 가중치:     "AKo:0.5" (해당 조합을 절반 비율로 포함)
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms.hand_classes import (
+    ALL_COMBOS,
+    NUM_COMBOS,
+    RANK_SYMBOLS,
+    class_combos,
+    class_index_from_ranks,
+    combo_index,
+)
+
+
+SUIT_SYMBOLS = "shdc"    # 무늬 인덱스 순서 (SPADES=0 ... CLUBS=3)
+
+# 조합 번호 -> 카드 id 2장
+COMBO_CARDS = np.array(ALL_COMBOS, dtype=np.intp)
+
+
+def _rank_index(symbol: str) -> int:
+    index = RANK_SYMBOLS.find(symbol.upper()) if len(symbol) == 1 else -1
+    if index < 0:
+        raise ValueError(f"알 수 없는 랭크입니다: {symbol!r}")
+    return index
+
+
+def _class_combo_indices(high: int, low: int, suited: bool) -> List[int]:
+    return [combo_index(*combo) for combo in class_combos(class_index_from_ranks(high, low, suited))]
+
+
+def _hand_combos(text: str) -> List[int]:
+    """ "AKs", "QQ", "AK", "AsKs" 하나 -> 조합 번호 목록"""
+    if len(text) == 4 and text[1].lower() in SUIT_SYMBOLS and text[3].lower() in SUIT_SYMBOLS:
+        first = _rank_index(text[0]) * 4 + SUIT_SYMBOLS.index(text[1].lower())
+        second = _rank_index(text[2]) * 4 + SUIT_SYMBOLS.index(text[3].lower())
+        if first == second:
+            raise ValueError(f"같은 카드가 두 번 쓰였습니다: {text!r}")
+        return [combo_index(first, second)]
+
+    if len(text) not in (2, 3):
+        raise ValueError(f"핸드 표기를 해석할 수 없습니다: {text!r}")
+    high, low = _rank_index(text[0]), _rank_index(text[1])
+    suffix = text[2].lower() if len(text) == 3 else ""
+    if suffix not in ("", "s", "o") or (high == low and suffix):
+        raise ValueError(f"핸드 표기를 해석할 수 없습니다: {text!r}")
+    if high == low:
+        return _class_combo_indices(high, low, False)
+    suited_options = {"s": [True], "o": [False], "": [True, False]}[suffix]
+    return [index for suited in suited_options for index in _class_combo_indices(high, low, suited)]
+
+
+def _token_combos(token: str) -> List[int]:
+    """쉼표로 나뉜 토큰 하나 ("QQ+", "A2s-A5s" 등) -> 조합 번호 목록"""
+    if token.endswith("+"):
+        base = token[:-1]
+        if len(base) not in (2, 3):
+            raise ValueError(f"'+' 표기를 해석할 수 없습니다: {token!r}")
+        high, low = _rank_index(base[0]), _rank_index(base[1])
+        suffix = base[2:]
+        if high == low:
+            # QQ+ -> QQ, KK, AA
+            return [
+                index for rank in range(high, 13)
+                for index in _hand_combos(RANK_SYMBOLS[rank] * 2)
+            ]
+        if low > high:
+            high, low = low, high
+        # ATo+ -> ATo, AJo, AQo, AKo (높은 카드 고정, 낮은 카드를 높은 카드 바로 아래까지)
+        return [
+            index for rank in range(low, high)
+            for index in _hand_combos(RANK_SYMBOLS[high] + RANK_SYMBOLS[rank] + suffix)
+        ]
+
+    if "-" in token:
+        start, end = token.split("-", 1)
+        if len(start) != len(end) or len(start) not in (2, 3) or start[2:] != end[2:]:
+            raise ValueError(f"'-' 범위 표기를 해석할 수 없습니다: {token!r}")
+        suffix = start[2:]
+        start_high, start_low = _rank_index(start[0]), _rank_index(start[1])
+        end_high, end_low = _rank_index(end[0]), _rank_index(end[1])
+        if start_high == start_low and end_high == end_low:
+            # 22-55
+            low, high = sorted((start_high, end_high))
+            return [
+                index for rank in range(low, high + 1)
+                for index in _hand_combos(RANK_SYMBOLS[rank] * 2)
+            ]
+        if start_high != end_high:
+            raise ValueError(f"범위의 높은 카드가 같아야 합니다: {token!r}")
+        # A2s-A5s
+        low, high = sorted((start_low, end_low))
+        return [
+            index for rank in range(low, high + 1)
+            for index in _hand_combos(start[0] + RANK_SYMBOLS[rank] + suffix)
+        ]
+
+    return _hand_combos(token)
+
+
+class HandRange:
+    """
+    홀카드 조합 1,326개에 대한 가중치 벡터
+
+    weights[i]는 ALL_COMBOS[i] 조합이 레인지에 포함되는 비율(0~1)입니다.
+    """
+
+    def __init__(self, weights: Optional[Sequence[float]] = None):
+        if weights is None:
+            weights = np.zeros(NUM_COMBOS)
+        weights = np.array(weights, dtype=np.float64)
+        if weights.shape != (NUM_COMBOS,):
+            raise ValueError(f"가중치는 {NUM_COMBOS}개여야 합니다.")
+        if np.any(weights < 0):
+            raise ValueError("가중치는 0 이상이어야 합니다.")
+        self.weights = weights
+
+    @classmethod
+    def parse(cls, text: str) -> "HandRange":
+        """ "QQ+,AKs,ATo+,A5s:0.5" 형태의 레인지 표기를 파싱합니다."""
+        weights = np.zeros(NUM_COMBOS)
+        for raw in text.replace(" ", "").split(","):
+            if not raw:
+                continue
+            token, _, weight_text = raw.partition(":")
+            weight = float(weight_text) if weight_text else 1.0
+            if not 0.0 <= weight <= 1.0:
+                raise ValueError(f"가중치는 0~1이어야 합니다: {raw!r}")
+            weights[_token_combos(token.replace("10", "T"))] = weight
+        return cls(weights)
+
+    @classmethod
+    def uniform(cls) -> "HandRange":
+        """모든 조합을 같은 비율로 포함하는 랜덤 핸드 레인지"""
+        return cls(np.ones(NUM_COMBOS))
+
+    @classmethod
+    def from_hand(cls, hole_cards: Sequence[Card]) -> "HandRange":
+        """홀카드 한 조합만 담은 레인지"""
+        weights = np.zeros(NUM_COMBOS)
+        weights[combo_index(hole_cards[0].id, hole_cards[1].id)] = 1.0
+        return cls(weights)
+
+    def __len__(self) -> int:
+        """가중치가 0보다 큰 조합 수"""
+        return int(np.count_nonzero(self.weights))
+
+    def __contains__(self, hole_cards) -> bool:
+        return self.weight(hole_cards) > 0
+
+    def weight(self, hole_cards: Sequence[Card]) -> float:
+        """홀카드 한 조합의 가중치"""
+        return float(self.weights[combo_index(hole_cards[0].id, hole_cards[1].id)])
+
+    @property
+    def total_weight(self) -> float:
+        """가중치 합 (가중 조합 수)"""
+        return float(self.weights.sum())
+
+    def combos(self) -> List[Tuple[int, int]]:
+        """가중치가 0보다 큰 조합 목록 (카드 id 쌍)"""
+        return [ALL_COMBOS[index] for index in np.flatnonzero(self.weights)]
+
+    def without(self, dead_ids: Iterable[int]) -> "HandRange":
+        """주어진 카드(보드, 내 홀카드 등)를 포함한 조합을 뺀 레인지 (카드 제거)"""
+        dead = np.zeros(52, dtype=bool)
+        dead[list(dead_ids)] = True
+        weights = np.where(dead[COMBO_CARDS].any(axis=1), 0.0, self.weights)
+        return HandRange(weights)
+
+    def __repr__(self) -> str:
+        return f"HandRange({len(self)} combos, weight={self.total_weight:g})"
@@ -0,0 +1,327 @@
+"""
+룩업 테이블 족보 판정 - 문현준 담당
+C(7,5) 조합 없이 미리 계산한 랭크/플러시 테이블로 5~7장을 바로 점수화
+
+점수(score) 형식:
+    족보 순위(HandRank.value) << 20 | 키커 5개를 4비트씩 이어 붙인 값
+    -> (HandRank.value, kickers) 튜플 비교와 정확히 같은 순서를 가지는 정수
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from src.core.card import Card
+
+
+# 카드 id(랭크 인덱스 * 4 + 무늬 인덱스) -> 테이블 키
+# 랭크 키: 랭크별 장수를 5진수 자리로 누적 (한 랭크 최대 4장)
+RANK_KEY: List[int] = [5 ** (card_id >> 2) for card_id in range(52)]
+# 무늬 키: 무늬별 장수를 8진수 자리로 누적 (최대 7장)
+SUIT_KEY: List[int] = [8 ** (card_id & 3) for card_id in range(52)]
+# 플러시 마스크용 랭크 비트
+RANK_BIT: List[int] = [1 << (card_id >> 2) for card_id in range(52)]
+
+CATEGORY_SHIFT = 20
+
+HIGH_CARD = 1
+ONE_PAIR = 2
+TWO_PAIR = 3
+THREE_OF_A_KIND = 4
+STRAIGHT = 5
+FLUSH = 6
+FULL_HOUSE = 7
+FOUR_OF_A_KIND = 8
+STRAIGHT_FLUSH = 9
+ROYAL_FLUSH = 10
+
+# 지연 생성 테이블 (첫 호출 시 한 번만 생성)
+_RANK_TABLE: Optional[Dict[int, int]] = None   # 랭크 키 -> 점수 (플러시 제외)
+_FLUSH_TABLE: Optional[List[int]] = None       # 13비트 랭크 마스크 -> 점수
+_FLUSH_SUIT: Optional[List[int]] = None        # 무늬 키 -> 플러시 무늬 인덱스 (-1: 없음)
+_STRAIGHT_HIGH: Optional[List[int]] = None     # 13비트 랭크 마스크 -> 스트레이트 최고 랭크 (0: 없음)
+_BOARD_FLUSH_SUIT: Optional[List[int]] = None  # 보드 무늬 키 -> 3장 이상인 무늬 인덱스 (-1: 없음)
+
+
+def make_score(category: int, kickers: Sequence[int]) -> int:
+    """족보 순위와 키커 5개를 하나의 정수 점수로 묶습니다."""
+    score = category
+    for kicker in kickers:
+        score = (score << 4) | kicker
+    return score
+
+
+def score_category(score: int) -> int:
+    """점수에서 족보 순위(HandRank.value)를 꺼냅니다."""
+    return score >> CATEGORY_SHIFT
+
+
+def score_kickers(score: int) -> List[int]:
+    """점수에서 키커 5개를 꺼냅니다 (높은 자리 우선)."""
+    return [(score >> shift) & 0xF for shift in (16, 12, 8, 4, 0)]
+
+
+def _straight_high(mask: int) -> int:
+    """13비트 랭크 마스크에서 가장 높은 스트레이트의 최고 랭크 (휠은 5)"""
+    for top in range(12, 3, -1):
+        window = 0b11111 << (top - 4)
+        if mask & window == window:
+            return top + 2
+    # A-2-3-4-5 (Wheel)
+    wheel = (1 << 12) | 0b1111
+    if mask & wheel == wheel:
+        return 5
+    return 0
+
+
+def _straight_kickers(high: int) -> List[int]:
+    if high == 5:
+        return [5, 4, 3, 2, 1]  # Wheel에서 Ace는 1로 취급
+    return [high - i for i in range(5)]
+
+
+def _score_rank_counts(counts: Sequence[int], straight_high: int) -> int:
+    """
+    랭크별 장수(플러시 없음)만으로 최상의 5장 점수를 계산합니다.
+
+    counts[i]는 랭크 인덱스 i(TWO=0)의 장수입니다.
+    """
+    present = [i + 2 for i in range(12, -1, -1) if counts[i]]
+    quads = [r for r in present if counts[r - 2] == 4]
+    trips = [r for r in present if counts[r - 2] == 3]
+    pairs = [r for r in present if counts[r - 2] == 2]
+
+    if quads:
+        quad = quads[0]
+        kicker = next(r for r in present if r != quad)
+        return make_score(FOUR_OF_A_KIND, [quad] * 4 + [kicker])
+    if trips and (len(trips) > 1 or pairs):
+        trip = trips[0]
+        pair = max(trips[1:] + pairs)
+        return make_score(FULL_HOUSE, [trip] * 3 + [pair] * 2)
+    if straight_high:
+        return make_score(STRAIGHT, _straight_kickers(straight_high))
+    if trips:
+        trip = trips[0]
+        others = [r for r in present if r != trip][:2]
+        return make_score(THREE_OF_A_KIND, [trip] * 3 + others)
+    if len(pairs) >= 2:
+        high_pair, low_pair = pairs[0], pairs[1]
+        kicker = next(r for r in present if r != high_pair and r != low_pair)
+        return make_score(TWO_PAIR, [high_pair] * 2 + [low_pair] * 2 + [kicker])
+    if pairs:
+        pair = pairs[0]
+        others = [r for r in present if r != pair][:3]
+        return make_score(ONE_PAIR, [pair] * 2 + others)
+    return make_score(HIGH_CARD, present[:5])
+
+
+def _score_flush_mask(mask: int, straight_high: int) -> int:
+    """한 무늬 5장 이상의 랭크 마스크로 플러시 계열 점수를 계산합니다."""
+    if straight_high == 14:
+        return make_score(ROYAL_FLUSH, _straight_kickers(14))
+    if straight_high:
+        return make_score(STRAIGHT_FLUSH, _straight_kickers(straight_high))
+    ranks = [i + 2 for i in range(12, -1, -1) if mask & (1 << i)]
+    return make_score(FLUSH, ranks[:5])
+
+
+def _rank_count_vectors(num_cards: int):
+    """장수 합이 num_cards인 모든 랭크별 장수 벡터 (랭크당 최대 4장)"""
+    counts = [0] * 13
+
+    def fill(index: int, remaining: int):
+        if index == 13:
+            if remaining == 0:
+                yield counts
+            return
+        for count in range(min(4, remaining) + 1):
+            counts[index] = count
+            yield from fill(index + 1, remaining - count)
+        counts[index] = 0
+
+    yield from fill(0, num_cards)
+
+
+def _build_tables() -> None:
+    global _RANK_TABLE, _FLUSH_TABLE, _FLUSH_SUIT, _STRAIGHT_HIGH, _BOARD_FLUSH_SUIT
+
+    straight_high = [_straight_high(mask) for mask in range(1 << 13)]
+
+    flush_table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if bin(mask).count("1") >= 5:
+            flush_table[mask] = _score_flush_mask(mask, straight_high[mask])
+
+    flush_suit = [-1] * (8 ** 4)
+    board_flush_suit = [-1] * (8 ** 4)
+    for key in range(8 ** 4):
+        for suit in range(4):
+            if (key >> (3 * suit)) & 7 >= 5:
+                flush_suit[key] = suit
+            if (key >> (3 * suit)) & 7 >= 3:
+                board_flush_suit[key] = suit
+
+    rank_table: Dict[int, int] = {}
+    for num_cards in (5, 6, 7):
+        for counts in _rank_count_vectors(num_cards):
+            key = 0
+            mask = 0
+            for i in range(13):
+                if counts[i]:
+                    key += counts[i] * 5 ** i
+                    mask |= 1 << i
+            rank_table[key] = _score_rank_counts(counts, straight_high[mask])
+
+    _STRAIGHT_HIGH = straight_high
+    _FLUSH_TABLE = flush_table
+    _FLUSH_SUIT = flush_suit
+    _BOARD_FLUSH_SUIT = board_flush_suit
+    _RANK_TABLE = rank_table
+
+
+def ensure_tables() -> None:
+    """룩업 테이블이 아직 없으면 생성합니다 (프로세스당 한 번)."""
+    if _RANK_TABLE is None:
+        _build_tables()
+
+
+def get_tables():
+    """
+    (랭크 키 -> 점수 dict, 랭크 마스크 -> 플러시 점수, 무늬 키 -> 플러시 무늬) 테이블 반환
+
+    NumPy 배치 판정처럼 같은 테이블을 다른 형태로 옮겨 쓰는 모듈용입니다.
+    """
+    ensure_tables()
+    return _RANK_TABLE, _FLUSH_TABLE, _FLUSH_SUIT
+
+
+def get_board_flush_suit_table() -> List[int]:
+    """보드 무늬 키 -> 3장 이상인 무늬 인덱스 (-1: 없음) 테이블 (BoardState의 배열 버전용)"""
+    ensure_tables()
+    return _BOARD_FLUSH_SUIT
+
+
+def score_ids(card_ids: Sequence[int]) -> int:
+    """
+    5~7장의 카드 id를 하나의 정수 점수로 평가합니다.
+
+    Returns:
+        (HandRank.value, kickers) 순서를 보존하는 정수 점수
+    """
+    if _RANK_TABLE is None:
+        _build_tables()
+
+    rank_key = 0
+    suit_key = 0
+    for card_id in card_ids:
+        rank_key += RANK_KEY[card_id]
+        suit_key += SUIT_KEY[card_id]
+
+    flush_suit = _FLUSH_SUIT[suit_key]
+    if flush_suit < 0:
+        return _RANK_TABLE[rank_key]
+
+    # 7장 안에서 플러시가 있으면 포카드/풀하우스는 불가능하므로 플러시 테이블만 보면 됨
+    mask = 0
+    for card_id in card_ids:
+        if card_id & 3 == flush_suit:
+            mask |= RANK_BIT[card_id]
+    return _FLUSH_TABLE[mask]
+
+
+def score_cards(cards: Sequence[Card]) -> int:
+    """5~7장의 Card를 하나의 정수 점수로 평가합니다 (score_ids의 Card 버전)."""
+    return score_ids([card.id for card in cards])
+
+
+class BoardState:
+    """
+    한 번 분석해 둔 커뮤니티 카드(3~5장) 상태
+
+    여러 플레이어가 같은 보드를 공유하는 쇼다운에서 보드 분석을 한 번만 하고,
+    각 홀카드 2장은 키 두 개를 더해 테이블을 한 번 찾는 것으로 점수화합니다.
+    - rank_key: 보드의 랭크별 장수 (5진수 랭크 키, 스트레이트는 테이블이 판정)
+    - flush_suit: 홀카드 2장으로 플러시가 될 수 있는 무늬 (보드에 3장 이상, 없으면 -1)
+    - flush_mask / flush_count: 그 무늬의 보드 랭크 마스크와 장수
+    """
+
+    __slots__ = ("rank_key", "flush_suit", "flush_mask", "flush_count")
+
+    def __init__(self, board_ids: Sequence[int]):
+        if _RANK_TABLE is None:
+            _build_tables()
+
+        rank_key = 0
+        suit_key = 0
+        for card_id in board_ids:
+            rank_key += RANK_KEY[card_id]
+            suit_key += SUIT_KEY[card_id]
+        self.rank_key = rank_key
+
+        # 보드 5장 이하에서 3장 이상인 무늬는 최대 하나뿐
+        flush_suit = _BOARD_FLUSH_SUIT[suit_key]
+        self.flush_suit = flush_suit
+        mask = 0
+        if flush_suit >= 0:
+            for card_id in board_ids:
+                if card_id & 3 == flush_suit:
+                    mask |= RANK_BIT[card_id]
+        self.flush_mask = mask
+        self.flush_count = (suit_key >> (3 * flush_suit)) & 7 if flush_suit >= 0 else 0
+
+    @property
+    def suit_masks(self) -> List[int]:
+        """무늬별 보드 랭크 마스크 (플러시 후보 무늬만 값이 있음)"""
+        masks = [0, 0, 0, 0]
+        if self.flush_suit >= 0:
+            masks[self.flush_suit] = self.flush_mask
+        return masks
+
+    def score_hole(self, first_id: int, second_id: int) -> int:
+        """홀카드 2장(id)과 보드를 합친 최상의 점수 (score_ids와 같은 값)"""
+        flush_suit = self.flush_suit
+        if flush_suit >= 0:
+            mask = self.flush_mask
+            count = self.flush_count
+            if first_id & 3 == flush_suit:
+                mask |= RANK_BIT[first_id]
+                count += 1
+            if second_id & 3 == flush_suit:
+                mask |= RANK_BIT[second_id]
+                count += 1
+            if count >= 5:
+                return _FLUSH_TABLE[mask]
+        return _RANK_TABLE[self.rank_key + RANK_KEY[first_id] + RANK_KEY[second_id]]
+
+    def score_cards(self, hole_cards: Sequence[Card]) -> int:
+        """score_hole의 Card 버전"""
+        return self.score_hole(hole_cards[0].id, hole_cards[1].id)
+
+
+def best_five_cards(cards: Sequence[Card], score: int) -> List[Card]:
+    """
+    점수를 만드는 5장을 원래 카드 목록에서 복원합니다.
+
+    같은 점수를 만드는 조합이 여럿이면 입력 순서상 가장 앞선 카드를 고르므로,
+    C(7,5) 조합을 순서대로 돌며 처음 찾은 최상 조합과 같은 결과가 됩니다.
+    """
+    category = score_category(score)
+    kickers = [14 if k == 1 else k for k in score_kickers(score)]
+
+    flush_suit = -1
+    if category in (FLUSH, STRAIGHT_FLUSH, ROYAL_FLUSH):
+        suit_counts = [0] * 4
+        for card in cards:
+            suit_counts[card.suit_index] += 1
+        flush_suit = suit_counts.index(max(suit_counts))
+
+    used = [False] * len(cards)
+    for kicker in kickers:
+        for i, card in enumerate(cards):
+            if used[i] or card.rank_index != kicker - 2:
+                continue
+            if flush_suit >= 0 and card.suit_index != flush_suit:
+                continue
+            used[i] = True
+            break
+
+    return [card for i, card in enumerate(cards) if used[i]]
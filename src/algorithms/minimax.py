@@ -2,7 +2,6 @@
 미니맥스 알고리즘 - 박우현 담당
 게임 트리 탐색 및 α-β 가지치기
 """
-import copy
 from typing import List, Tuple, Optional
 from enum import Enum
 
@@ -170,7 +169,7 @@ class MinimaxAI:
         # src.core.player에 get_hand_strength 메서드가 있다고 가정
         # 없다면 외부 Evaluator 사용 필요
         try:
-            hand_strength = ai_player.get_hand_strength() 
+            hand_strength = ai_player.get_hand_strength(node.community_cards)
         except AttributeError:
             # Mock 로직
             hand_strength = 0.5 
@@ -269,8 +268,7 @@ class MinimaxAI:
                 raise_node.pot += needed_chips
                 raise_node.current_bet = player_in_node.current_bet # 최고 베팅액 갱신
                 
-                action_type = Action.RAISE if node.current_bet > 0 else Action.BET
-                raise_node.action_taken = action_type
+                raise_node.action_taken = Action.RAISE  # Action에 BET이 없으므로 오픈 베팅도 RAISE
                 raise_node.bet_amount = needed_chips
                 children.append(raise_node)
 
@@ -296,11 +294,10 @@ class MinimaxAI:
         return children
 
     def _create_next_node(self, current_node: GameNode, next_idx: int) -> GameNode:
-        """현재 노드를 깊은 복사하여 다음 상태의 기본 노드를 반환"""
-        # copy.deepcopy는 느릴 수 있으므로, 실제 구현 시에는 
-        # 필요한 정보만 복사하는 custom copy를 구현하는 것이 성능에 좋음
-        # 여기서는 안전성을 위해 deepcopy 사용
-        new_players = copy.deepcopy(current_node.players)
+        """현재 노드를 복사하여 다음 상태의 기본 노드를 반환"""
+        # 자식 노드가 바꾸는 건 플레이어의 칩/베팅/플래그뿐이므로 Player.copy로 충분
+        # (카드 객체는 불변이라 공유하므로 deepcopy보다 훨씬 빠름)
+        new_players = [player.copy() for player in current_node.players]
         
         return GameNode(
             players=new_players,
@@ -1,33 +1,480 @@
+import atexit
+import os
 import random
-from typing import List, Tuple
-from concurrent.futures import ThreadPoolExecutor
-from src.core.card import Card, Deck, Suit, Rank 
+import time
+from itertools import combinations
+from math import comb, factorial, sqrt
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from src.core.card import Card, Suit, Rank, cards_to_ids
 from src.algorithms.hand_evaluator import HandEvaluator
+from src.algorithms import lookup_evaluator
+from src.algorithms.lookup_evaluator import BoardState
+from src.algorithms.equity_cache import EquityCache, canonical_key
+
+
+BACKENDS = ("thread", "process")
+
+# parallel_simulation의 기본 백엔드 (set_default_backend로 변경)
+_default_backend = "thread"
+
+# 프로세스 백엔드는 호출마다 풀을 만들지 않고 한 번 만든 풀을 재사용
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_size = 0
+
+# 신뢰구간 폭을 표준오차로 바꿀 때 쓰는 z 값 (95%)
+Z_95 = 1.96
+
+# 워커 하나에 넘기는 작업 묶음 수 (워커당 여러 묶음으로 나눠 부하를 고르게 분산)
+CHUNKS_PER_WORKER = 4
+
+
+class EquityEstimate(NamedTuple):
+    """승률 추정 결과 (전수 조사면 std_error=0.0, trials=0)"""
+    equity: float
+    std_error: float
+    trials: int
+
+
+def target_std_error(
+    target_stderr: Optional[float] = None,
+    ci_half_width: Optional[float] = None
+) -> float:
+    """목표 표준오차 또는 95% 신뢰구간 반폭 중 하나를 표준오차로 바꿉니다."""
+    if (target_stderr is None) == (ci_half_width is None):
+        raise ValueError("target_stderr와 ci_half_width 중 하나만 지정해야 합니다.")
+    target = target_stderr if target_stderr is not None else ci_half_width / Z_95
+    if target <= 0:
+        raise ValueError("목표 오차는 0보다 커야 합니다.")
+    return target
+
+
+def run_until_precise(
+    run_batch: Callable[[int], Tuple[float, float]],
+    target_stderr: float,
+    max_trials: Optional[int],
+    batch_size: int,
+    min_trials: int,
+    deadline: Optional[float] = None
+) -> EquityEstimate:
+    """
+    목표 표준오차에 도달하거나 max_trials를 다 쓸 때까지 배치 단위로 시행합니다.
+
+    run_batch(count)는 count번 시행한 점수의 (합, 제곱합)을 돌려줍니다.
+    시행 점수가 1.0/0.5/0.0이므로 표본분산으로 표준오차를 계산합니다.
+    deadline(time.perf_counter() 기준 시각)이 주어지면 배치 사이에 시간을 확인해
+    지나는 즉시 지금까지의 추정값을 돌려줍니다 (최소 한 배치는 실행).
+    max_trials=None은 deadline이나 목표 오차로만 멈춘다는 뜻입니다.
+    """
+    total = 0.0
+    total_sq = 0.0
+    trials = 0
+    std_error = float("inf")
+    while max_trials is None or trials < max_trials:
+        count = batch_size if max_trials is None else min(batch_size, max_trials - trials)
+        batch_total, batch_sq = run_batch(count)
+        total += batch_total
+        total_sq += batch_sq
+        trials += count
+
+        if trials > 1:
+            mean = total / trials
+            variance = max(total_sq / trials - mean * mean, 0.0) * trials / (trials - 1)
+            std_error = sqrt(variance / trials)
+        if trials >= min_trials and std_error <= target_stderr:
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+    return EquityEstimate(total / trials, std_error, trials)
+
+
+def set_default_backend(backend: str) -> None:
+    """
+    parallel_simulation의 기본 백엔드를 전역으로 설정합니다.
+
+    - "thread": 스레드 풀 (기존 동작, 웹 서버처럼 프로세스를 띄우기 곤란한 곳용)
+    - "process": 재사용되는 프로세스 풀 (GIL 없이 코어 수만큼 확장, 오프라인 시뮬레이션용)
+    """
+    global _default_backend
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 백엔드입니다: {backend}")
+    _default_backend = backend
+
+
+def get_default_backend() -> str:
+    """현재 parallel_simulation 기본 백엔드"""
+    return _default_backend
+
+
+def _init_worker() -> None:
+    """프로세스 워커 초기화: 룩업 테이블을 워커당 한 번만 생성"""
+    lookup_evaluator.ensure_tables()
+
+
+def _get_process_pool(num_workers: int) -> ProcessPoolExecutor:
+    """워커 수가 같으면 기존 프로세스 풀을 재사용하고, 다르면 새로 만듭니다."""
+    global _process_pool, _process_pool_size
+    if _process_pool is None or _process_pool_size != num_workers:
+        shutdown_process_pool()
+        _process_pool = ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker)
+        _process_pool_size = num_workers
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """재사용 중인 프로세스 풀을 닫습니다 (다음 호출 시 다시 생성)."""
+    global _process_pool, _process_pool_size
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+        _process_pool_size = 0
+
+
+atexit.register(shutdown_process_pool)
+
+
+def _count_disjoint_pairs(pairs: List[Tuple[int, int]], k: int) -> int:
+    """카드 쌍 목록에서 서로 카드가 겹치지 않는 k개 쌍 조합의 수"""
+    if k == 0:
+        return 1
+    if k == 1:
+        return len(pairs)
+    if k == 2:
+        # 전체 2쌍 조합 - 카드 하나를 공유하는 2쌍 조합 (두 쌍은 최대 한 장만 공유)
+        degree: Dict[int, int] = {}
+        for a, b in pairs:
+            degree[a] = degree.get(a, 0) + 1
+            degree[b] = degree.get(b, 0) + 1
+        return comb(len(pairs), 2) - sum(comb(d, 2) for d in degree.values())
+    count = 0
+    for i, (a, b) in enumerate(pairs):
+        rest = [pair for pair in pairs[i + 1:] if a not in pair and b not in pair]
+        count += _count_disjoint_pairs(rest, k - 1)
+    return count
+
+
+def _count_holdings(num_cards: int, k: int) -> int:
+    """num_cards장에서 상대 k명에게 홀카드 2장씩 나눠주는 경우의 수 (상대 순서 무시)"""
+    count = 1
+    for i in range(k):
+        count *= comb(num_cards - 2 * i, 2)
+    return count // factorial(k)
+
+
+def _run_chunk(
+    hole_ids: List[int],
+    board_ids: List[int],
+    remaining_ids: List[int],
+    num_opponents: int,
+    num_sims: int,
+    seed: int
+) -> float:
+    """
+    프로세스 워커에서 실행되는 시뮬레이션 묶음
+
+    묶음마다 부모가 뽑아 준 시드로 독립된 난수 생성기를 써서,
+    워커끼리 같은 난수열을 공유하지 않습니다.
+    """
+    sample = random.Random(seed).sample
+    local_score = 0.0
+    for _ in range(num_sims):
+        local_score += MonteCarloSimulator._simulate_ids(
+            hole_ids, board_ids, remaining_ids, num_opponents, sample
+        )
+    return local_score
+
 
 class MonteCarloSimulator:
     """몬테카를로 시뮬레이션 클래스"""
 
-    def __init__(self, num_simulations: int = 1000):
+    # exact=None일 때 전수 조사로 자동 전환하는 최대 판정 횟수
+    # (헤즈업 턴 44 x 946, 리버 990 정도가 여기에 들어옴)
+    EXACT_AUTO_LIMIT = 50000
+    # exact=True여도 허용하는 최대 판정 횟수 (플랍 1,081 x 990 정도까지)
+    EXACT_MAX_WORK = 1200000
+
+    def __init__(self, num_simulations: int = 1000, cache: Optional[EquityCache] = None):
+        """
+        Args:
+            num_simulations: 스팟당 시행 횟수
+            cache: 무늬 동형 스팟의 결과를 재사용하는 LRU 캐시 (없으면 매번 계산)
+        """
         self.num_simulations = num_simulations
         self.evaluator = HandEvaluator()
+        self.cache = cache
 
     def calculate_win_probability(
         self,
         hole_cards: List[Card],
         community_cards: List[Card],
-        num_opponents: int = 1
+        num_opponents: int = 1,
+        exact: Optional[bool] = None
     ) -> float:
         """
         승률 계산 (단일 스레드)
+
+        Args:
+            exact: True면 모든 런아웃과 상대 홀카드를 전수 조사 (분산 0),
+                   False면 항상 샘플링, None이면 전수 조사가 충분히 작을 때 자동 전환
         반환값: 0.0 ~ 1.0 사이의 승률
         """
+        hole_ids, board_ids, remaining_ids = self._split_ids(hole_cards, community_cards)
+        key = self._cache_key(hole_ids, board_ids, num_opponents, "fixed", self.num_simulations, exact)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        if self._use_exact(exact, board_ids, remaining_ids, num_opponents):
+            return self._cache_put(key, self._exact_ids(hole_ids, board_ids, remaining_ids, num_opponents))
+
         total_score = 0.0
-        
         for _ in range(self.num_simulations):
             # 1.0(승), 0.5(무), 0.0(패) 점수를 바로 누적합니다.
-            total_score += self._simulate_hand(hole_cards, community_cards, num_opponents)
+            total_score += self._simulate_ids(hole_ids, board_ids, remaining_ids, num_opponents)
         
-        return total_score / self.num_simulations
+        return self._cache_put(key, total_score / self.num_simulations)
+
+    def estimate_equity(
+        self,
+        hole_cards: List[Card],
+        community_cards: List[Card],
+        num_opponents: int = 1,
+        target_stderr: Optional[float] = None,
+        ci_half_width: Optional[float] = None,
+        max_trials: Optional[int] = None,
+        batch_size: int = 250,
+        exact: Optional[bool] = None
+    ) -> EquityEstimate:
+        """
+        목표 정확도에 도달하면 멈추는 적응형 승률 계산
+
+        승부가 뻔한 스팟(95%, 5% 등)은 분산이 작아 적은 시행으로 끝나고,
+        팽팽한 스팟만 max_trials까지 시행합니다.
+
+        Args:
+            target_stderr: 목표 표준오차 (예: 0.005 = ±0.5%p)
+            ci_half_width: 목표 95% 신뢰구간 반폭 (target_stderr 대신 사용)
+            max_trials: 최대 시행 횟수 (기본값: num_simulations)
+            batch_size: 정지 조건을 확인하는 시행 단위
+            exact: calculate_win_probability와 같음 (전수 조사면 오차 0)
+
+        Returns:
+            EquityEstimate(equity, std_error, trials)
+        """
+        target = target_std_error(target_stderr, ci_half_width)
+        hole_ids, board_ids, remaining_ids = self._split_ids(hole_cards, community_cards)
+        key = self._cache_key(
+            hole_ids, board_ids, num_opponents, "adaptive", target, max_trials or self.num_simulations, exact
+        )
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        if self._use_exact(exact, board_ids, remaining_ids, num_opponents):
+            return self._cache_put(key, EquityEstimate(
+                self._exact_ids(hole_ids, board_ids, remaining_ids, num_opponents), 0.0, 0
+            ))
+
+        run_batch = self._batch_runner(hole_ids, board_ids, remaining_ids, num_opponents)
+        return self._cache_put(key, run_until_precise(
+            run_batch,
+            target,
+            max_trials or self.num_simulations,
+            batch_size,
+            min_trials=2 * batch_size
+        ))
+
+    def equity_within(
+        self,
+        hole_cards: List[Card],
+        community_cards: List[Card],
+        num_opponents: int = 1,
+        deadline_ms: float = 50.0,
+        target_stderr: Optional[float] = None,
+        batch_size: int = 100,
+        exact: Optional[bool] = None
+    ) -> EquityEstimate:
+        """
+        주어진 시간 안에서 가능한 만큼 시행하고 그때까지의 추정값을 돌려줍니다.
+
+        웹 화면/AI처럼 응답 시간이 중요한 호출용입니다. 지연 시간은 시행 횟수가 아니라
+        deadline_ms(+ 배치 하나 정도)로 정해집니다.
+
+        Args:
+            deadline_ms: 시간 예산 (밀리초)
+            target_stderr: 이 오차에 먼저 도달하면 시간이 남아도 종료 (기본값: 시간까지 계속)
+            batch_size: 시간을 확인하는 시행 단위
+            exact: calculate_win_probability와 같음 (자동 전환되는 전수 조사는 리버 1ms, 턴 수십 ms)
+
+        Returns:
+            EquityEstimate(equity, std_error, trials)
+
+        캐시가 있으면 스팟당 시행 횟수가 가장 많은 추정값 하나를 보관하고,
+        전수 조사 결과이거나 target_stderr를 이미 만족할 때만 다시 계산 없이 돌려줍니다.
+        """
+        deadline = time.perf_counter() + deadline_ms / 1000.0
+        hole_ids, board_ids, remaining_ids = self._split_ids(hole_cards, community_cards)
+        key = self._cache_key(hole_ids, board_ids, num_opponents, "within", exact)
+        cached = self._cache_get(key)
+        if cached is not None and (
+            cached.trials == 0 or (target_stderr is not None and cached.std_error <= target_stderr)
+        ):
+            return cached
+
+        if self._use_exact(exact, board_ids, remaining_ids, num_opponents):
+            return self._cache_put(key, EquityEstimate(
+                self._exact_ids(hole_ids, board_ids, remaining_ids, num_opponents), 0.0, 0
+            ))
+
+        run_batch = self._batch_runner(hole_ids, board_ids, remaining_ids, num_opponents)
+        estimate = run_until_precise(
+            run_batch,
+            float("-inf") if target_stderr is None else target_stderr,  # 분산 0인 배치에서도 멈추지 않음
+            None,
+            batch_size,
+            min_trials=batch_size,
+            deadline=deadline
+        )
+        # 이전 예산이 더 길었으면 그쪽 추정값이 더 정확하므로 그대로 유지
+        if cached is not None and cached.trials > estimate.trials:
+            return cached
+        return self._cache_put(key, estimate)
+
+    def _cache_key(
+        self,
+        hole_ids: List[int],
+        board_ids: List[int],
+        num_opponents: int,
+        *params
+    ) -> Optional[tuple]:
+        """캐시 키: 무늬 동형 정규 스팟 + 계산 방식/정확도 인자 (캐시가 없으면 None)"""
+        if self.cache is None:
+            return None
+        return canonical_key(hole_ids, board_ids, num_opponents) + params
+
+    def _cache_get(self, key: Optional[tuple]):
+        if key is None:
+            return None
+        return self.cache.get(key)
+
+    def _cache_put(self, key: Optional[tuple], value):
+        if key is not None:
+            self.cache.put(key, value)
+        return value
+
+    def _batch_runner(
+        self,
+        hole_ids: List[int],
+        board_ids: List[int],
+        remaining_ids: List[int],
+        num_opponents: int
+    ) -> Callable[[int], Tuple[float, float]]:
+        """run_until_precise용 배치 함수: count번 시행한 점수의 (합, 제곱합)"""
+        simulate = self._simulate_ids
+
+        def run_batch(count: int) -> Tuple[float, float]:
+            batch_total = 0.0
+            batch_sq = 0.0
+            for _ in range(count):
+                score = simulate(hole_ids, board_ids, remaining_ids, num_opponents)
+                batch_total += score
+                batch_sq += score * score
+            return batch_total, batch_sq
+
+        return run_batch
+
+    @staticmethod
+    def _split_ids(
+        hole_cards: List[Card],
+        community_cards: List[Card]
+    ) -> Tuple[List[int], List[int], List[int]]:
+        """카드를 정수 id로 바꾸고, 이미 나와있는 카드를 뺀 남은 덱 id 목록을 만듭니다."""
+        hole_ids = cards_to_ids(hole_cards)
+        board_ids = cards_to_ids(community_cards)
+        known_ids = set(hole_ids + board_ids)
+        remaining_ids = [card_id for card_id in range(52) if card_id not in known_ids]
+        return hole_ids, board_ids, remaining_ids
+
+    def _exact_work(
+        self,
+        board_ids: List[int],
+        remaining_ids: List[int],
+        num_opponents: int
+    ) -> int:
+        """
+        전수 조사에 필요한 판정 횟수
+
+        런아웃 수 x 런아웃당 상대 홀카드 후보 수에, 상대가 3명 이상이면
+        쌍 조합 세기가 재귀로 훑는 나머지 (상대 수 - 2)명 배정 수를 곱합니다.
+        """
+        missing_count = 5 - len(board_ids)
+        runouts = comb(len(remaining_ids), missing_count)
+        num_cards = len(remaining_ids) - missing_count
+        return runouts * comb(num_cards, 2) * _count_holdings(num_cards, max(num_opponents - 2, 0))
+
+    def _use_exact(
+        self,
+        exact: Optional[bool],
+        board_ids: List[int],
+        remaining_ids: List[int],
+        num_opponents: int
+    ) -> bool:
+        """전수 조사 여부 결정 (exact=True인데 너무 크면 ValueError)"""
+        if exact is False:
+            return False
+        work = self._exact_work(board_ids, remaining_ids, num_opponents)
+        if exact:
+            if work > self.EXACT_MAX_WORK:
+                raise ValueError(f"전수 조사 범위가 너무 큽니다 (판정 {work}회, 상대 {num_opponents}명).")
+            return True
+        return num_opponents <= 2 and work <= self.EXACT_AUTO_LIMIT
+
+    def _exact_ids(
+        self,
+        hole_ids: List[int],
+        board_ids: List[int],
+        remaining_ids: List[int],
+        num_opponents: int
+    ) -> float:
+        """
+        모든 런아웃과 상대 홀카드 조합을 전수 조사한 정확한 승률
+
+        런아웃마다 보드를 한 번 분석하고 남은 카드의 모든 2장 조합을 점수화한 뒤,
+        나보다 약한 쌍 / 같은 쌍만으로 만들 수 있는 상대 k명 조합 수를 세어
+        승(전원이 약함)과 무(전원이 같거나 약함 - 승)를 계산합니다.
+        런아웃마다 상대 조합의 총수가 같으므로 런아웃별 승률의 평균이 전체 승률입니다.
+        """
+        missing_count = 5 - len(board_ids)
+        num_opponents = min(num_opponents, (len(remaining_ids) - missing_count) // 2)
+        if num_opponents == 0:
+            return 1.0
+        holdings = _count_holdings(len(remaining_ids) - missing_count, num_opponents)
+
+        total_score = 0.0
+        num_runouts = 0
+        for runout in combinations(remaining_ids, missing_count):
+            board = BoardState(board_ids + list(runout))
+            score_hole = board.score_hole
+            my_score = score_hole(hole_ids[0], hole_ids[1])
+
+            pool = [card_id for card_id in remaining_ids if card_id not in runout]
+            weaker = []
+            not_stronger = []
+            for pair in combinations(pool, 2):
+                opp_score = score_hole(pair[0], pair[1])
+                if opp_score < my_score:
+                    weaker.append(pair)
+                    not_stronger.append(pair)
+                elif opp_score == my_score:
+                    not_stronger.append(pair)
+
+            wins = _count_disjoint_pairs(weaker, num_opponents)
+            ties = _count_disjoint_pairs(not_stronger, num_opponents) - wins
+            total_score += (wins + 0.5 * ties) / holdings
+            num_runouts += 1
+
+        return total_score / num_runouts
 
     def _simulate_hand(
         self,
@@ -39,53 +486,49 @@ class MonteCarloSimulator:
         단일 핸드 시뮬레이션
         반환값: 1.0 (승리), 0.5 (무승부), 0.0 (패배)
         """
-        
-        deck = Deck()
-        
-        # 이미 나와있는 카드(내 패 + 커뮤니티)를 덱에서 제거
-        # Deck 클래스의 self.cards 리스트를 활용하여 남은 카드를 필터링합니다.
-        known_cards = set(hole_cards + community_cards)
-        
-        # __eq__가 구현된 Card 클래스 덕분에 set과 list comprehension으로 필터링 가능
-        remaining_cards = [c for c in deck.cards if c not in known_cards]
-        random.shuffle(remaining_cards)
-
-        # 상대방에게 홀카드 분배
-        opponents_hands = []
-        for _ in range(num_opponents):
-            if len(remaining_cards) < 2: # 남은 카드가 부족하면 중단(안전장치)
-                break
-            op_card1 = remaining_cards.pop()
-            op_card2 = remaining_cards.pop()
-            opponents_hands.append([op_card1, op_card2])
-
-        # 남은 커뮤니티 카드 보충 (총 5장이 되도록)
-        current_community = community_cards[:] 
-        missing_count = 5 - len(current_community) 
-        
-        for _ in range(missing_count):
-            if remaining_cards:
-                current_community.append(remaining_cards.pop()) 
+        hole_ids, board_ids, remaining_ids = self._split_ids(hole_cards, community_cards)
+        return self._simulate_ids(hole_ids, board_ids, remaining_ids, num_opponents)
+
+    @staticmethod
+    def _simulate_ids(
+        hole_ids: List[int],
+        board_ids: List[int],
+        remaining_ids: List[int],
+        num_opponents: int,
+        sample: Callable = random.sample
+    ) -> float:
+        """
+        단일 핸드 시뮬레이션 (정수 카드 id 버전)
+
+        매 시행마다 Deck()을 만들지 않고, 남은 카드 id 목록에서
+        필요한 장수(상대 홀카드 + 남은 커뮤니티)만 무작위로 뽑습니다.
+        sample: 사용할 난수 생성기의 sample (기본값: 전역 random)
+        반환값: 1.0 (승리), 0.5 (무승부), 0.0 (패배)
+        """
+        missing_count = 5 - len(board_ids)
+        # 남은 카드가 부족하면 받을 수 있는 상대 수까지만 분배 (안전장치)
+        num_opponents = min(num_opponents, (len(remaining_ids) - missing_count) // 2)
+        dealt_count = 2 * num_opponents
+
+        drawn = sample(remaining_ids, dealt_count + missing_count)
+        # 완성된 보드는 시행당 한 번만 분석하고, 플레이어마다 홀카드 2장만 더해 평가
+        board = BoardState(board_ids + drawn[dealt_count:])
+        score_hole = board.score_hole
 
         # 내 핸드 평가
-        # evaluate_hand 반환값: (족보순위, 키커, 최상패)
-        my_rank, my_kickers, _ = self.evaluator.evaluate_hand(hole_cards + current_community)
-        
-        # 비교를 위해 (족보 값, 키커 리스트) 튜플 생성
-        # HandRank Enum은 .value로 정수값 비교, Kickers는 리스트 자체로 사전순 비교 가능
-        my_score_key = (my_rank.value, my_kickers)
+        # score 반환값: 족보와 키커 순서를 그대로 보존하는 정수 (클수록 강함)
+        my_score = score_hole(hole_ids[0], hole_ids[1])
 
         # 상대방 핸드 평가 및 승패 결정
         is_tie = False 
         
-        for opp_hand in opponents_hands: 
-            opp_rank, opp_kickers, _ = self.evaluator.evaluate_hand(opp_hand + current_community) 
-            opp_score_key = (opp_rank.value, opp_kickers) 
+        for i in range(0, dealt_count, 2): 
+            opp_score = score_hole(drawn[i], drawn[i + 1])
             
-            # 파이썬 튜플 비교: 첫 번째 요소(족보) 비교 -> 같으면 두 번째 요소(키커) 비교
-            if opp_score_key > my_score_key:
+            # 정수 비교만으로 족보 -> 키커 순서 비교와 같은 결과
+            if opp_score > my_score:
                 return 0.0  # 상대방 승리 (패배)
-            elif opp_score_key == my_score_key:
+            elif opp_score == my_score:
                 is_tie = True # 동점 발생 (잠재적 무승부)
 
         if is_tie:
@@ -98,10 +541,39 @@ class MonteCarloSimulator:
         hole_cards: List[Card],
         community_cards: List[Card],
         num_opponents: int = 1,
-        num_threads: int = 4
+        num_threads: Optional[int] = None,
+        backend: Optional[str] = None,
+        exact: Optional[bool] = None
     ) -> float:
-        """병렬 처리를 통한 빠른 시뮬레이션"""
-        
+        """
+        병렬 처리를 통한 빠른 시뮬레이션
+
+        Args:
+            num_threads: 스레드/워커 수 (기본값: 스레드 4개, 프로세스는 CPU 코어 수)
+            backend: "thread" 또는 "process" (기본값: set_default_backend로 정한 값)
+            exact: calculate_win_probability와 같음 (전수 조사는 병렬화하지 않음)
+        """
+        hole_ids, board_ids, remaining_ids = self._split_ids(hole_cards, community_cards)
+        # 같은 시행 횟수의 calculate_win_probability 결과와 캐시를 공유
+        key = self._cache_key(hole_ids, board_ids, num_opponents, "fixed", self.num_simulations, exact)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        if self._use_exact(exact, board_ids, remaining_ids, num_opponents):
+            return self._cache_put(key, self._exact_ids(hole_ids, board_ids, remaining_ids, num_opponents))
+
+        if backend is None:
+            backend = _default_backend
+        if backend == "process":
+            return self._cache_put(key, self._process_simulation(
+                hole_cards, community_cards, num_opponents, num_threads or os.cpu_count() or 1
+            ))
+        if backend != "thread":
+            raise ValueError(f"지원하지 않는 백엔드입니다: {backend}")
+        if num_threads is None:
+            num_threads = 4
+
         simulations_per_thread = self.num_simulations // num_threads
         remainder = self.num_simulations % num_threads
 
@@ -124,6 +596,41 @@ class MonteCarloSimulator:
             for future in futures:
                 total_score += future.result()
 
+        return self._cache_put(key, total_score / self.num_simulations)
+
+    def _process_simulation(
+        self,
+        hole_cards: List[Card],
+        community_cards: List[Card],
+        num_opponents: int,
+        num_workers: int
+    ) -> float:
+        """
+        재사용 프로세스 풀에서 시뮬레이션을 묶음 단위로 나눠 실행합니다.
+
+        각 묶음의 시드는 부모의 전역 random에서 뽑으므로,
+        random.seed()로 부모를 고정하면 결과도 재현됩니다.
+        """
+        hole_ids, board_ids, remaining_ids = self._split_ids(hole_cards, community_cards)
+        pool = _get_process_pool(num_workers)
+
+        num_chunks = min(self.num_simulations, num_workers * CHUNKS_PER_WORKER) or 1
+        chunk_size, remainder = divmod(self.num_simulations, num_chunks)
+
+        futures = []
+        for i in range(num_chunks):
+            count = chunk_size + (1 if i < remainder else 0)
+            futures.append(pool.submit(
+                _run_chunk,
+                hole_ids,
+                board_ids,
+                remaining_ids,
+                num_opponents,
+                count,
+                random.getrandbits(64)
+            ))
+
+        total_score = sum(future.result() for future in futures)
         return total_score / self.num_simulations
 
     def _run_simulations(
@@ -135,8 +642,9 @@ class MonteCarloSimulator:
     ) -> float:
         """스레드 내부에서 실행되는 시뮬레이션 루프"""
         local_score = 0.0
+        hole_ids, board_ids, remaining_ids = self._split_ids(hole_cards, community_cards)
         for _ in range(num_sims):
-            local_score += self._simulate_hand(hole_cards, community_cards, num_opponents)
+            local_score += self._simulate_ids(hole_ids, board_ids, remaining_ids, num_opponents)
         return local_score
 
 if __name__ == "__main__":
@@ -171,4 +679,9 @@ if __name__ == "__main__":
     win_rate_parallel = simulator.parallel_simulation(
         my_hole_cards, current_community, num_opponents=1, num_threads=4
     )
-    print(f"병렬 스레드 승률 (Equity): {win_rate_parallel:.2%}")
\ No newline at end of file
+    print(f"병렬 스레드 승률 (Equity): {win_rate_parallel:.2%}")
+    # 3. 병렬 프로세스 실행 (CPU 코어 수만큼 워커, 풀은 재사용)
+    win_rate_process = simulator.parallel_simulation(
+        my_hole_cards, current_community, num_opponents=1, backend="process"
+    )
+    print(f"병렬 프로세스 승률 (Equity): {win_rate_process:.2%}")
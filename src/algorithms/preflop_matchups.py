@@ -0,0 +1,212 @@
+"""
+프리플랍 핸드 대 핸드 올인 승률 행렬 - 169 x 169
+보드 C(48,5) = 1,712,304장을 전부 나열해 계산한 정확한 값 (무늬 동형으로 중복 제거)
+
+matrix[i, j] = 클래스 i가 클래스 j를 상대로 올인했을 때의 승률 (무승부 0.5)
+             = 클래스 i의 한 조합과, 그와 겹치지 않는 클래스 j의 모든 조합에 대한 평균
+matrix[j, i] = 1 - matrix[i, j], 같은 클래스끼리는 0.5
+
+파일은 저장소에 넣지 않습니다. get_matchup_table()을 처음 부를 때 만들어 데이터 디렉터리에
+캐시하며 (CPU 코어 하나로 약 70분), 미리 만들어 두려면:
+생성: python -m src.algorithms.preflop_matchups [--workers N] [--max-boards N]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, combinations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms import equity_tables
+from src.algorithms.batch_evaluator import BoardBatch
+from src.algorithms.equity_cache import canonical_key
+from src.algorithms.hand_classes import (
+    NUM_CLASSES,
+    class_combos,
+    class_name,
+    hand_class,
+    representative_combo,
+)
+
+
+TABLE_KIND = b"PFMX"
+
+DEFAULT_PATH = equity_tables.data_path("preflop_matchups.bin")
+
+# 워커 프로세스마다 한 번 만드는 전체 보드 분석 결과
+_BOARDS: Optional[BoardBatch] = None
+
+
+def all_boards(max_boards: Optional[int] = None, seed: Optional[int] = None) -> np.ndarray:
+    """
+    52장에서 뽑을 수 있는 모든 5장 보드 (C(52,5) x 5, uint8)
+
+    max_boards가 주어지면 그중 무작위 max_boards개만 사용합니다 (빠른 근사/테스트용).
+    """
+    count = 2598960
+    boards = np.fromiter(
+        chain.from_iterable(combinations(range(52), 5)), dtype=np.uint8, count=count * 5
+    ).reshape(count, 5)
+    if max_boards is not None and max_boards < count:
+        rows = np.random.default_rng(seed).choice(count, size=max_boards, replace=False)
+        boards = boards[np.sort(rows)]
+    return boards
+
+
+def _init_worker(max_boards: Optional[int], seed: Optional[int]) -> None:
+    global _BOARDS
+    _BOARDS = BoardBatch(all_boards(max_boards, seed))
+
+
+def _villain_groups(
+    hero: Tuple[int, int],
+    hero_index: int
+) -> Dict[tuple, Tuple[Tuple[int, int], List[int]]]:
+    """
+    히어로 조합과 겹치지 않는 상위 클래스(j > i) 조합을 무늬 동형 키로 묶습니다.
+
+    히어로를 고정한 채 무늬 치환으로 서로 옮겨지는 상대 조합은 승률이 같으므로
+    그룹마다 한 번만 계산하면 됩니다. 값은 (대표 조합, 그룹에 속한 조합들의 클래스 목록)입니다.
+    """
+    groups: Dict[tuple, Tuple[Tuple[int, int], List[int]]] = {}
+    for villain_index in range(hero_index + 1, NUM_CLASSES):
+        for villain in class_combos(villain_index):
+            if set(villain) & set(hero):
+                continue
+            key = canonical_key(hero, villain, 1)
+            groups.setdefault(key, (villain, []))[1].append(villain_index)
+    return groups
+
+
+def _hero_row(hero_index: int) -> np.ndarray:
+    """
+    클래스 hero_index 행의 상위 삼각 부분 (matrix[i, j], j > i)을 계산합니다 (워커에서 실행).
+    """
+    hero = representative_combo(hero_index)
+    boards = _BOARDS.subset(_BOARDS.avoiding(hero))
+    hero_scores = boards.score_hole(*hero)
+
+    equity_sum = np.zeros(NUM_CLASSES)
+    combo_count = np.zeros(NUM_CLASSES)
+    for villain, members in _villain_groups(hero, hero_index).values():
+        valid = boards.avoiding(villain)
+        villain_scores = boards.subset(valid).score_hole(*villain)
+        mine = hero_scores[valid]
+        wins = np.count_nonzero(mine > villain_scores)
+        ties = np.count_nonzero(mine == villain_scores)
+        equity = (wins + 0.5 * ties) / len(villain_scores)
+        for villain_index in members:
+            equity_sum[villain_index] += equity
+            combo_count[villain_index] += 1
+
+    row = np.zeros(NUM_CLASSES)
+    upper = combo_count > 0
+    row[upper] = equity_sum[upper] / combo_count[upper]
+    return row
+
+
+def build_matchup_matrix(
+    workers: Optional[int] = None,
+    max_boards: Optional[int] = None,
+    seed: Optional[int] = None,
+    verbose: bool = False
+) -> np.ndarray:
+    """
+    169 x 169 승률 행렬을 만듭니다.
+
+    히어로 클래스(행) 단위로 프로세스 풀에 나누며, 워커마다 전체 보드를 한 번 분석해 둡니다.
+    max_boards를 주면 모든 워커가 같은 무작위 보드 부분집합을 씁니다 (근사).
+
+    Returns:
+        (169, 169) float32 배열
+    """
+    matrix = np.full((NUM_CLASSES, NUM_CLASSES), 0.5)
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(max_boards, seed)
+    ) as executor:
+        # 상대 클래스가 많은 앞쪽 행부터 제출해 워커 부하를 고르게 분산
+        futures = [executor.submit(_hero_row, index) for index in range(NUM_CLASSES - 1)]
+        for index, future in enumerate(futures):
+            row = future.result()
+            matrix[index, index + 1:] = row[index + 1:]
+            matrix[index + 1:, index] = 1.0 - row[index + 1:]
+            if verbose:
+                print(f"{index + 1:3d}/{NUM_CLASSES - 1} {class_name(index)}")
+    return matrix.astype(np.float32)
+
+
+class PreflopMatchupTable:
+    """169 x 169 프리플랍 승률 행렬 조회 (mmap, O(1))"""
+
+    def __init__(self, matrix: np.ndarray, num_boards: int = 2598960):
+        """
+        Args:
+            matrix: (169, 169) 승률 행렬
+            num_boards: 생성에 쓴 5장 보드 수 (전수면 C(52,5) = 2,598,960)
+        """
+        self.matrix = matrix
+        self.num_boards = num_boards
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH, mmap: bool = True) -> "PreflopMatchupTable":
+        matrix, num_boards = equity_tables.open_table(path, TABLE_KIND, mmap=mmap)
+        return cls(matrix, num_boards)
+
+    def save(self, path: str = DEFAULT_PATH) -> None:
+        equity_tables.write_table(path, TABLE_KIND, self.matrix, meta=self.num_boards)
+
+    def class_equity(self, hero_class: int, villain_class: int) -> float:
+        """클래스 번호끼리의 승률"""
+        return float(self.matrix[hero_class, villain_class])
+
+    def equity(self, hero_cards: Sequence[Card], villain_cards: Sequence[Card]) -> float:
+        """
+        두 홀카드의 클래스 간 올인 승률 (히어로 기준)
+
+        클래스 평균이므로 무늬가 겹치는 특정 조합(예: A♠K♠ vs Q♠Q♥)의 값과는 조금 다를 수 있습니다.
+        """
+        return self.class_equity(
+            hand_class(hero_cards[0].id, hero_cards[1].id),
+            hand_class(villain_cards[0].id, villain_cards[1].id)
+        )
+
+
+_default_table: Optional[PreflopMatchupTable] = None
+
+
+def get_matchup_table(build: bool = True) -> Optional[PreflopMatchupTable]:
+    """
+    기본 경로의 행렬 (처음 호출 시 mmap으로 한 번 열기)
+
+    파일이 없으면 build=True일 때 전체 보드로 build_matchup_matrix를 돌려 캐시하고,
+    build=False면 None을 돌려줍니다.
+    """
+    global _default_table
+    if _default_table is None:
+        if build:
+            equity_tables.ensure_table(
+                DEFAULT_PATH, TABLE_KIND, lambda: (build_matchup_matrix(verbose=True), 2598960)
+            )
+        if os.path.exists(DEFAULT_PATH):
+            _default_table = PreflopMatchupTable.load(DEFAULT_PATH)
+    return _default_table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="프리플랍 169 x 169 승률 행렬 생성")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--max-boards", type=int, default=None, help="보드 표본 수 (기본값: 전수)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    start = time.time()
+    result = build_matchup_matrix(args.workers, args.max_boards, args.seed, verbose=True)
+    PreflopMatchupTable(result, args.max_boards or 2598960).save(args.output)
+    print(f"저장 완료: {args.output} ({time.time() - start:.1f}초)")
@@ -46,7 +46,7 @@ def run_preflop_analysis(num_simulations=1000, num_opponents=1):
                     Card(Suit.HEARTS, rank2)
                 ]
                 
-                win_rate = simulator.parallel_simulation(hole_cards, [], num_opponents)
+                win_rate = simulator.parallel_simulation(hole_cards, [], num_opponents, backend="process")
                 results.append((hand_label, win_rate))
 
             # 2. 페어가 아닌 경우 (Non-Pairs)
@@ -59,7 +59,7 @@ def run_preflop_analysis(num_simulations=1000, num_opponents=1):
                     Card(Suit.SPADES, rank2)
                 ]
                 
-                win_rate_s = simulator.parallel_simulation(hole_cards_s, [], num_opponents)
+                win_rate_s = simulator.parallel_simulation(hole_cards_s, [], num_opponents, backend="process")
                 results.append((hand_label_s, win_rate_s))
 
                 # 2-2. 오프수딧 (Off-suit) - 예: AKo
@@ -70,7 +70,7 @@ def run_preflop_analysis(num_simulations=1000, num_opponents=1):
                     Card(Suit.HEARTS, rank2)
                 ]
                 
-                win_rate_o = simulator.parallel_simulation(hole_cards_o, [], num_opponents)
+                win_rate_o = simulator.parallel_simulation(hole_cards_o, [], num_opponents, backend="process")
                 results.append((hand_label_o, win_rate_o))
     
     elapsed_time = time.time() - start_time
@@ -0,0 +1,192 @@
+"""
+프리플랍 승률 테이블 - 169개 핸드 클래스 x 상대 1~9명
+오프라인에서 한 번 생성해 두고, 게임 중에는 배열 인덱싱 한 번으로 조회
+
+정확도:
+    상대 1명 열은 169 x 169 정확 행렬(preflop_matchups)을 상대 조합 수로 가중 평균한
+    정확한 값입니다 (float32 반올림 외 오차 없음).
+    상대 2~9명 열은 다인원 전수 계산이 불가능해 벡터화 몬테카를로로 만든 근사값입니다.
+    칸마다 기본 200,000회 시행이라 표준오차는 sqrt(p(1-p)/200000) 이하,
+    즉 최대 약 0.0011 (0.11%p)이며 대부분의 칸은 그보다 작습니다.
+    생성 스크립트는 행렬 파일이 없으면 상대 1명 열도 같은 몬테카를로로 채웁니다.
+
+파일은 저장소에 넣지 않습니다. get_preflop_table()을 처음 부를 때 (필요하면 행렬까지) 만들어
+데이터 디렉터리에 캐시하며, 미리 만들어 두려면:
+생성: python -m src.algorithms.preflop_table [--trials N] [--workers N]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms import equity_tables
+from src.algorithms.hand_classes import (
+    NUM_CLASSES,
+    class_combos,
+    class_name,
+    hand_class,
+    representative_combo,
+)
+from src.algorithms.preflop_matchups import get_matchup_table
+from src.algorithms.vector_monte_carlo import VectorMonteCarloSimulator
+
+
+TABLE_KIND = b"PFEQ"
+MAX_OPPONENTS = 9
+DEFAULT_TRIALS = 200000
+
+DEFAULT_PATH = equity_tables.data_path("preflop_equity.bin")
+
+
+def heads_up_equities(matchups: np.ndarray) -> np.ndarray:
+    """
+    169 x 169 정확 행렬에서 각 클래스의 무작위 상대 1명 대비 승률을 구합니다.
+
+    matchups[i, j]는 겹치지 않는 조합 쌍 전체의 평균이고 클래스 i의 조합은 모두 무늬 동형이므로,
+    대표 조합과 겹치지 않는 클래스 j 조합 수로 가중 평균하면 정확한 헤즈업 승률이 됩니다.
+
+    Returns:
+        (169,) float64 배열
+    """
+    equities = np.zeros(NUM_CLASSES)
+    for index in range(NUM_CLASSES):
+        hero = set(representative_combo(index))
+        counts = np.array([
+            sum(1 for combo in class_combos(villain) if not hero & set(combo))
+            for villain in range(NUM_CLASSES)
+        ])
+        equities[index] = np.dot(matchups[index].astype(np.float64), counts) / counts.sum()
+    return equities
+
+
+def _class_equities(
+    index: int,
+    trials: int,
+    first_opponents: int,
+    max_opponents: int,
+    seed: int
+) -> List[float]:
+    """클래스 하나의 상대 first_opponents~max_opponents명 승률 (프로세스 워커에서 실행)"""
+    simulator = VectorMonteCarloSimulator(num_simulations=trials, rng=seed)
+    first_id, second_id = representative_combo(index)
+    hole = [Card.from_id(first_id), Card.from_id(second_id)]
+    return [
+        simulator.calculate_win_probability(hole, [], num_opponents)
+        for num_opponents in range(first_opponents, max_opponents + 1)
+    ]
+
+
+def build_preflop_table(
+    trials: int = DEFAULT_TRIALS,
+    max_opponents: int = MAX_OPPONENTS,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    verbose: bool = False,
+    matchups: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    169개 클래스의 상대 수별 승률 테이블을 만듭니다.
+
+    matchups(169 x 169 정확 행렬)가 주어지면 상대 1명 열은 heads_up_equities로 정확히 채웁니다.
+    나머지 열은 클래스마다 벡터화 몬테카를로를 trials번 돌리며 (표준오차 0.5/sqrt(trials) 이하),
+    클래스 단위로 프로세스 풀에 나눠 실행합니다.
+    시드는 SeedSequence에서 클래스마다 독립된 값을 뽑아 씁니다.
+
+    Returns:
+        (169, max_opponents) float32 배열 - [클래스, 상대 수 - 1]
+    """
+    seeds = np.random.SeedSequence(seed).generate_state(NUM_CLASSES, dtype=np.uint64)
+    table = np.zeros((NUM_CLASSES, max_opponents), dtype=np.float32)
+    first_opponents = 1
+    if matchups is not None:
+        table[:, 0] = heads_up_equities(matchups)
+        first_opponents = 2
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                _class_equities, index, trials, first_opponents, max_opponents, int(seeds[index])
+            )
+            for index in range(NUM_CLASSES)
+        ]
+        for index, future in enumerate(futures):
+            table[index, first_opponents - 1:] = future.result()
+            if verbose:
+                print(f"{index + 1:3d}/{NUM_CLASSES} {class_name(index):<4} "
+                      f"헤즈업 {table[index, 0] * 100:6.2f}%")
+    return table
+
+
+class PreflopEquityTable:
+    """프리플랍 승률 테이블 조회 (O(1))"""
+
+    def __init__(self, table: np.ndarray, trials: int = 0):
+        self.table = table
+        self.trials = trials
+        self.max_opponents = table.shape[1]
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH) -> "PreflopEquityTable":
+        """테이블 파일을 불러옵니다 (작은 파일이라 메모리로 읽음)."""
+        table, trials = equity_tables.open_table(path, TABLE_KIND, mmap=False)
+        return cls(table, trials)
+
+    def save(self, path: str = DEFAULT_PATH) -> None:
+        equity_tables.write_table(path, TABLE_KIND, self.table, meta=self.trials)
+
+    def equity_ids(self, first_id: int, second_id: int, num_opponents: int = 1) -> float:
+        """홀카드 2장(카드 id)의 상대 num_opponents명 상대 승률"""
+        if not 1 <= num_opponents <= self.max_opponents:
+            raise ValueError(f"상대 수는 1~{self.max_opponents}명이어야 합니다.")
+        return float(self.table[hand_class(first_id, second_id), num_opponents - 1])
+
+    def equity(self, hole_cards: Sequence[Card], num_opponents: int = 1) -> float:
+        """equity_ids의 Card 버전"""
+        return self.equity_ids(hole_cards[0].id, hole_cards[1].id, num_opponents)
+
+
+_default_table: Optional[PreflopEquityTable] = None
+
+
+def get_preflop_table(build: bool = True) -> Optional[PreflopEquityTable]:
+    """
+    기본 경로의 테이블 (처음 호출 시 한 번 로드)
+
+    파일이 없으면 build=True일 때 정확 행렬(get_matchup_table)과 몬테카를로로 만들어 캐시하고,
+    build=False면 None을 돌려줍니다.
+    """
+    global _default_table
+    if _default_table is None:
+        if build:
+            equity_tables.ensure_table(DEFAULT_PATH, TABLE_KIND, lambda: (
+                build_preflop_table(verbose=True, matchups=get_matchup_table().matrix),
+                DEFAULT_TRIALS
+            ))
+        if os.path.exists(DEFAULT_PATH):
+            _default_table = PreflopEquityTable.load(DEFAULT_PATH)
+    return _default_table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="프리플랍 승률 테이블 생성")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="클래스/상대 수별 시행 횟수")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    start = time.time()
+    matchup_table = get_matchup_table(build=False)
+    if matchup_table is None:
+        print("169 x 169 행렬 파일이 없어 상대 1명 열도 몬테카를로로 만듭니다.")
+    result = build_preflop_table(
+        args.trials, workers=args.workers, seed=args.seed, verbose=True,
+        matchups=None if matchup_table is None else matchup_table.matrix
+    )
+    PreflopEquityTable(result, args.trials).save(args.output)
+    print(f"저장 완료: {args.output} ({time.time() - start:.1f}초)")
@@ -65,7 +65,7 @@ def run_comprehensive_analysis(
             # 예: 플랍에서 내가 원페어인지, 하이카드인지 식별
             current_cards = hero_cards + community_cards
             
-            current_rank, _, _ = evaluator.evaluate_hand(current_cards)
+            current_rank, _ = evaluator.rank_hand(current_cards)
             rank_name = current_rank.name # "PAIR", "HIGH_CARD", "FLUSH" 등
             
             # 3. 몬테카를로 시뮬레이션 (끝까지 갔을 때 승률 계산)
@@ -73,7 +73,7 @@ def run_comprehensive_analysis(
                 hole_cards=hero_cards,
                 community_cards=community_cards,
                 num_opponents=num_opponents,
-                num_threads=4 # CPU 코어 수에 맞게 조절
+                backend="process"  # 프로세스 풀 (CPU 코어 수만큼 워커)
             )
             
             # 4. 결과 기록
@@ -0,0 +1,332 @@
+"""
+레인지 대 레인지 승률 계산 - 카드 제거(card removal)를 반영한 배치 계산
+
+보드 런아웃마다 레인지에 있는 모든 조합을 BoardBatch로 한 번에 점수화하고,
+정렬 한 번으로 각 조합이 상대 레인지의 가중치 중 얼마를 이기고/비기는지 셉니다.
+조합쌍을 하나씩 비교하지 않으므로 런아웃당 O(n log n)입니다.
+
+런아웃 수 x 조합 수가 max_work 이하면 모든 런아웃을 나열한 정확한 값이고,
+넘으면 런아웃을 무작위로 골라 추정합니다. 플랍/턴은 나열한 런아웃 중에서 중복 없이 고르고,
+*_estimate 메서드가 런아웃 표본에서 계산한 표준오차를 함께 돌려줍니다.
+"""
+
+from itertools import combinations
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms.batch_evaluator import BoardBatch, deal_batch
+from src.algorithms.hand_classes import NUM_COMBOS
+from src.algorithms.hand_range import COMBO_CARDS, HandRange
+from src.algorithms.monte_carlo import EquityEstimate
+
+
+# 점수는 2^24 미만이므로 (구간 번호 << 24) | 점수 로 여러 구간을 한 번에 정렬
+SCORE_BITS = 24
+DEAD_SCORE = (1 << SCORE_BITS) - 1   # 보드와 겹치는 조합 표시 (어떤 점수보다 큼)
+
+
+def ranked_weights(keys: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (구간 번호 << 24) | 점수 키마다 같은 구간 안에서 더 작은 키의 가중치 합과 같은 키의 가중치 합
+
+    정렬 한 번과 누적합으로 계산합니다. 구간 번호는 0 이상이면 됩니다.
+    """
+    flat = keys.ravel()
+    order = np.argsort(flat)
+    ordered = flat[order]
+    cumulative = np.concatenate(([0.0], np.cumsum(weights.ravel()[order])))
+
+    positions = np.arange(len(flat))
+    run_start = np.concatenate(([True], ordered[1:] != ordered[:-1]))
+    group = ordered >> SCORE_BITS
+    group_start = np.concatenate(([True], group[1:] != group[:-1]))
+    starts = np.flatnonzero(run_start)
+    ends = np.append(starts[1:], len(flat))
+    run = np.cumsum(run_start) - 1
+    first_of_group = np.maximum.accumulate(np.where(group_start, positions, 0))
+
+    lower = np.empty(len(flat))
+    equal = np.empty(len(flat))
+    lower[order] = cumulative[starts[run]] - cumulative[first_of_group]
+    equal[order] = cumulative[ends[run]] - cumulative[starts[run]]
+    return lower.reshape(keys.shape), equal.reshape(keys.shape)
+
+
+def showdown_weights(
+    scores: np.ndarray,
+    combo_cards: np.ndarray,
+    weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    런아웃별로 각 조합이 상대 가중치 중 이기는/비기는/맞붙을 수 있는 양을 계산합니다.
+
+    내 카드와 겹치는 상대 조합은 빼야 하므로, 전체 순위에서 "내 첫 카드를 포함한 조합"과
+    "내 둘째 카드를 포함한 조합" 안의 순위를 따로 구해 빼고, 두 번 빠진 자기 자신을 되돌립니다.
+
+    Args:
+        scores: (런아웃, 조합) 점수 - 보드와 겹치는 칸은 DEAD_SCORE
+        combo_cards: (조합, 2) 각 조합의 카드 id
+        weights: (런아웃, 조합) 상대 가중치 - 보드와 겹치는 칸은 0
+
+    Returns:
+        (win, tie, live) 각각 (런아웃, 조합) - 내 카드와 겹치지 않는 상대 가중치 중
+        나보다 낮은 점수 / 같은 점수 / 전체의 합 (보드와 겹치는 내 조합 칸은 의미 없음)
+    """
+    num_runouts, num_combos = scores.shape
+    runout_ids = np.arange(num_runouts, dtype=np.int64)[:, None]
+    lower, equal = ranked_weights((runout_ids << SCORE_BITS) | scores, weights)
+    total = weights.sum(axis=1, keepdims=True)
+
+    # 조합마다 카드 2장을 (런아웃, 카드) 구간의 구성원으로 하나씩 등록
+    card_groups = runout_ids * 52 + combo_cards.reshape(1, -1)
+    member_weights = np.repeat(weights, 2, axis=1)
+    card_lower, card_equal = ranked_weights(
+        (card_groups << SCORE_BITS) | np.repeat(scores, 2, axis=1), member_weights
+    )
+    card_total = np.bincount(
+        card_groups.ravel(), weights=member_weights.ravel(), minlength=num_runouts * 52
+    ).reshape(num_runouts, 52)
+
+    card_lower = card_lower.reshape(num_runouts, num_combos, 2).sum(axis=2)
+    card_equal = card_equal.reshape(num_runouts, num_combos, 2).sum(axis=2)
+    card_total = card_total[runout_ids, combo_cards[:, 0]] + card_total[runout_ids, combo_cards[:, 1]]
+
+    win = lower - card_lower
+    tie = equal - card_equal + weights
+    live = total - card_total + weights
+    return win, tie, live
+
+
+def score_runouts(
+    board_ids: Sequence[int],
+    runouts: np.ndarray,
+    combo_cards: np.ndarray
+) -> Tuple[BoardBatch, np.ndarray, np.ndarray]:
+    """
+    보드 + 런아웃마다 조합들을 점수화합니다.
+
+    런아웃 카드와 겹치는 (런아웃, 조합) 칸은 점수화하지 않고 DEAD_SCORE로 둡니다.
+
+    Args:
+        board_ids: 공통 보드 카드 id (0~5장)
+        runouts: (R, 5 - 보드 장수) 런아웃 카드 id
+        combo_cards: (C, 2) 조합 카드 id (보드와 겹치지 않아야 함)
+
+    Returns:
+        (런아웃 보드 BoardBatch, (R, C) 점수, (R, C) 겹치지 않는 칸 여부)
+    """
+    num_runouts = len(runouts)
+    board = np.array(list(board_ids), dtype=np.intp)
+    batch = BoardBatch(np.concatenate([np.tile(board, (num_runouts, 1)), runouts], axis=1))
+
+    one = np.int64(1)
+    runout_masks = np.zeros(num_runouts, dtype=np.int64)
+    for column in range(runouts.shape[1]):
+        runout_masks |= one << runouts[:, column].astype(np.int64)
+    combo_masks = (one << combo_cards[:, 0].astype(np.int64)) | (one << combo_cards[:, 1].astype(np.int64))
+    alive = (runout_masks[:, None] & combo_masks[None, :]) == 0
+
+    rows, cols = np.nonzero(alive)
+    scores = np.full(alive.shape, DEAD_SCORE, dtype=np.int64)
+    scores[rows, cols] = batch.subset(rows).score_hole(combo_cards[cols, 0], combo_cards[cols, 1])
+    return batch, scores, alive
+
+
+def ratio_estimate(numerators: np.ndarray, denominators: np.ndarray, total: int) -> EquityEstimate:
+    """
+    런아웃별 (승점 합, 대결 가중치 합)에서 승률 = 합의 비율과 그 표준오차
+
+    total개 런아웃 중 일부만 뽑았으면 비율 추정량의 표준오차에 유한 모집단 보정을 곱하고,
+    전부 나열했으면 EquityEstimate(승률, 0.0, 0)입니다.
+    """
+    matched = float(denominators.sum())
+    if matched <= 0:
+        raise ValueError("서로 겹치지 않는 핸드 조합이 없습니다.")
+    equity = float(numerators.sum()) / matched
+    samples = len(numerators)
+    if samples >= total:
+        return EquityEstimate(equity, 0.0, 0)
+    residuals = numerators - equity * denominators
+    variance = float((residuals * residuals).sum()) / (samples - 1) / samples
+    variance *= 1.0 - samples / total
+    return EquityEstimate(equity, float(np.sqrt(variance)) / (matched / samples), samples)
+
+
+class RangeEquityCalculator:
+    """핸드/레인지 대 레인지 승률 계산 클래스"""
+
+    # 런아웃 수 x 조합 수 상한 (넘으면 런아웃을 이 안에서 무작위 표본으로)
+    # 플랍에서 두 레인지 합이 약 150조합(range_vs_range), 상대가 약 460조합(hero_vs_range)까지 전수 조사
+    MAX_WORK = 400000
+    # 런아웃을 중복 없이 고를 때 미리 나열하는 최대 런아웃 수 (플랍 1,081 / 턴 46, 프리플랍은 복원 추출)
+    ENUMERATE_LIMIT = 50000
+
+    def __init__(
+        self,
+        max_work: int = MAX_WORK,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ):
+        """
+        Args:
+            max_work: 한 번에 점수화할 (런아웃, 조합) 칸 수 상한
+            rng: 런아웃 표본에 쓸 NumPy 난수 생성기 또는 시드
+        """
+        self.max_work = max_work
+        self.rng = np.random.default_rng(rng)
+
+    def _runouts(
+        self,
+        live_cards: np.ndarray,
+        needed: int,
+        cost_per_runout: int
+    ) -> Tuple[np.ndarray, int]:
+        """
+        남은 카드에서 나올 런아웃 (R, needed)과 전체 런아웃 수
+
+        런아웃 수 x cost_per_runout이 max_work를 넘으면 그 안에 들어가는 수만큼 무작위로 뽑습니다
+        (전체가 ENUMERATE_LIMIT 이하면 중복 없이, 아니면 복원 추출).
+        표본이 전체의 80% 이상이면 아끼는 시간이 거의 없으므로 전부 나열합니다.
+        """
+        if needed == 0:
+            return np.zeros((1, 0), dtype=np.intp), 1
+        limit = max(2, self.max_work // max(cost_per_runout, 1))
+        num_cards = len(live_cards)
+        total = 1
+        for k in range(needed):
+            total = total * (num_cards - k) // (k + 1)
+        if total * 4 <= limit * 5 or total <= self.ENUMERATE_LIMIT:
+            runouts = live_cards[np.array(list(combinations(range(num_cards), needed)), dtype=np.intp)]
+            if total * 4 <= limit * 5:
+                return runouts, total
+            return runouts[np.sort(self.rng.choice(total, limit, replace=False))], total
+        return deal_batch(self.rng, limit, needed, live_cards), total
+
+    def _showdown(
+        self,
+        hero_weights: np.ndarray,
+        villain_weights: np.ndarray,
+        board_ids: Sequence[int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        레인지 대 레인지 런아웃별 승/무/대결 가중치 계산 공통부
+
+        Returns:
+            (조합 번호, 런아웃별 히어로 가중치, win, tie, live, 전체 런아웃 수)
+        """
+        if len(board_ids) > 5:
+            raise ValueError("보드는 최대 5장입니다.")
+        dead = np.zeros(52, dtype=bool)
+        dead[list(board_ids)] = True
+        board_dead = dead[COMBO_CARDS].any(axis=1)
+        combos = np.flatnonzero(((hero_weights > 0) | (villain_weights > 0)) & ~board_dead)
+        if combos.size == 0:
+            raise ValueError("보드와 겹치지 않는 조합이 레인지에 없습니다.")
+        combo_cards = COMBO_CARDS[combos]
+
+        # 정렬이 두 번 들어가 칸당 비용이 hero_vs_range의 약 3배
+        runouts, total = self._runouts(np.flatnonzero(~dead), 5 - len(board_ids), len(combos) * 3)
+        _, scores, alive = score_runouts(board_ids, runouts, combo_cards)
+        win, tie, live = showdown_weights(scores, combo_cards, villain_weights[combos] * alive)
+        return combos, hero_weights[combos] * alive, win, tie, live, total
+
+    def range_vs_range(
+        self,
+        hero_range: HandRange,
+        villain_range: HandRange,
+        community_cards: Sequence[Card]
+    ) -> float:
+        """
+        히어로 레인지 대 상대 레인지 승률 (무승부 0.5)
+
+        서로 겹치지 않는 (히어로 조합, 상대 조합) 쌍을 두 가중치의 곱으로 평균합니다.
+        """
+        return self.range_vs_range_estimate(hero_range, villain_range, community_cards).equity
+
+    def range_vs_range_estimate(
+        self,
+        hero_range: HandRange,
+        villain_range: HandRange,
+        community_cards: Sequence[Card]
+    ) -> EquityEstimate:
+        """
+        range_vs_range + 런아웃 표본 오차
+
+        Returns:
+            EquityEstimate(equity, std_error, trials) - 전수 조사면 std_error=0.0, trials=0,
+            표본이면 trials는 뽑은 런아웃 수
+        """
+        _, hero, win, tie, live, total = self._showdown(
+            hero_range.weights, villain_range.weights, [card.id for card in community_cards]
+        )
+        return ratio_estimate((hero * (win + 0.5 * tie)).sum(axis=1), (hero * live).sum(axis=1), total)
+
+    def hero_vs_range(
+        self,
+        hole_cards: Sequence[Card],
+        community_cards: Sequence[Card],
+        villain_range: HandRange
+    ) -> float:
+        """
+        홀카드 한 조합 대 상대 레인지 승률 (무승부 0.5)
+
+        내 카드가 정해져 있으므로 겹치는 상대 조합을 미리 빼고,
+        런아웃마다 내 점수와 상대 조합 점수를 바로 비교합니다 (정렬 불필요).
+        """
+        return self.hero_vs_range_estimate(hole_cards, community_cards, villain_range).equity
+
+    def hero_vs_range_estimate(
+        self,
+        hole_cards: Sequence[Card],
+        community_cards: Sequence[Card],
+        villain_range: HandRange
+    ) -> EquityEstimate:
+        """hero_vs_range + 런아웃 표본 오차 (반환값은 range_vs_range_estimate와 같음)"""
+        hole_ids = [card.id for card in hole_cards]
+        board_ids = [card.id for card in community_cards]
+        if len(board_ids) > 5:
+            raise ValueError("보드는 최대 5장입니다.")
+        weights = villain_range.without(hole_ids + board_ids).weights
+        combos = np.flatnonzero(weights)
+        if combos.size == 0:
+            raise ValueError("상대 레인지에 내 카드/보드와 겹치지 않는 조합이 없습니다.")
+
+        dead = np.zeros(52, dtype=bool)
+        dead[hole_ids + board_ids] = True
+        runouts, total = self._runouts(np.flatnonzero(~dead), 5 - len(board_ids), len(combos) + 1)
+        batch, scores, alive = score_runouts(board_ids, runouts, COMBO_CARDS[combos])
+        hero_scores = batch.score_hole(hole_ids[0], hole_ids[1])[:, None]
+
+        villain = weights[combos] * alive
+        won = (villain * (hero_scores > scores)).sum(axis=1)
+        tied = (villain * (hero_scores == scores)).sum(axis=1)
+        return ratio_estimate(won + 0.5 * tied, villain.sum(axis=1), total)
+
+    def combo_equities(
+        self,
+        villain_range: HandRange,
+        community_cards: Sequence[Card],
+        hero_range: Optional[HandRange] = None
+    ) -> np.ndarray:
+        """
+        히어로 레인지(기본값: 모든 조합)의 조합별 상대 레인지 승률
+
+        런아웃을 표본으로 뽑은 경우 (max_work 초과) 조합별 값은 같은 런아웃 표본의 추정값이며,
+        전체 오차는 같은 인자의 range_vs_range_estimate로 확인할 수 있습니다.
+
+        Returns:
+            (1326,) 배열 - 히어로 레인지에 없거나 보드와 겹치는 조합은 NaN
+        """
+        hero_weights = (hero_range or HandRange.uniform()).weights
+        combos, hero, win, tie, live, _ = self._showdown(
+            hero_weights, villain_range.weights, [card.id for card in community_cards]
+        )
+        present = hero > 0
+        matched = np.where(present, live, 0.0).sum(axis=0)
+        score = np.where(present, win + 0.5 * tie, 0.0).sum(axis=0)
+
+        result = np.full(NUM_COMBOS, np.nan)
+        valid = (hero_weights[combos] > 0) & (matched > 0)
+        result[combos[valid]] = score[valid] / matched[valid]
+        return result
@@ -0,0 +1,73 @@
+"""
+리버 쇼다운 가치 벡터 - 보드 5장이 정해졌을 때 1,326개 조합 전부의 상대 레인지 대비 승/무/패
+
+조합마다 상대 레인지를 하나씩 비교하면 O(1326²)이지만,
+유효한 조합을 HandEvaluator 보드 상태로 한 번씩만 점수화해 정렬하고
+누적 가중치와 카드별 보정(내 카드를 포함한 상대 조합 제외)으로 O(n log n)에 계산합니다.
+"""
+
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms.hand_evaluator import HandEvaluator
+from src.algorithms.hand_range import COMBO_CARDS, HandRange
+from src.algorithms.range_equity import DEAD_SCORE, showdown_weights
+
+
+class ShowdownValues(NamedTuple):
+    """
+    조합별 쇼다운 결과 - 각각 (1326,) 배열, 내 카드/보드와 겹치지 않는 상대 가중치에 대한 비율
+
+    보드와 겹치거나 맞붙을 상대 조합이 없는 칸은 NaN입니다.
+    """
+    win: np.ndarray
+    tie: np.ndarray
+    loss: np.ndarray
+
+    @property
+    def equity(self) -> np.ndarray:
+        """조합별 승률 (무승부 0.5)"""
+        return self.win + 0.5 * self.tie
+
+
+def combo_scores(community_cards: Sequence[Card]) -> np.ndarray:
+    """
+    리버 보드에서 1,326개 조합 각각의 점수 (보드와 겹치는 조합은 DEAD_SCORE)
+
+    보드는 HandEvaluator.prepare_board로 한 번만 분석합니다.
+    """
+    if len(community_cards) != 5:
+        raise ValueError("리버 보드 5장이 필요합니다.")
+    board = HandEvaluator.prepare_board(list(community_cards))
+    board_ids = {card.id for card in community_cards}
+    return np.array([
+        DEAD_SCORE if first in board_ids or second in board_ids else board.score_hole(first, second)
+        for first, second in COMBO_CARDS.tolist()
+    ], dtype=np.int64)
+
+
+def river_showdown_values(
+    community_cards: Sequence[Card],
+    villain_range: HandRange
+) -> ShowdownValues:
+    """
+    모든 조합의 상대 레인지 대비 승/무/패 비율을 한 번에 계산합니다.
+
+    Args:
+        community_cards: 리버 보드 5장
+        villain_range: 상대 레인지 (가중치)
+    """
+    scores = combo_scores(community_cards)
+    alive = scores != DEAD_SCORE
+    weights = np.where(alive, villain_range.weights, 0.0)
+
+    win, tie, live = showdown_weights(scores[None, :], COMBO_CARDS, weights[None, :])
+    win, tie, live = win[0], tie[0], live[0]
+
+    valid = alive & (live > 0)
+    live = np.where(valid, live, np.nan)
+    win = np.where(valid, win / live, np.nan)
+    tie = np.where(valid, tie / live, np.nan)
+    return ShowdownValues(win, tie, 1.0 - win - tie)
@@ -0,0 +1,201 @@
+"""
+족보 지정 상황 생성기 - 원하는 족보/페이즈의 홀카드 + 보드를 재시도 없이 바로 구성
+
+딜을 반복해서 목표 족보가 나올 때까지 버리는 방식(Rejection Sampling)은
+포카드, 스트레이트 플러시처럼 드문 족보에서 수만 번을 돌고도 실패할 수 있습니다.
+여기서는 카드 n장(5~7)을 "랭크별 장수 패턴 + 무늬 배정"으로 나누어 세고,
+1. 목표 족보가 되는 카드 조합 수에 비례해 랭크 패턴을 고르고
+2. 그 패턴 안에서 목표 족보가 되는 무늬 배정을 균등하게 고른 뒤
+3. n장을 섞어 앞의 2장을 홀카드, 나머지를 보드로 나눕니다.
+결과는 목표 족보인 (홀카드, 보드) 전체에서 균등 표본이며, 족보와 무관하게 상수 시간입니다.
+
+무늬 배정 세기:
+- n <= 7장에서 다섯 장 이상인 무늬는 최대 하나이고, 플러시가 있으면 풀하우스/포카드는 불가능
+- 플러시 무늬 s를 가진 랭크 집합 S(5개 이상)를 정하면 나머지 카드는 s를 뺀 3무늬에서 고름
+  -> 4 x prod(C(3, c-1) for S) x prod(C(3, c) for S 밖)
+- 플러시가 아닌 배정 수 = 전체 prod(C(4, c)) - 플러시 배정 수 (족보는 랭크 패턴만으로 결정)
+"""
+
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.core.card import Card, ids_to_cards
+from src.algorithms.hand_evaluator import HandRank
+from src.algorithms import lookup_evaluator
+from src.algorithms.lookup_evaluator import CATEGORY_SHIFT, FLUSH, ROYAL_FLUSH, STRAIGHT_FLUSH
+
+
+FLUSH_CATEGORIES = (FLUSH, STRAIGHT_FLUSH, ROYAL_FLUSH)
+NUM_CATEGORIES = ROYAL_FLUSH + 1    # 족보 순위(HandRank.value)를 그대로 열 번호로 사용
+
+
+class _PatternTable:
+    """카드 n장의 랭크 패턴 목록과 패턴별/족보별 카드 조합 수"""
+
+    def __init__(self, num_cards: int):
+        rank_table, flush_table, _ = lookup_evaluator.get_tables()
+
+        patterns: List[Tuple[int, ...]] = []
+        counts = []
+        for pattern in lookup_evaluator._rank_count_vectors(num_cards):
+            row = [0] * NUM_CATEGORIES
+            for mask, category, ways in _flush_subsets(pattern, flush_table):
+                row[category] += 4 * ways
+
+            key = sum(count * 5 ** rank for rank, count in enumerate(pattern))
+            total = 1
+            for count in pattern:
+                total *= comb(4, count)
+            row[rank_table[key] >> CATEGORY_SHIFT] += total - sum(row)
+
+            patterns.append(tuple(pattern))
+            counts.append(row)
+
+        self.num_cards = num_cards
+        self.patterns = patterns
+        self.counts = np.array(counts, dtype=np.int64)
+        self.cumulative = np.cumsum(self.counts, axis=0)
+
+    def category_count(self, category: int) -> int:
+        return int(self.cumulative[-1, category])
+
+
+def _flush_subsets(pattern, flush_table):
+    """
+    플러시 무늬를 가질 랭크 집합 S(5개 이상)마다 (랭크 마스크, 족보, 무늬 하나당 배정 수)
+
+    S 안의 랭크는 플러시 무늬 1장 + 나머지 c-1장을, S 밖의 랭크는 c장을 다른 3무늬에서 고릅니다.
+    """
+    ranks = [rank for rank, count in enumerate(pattern) if count]
+    for size in range(5, len(ranks) + 1):
+        for subset in combinations(ranks, size):
+            ways = 1
+            mask = 0
+            for rank in ranks:
+                if rank in subset:
+                    ways *= comb(3, pattern[rank] - 1)
+                    mask |= 1 << rank
+                else:
+                    ways *= comb(3, pattern[rank])
+            if ways:
+                yield mask, flush_table[mask] >> CATEGORY_SHIFT, ways
+
+
+_TABLES: Dict[int, _PatternTable] = {}
+
+
+def _get_table(num_cards: int) -> _PatternTable:
+    """카드 수별 패턴 테이블 (첫 호출 시 한 번만 생성)"""
+    if num_cards not in (5, 6, 7):
+        raise ValueError("홀카드 2장 + 보드 3~5장(총 5~7장)만 생성할 수 있습니다.")
+    if num_cards not in _TABLES:
+        _TABLES[num_cards] = _PatternTable(num_cards)
+    return _TABLES[num_cards]
+
+
+def _category_value(target_rank: Union[HandRank, str, int]) -> int:
+    if isinstance(target_rank, HandRank):
+        return target_rank.value
+    if isinstance(target_rank, str):
+        return HandRank[target_rank].value
+    return int(target_rank)
+
+
+class ScenarioGenerator:
+    """목표 족보/페이즈의 (홀카드, 보드) 균등 표본 생성기"""
+
+    def __init__(self, rng: Optional[Union[np.random.Generator, int]] = None):
+        """
+        Args:
+            rng: NumPy 난수 생성기 또는 시드
+        """
+        self.rng = np.random.default_rng(rng)
+
+    @staticmethod
+    def count(num_board_cards: int, target_rank: Union[HandRank, str, int]) -> int:
+        """홀카드 2장 + 보드 num_board_cards장에서 목표 족보가 되는 카드 조합(집합) 수"""
+        return _get_table(2 + num_board_cards).category_count(_category_value(target_rank))
+
+    def sample(
+        self,
+        num_board_cards: int,
+        target_rank: Union[HandRank, str, int]
+    ) -> Tuple[List[Card], List[Card]]:
+        """
+        목표 족보인 상황 하나를 만듭니다.
+
+        Args:
+            num_board_cards: 보드 장수 (플랍 3, 턴 4, 리버 5)
+            target_rank: 홀카드 + 보드 최상의 5장 족보 (HandRank, 이름, 순위 값)
+
+        Returns:
+            (홀카드 2장, 보드 카드 목록)
+        """
+        hole_ids, board_ids = self.sample_ids(num_board_cards, target_rank)
+        return ids_to_cards(hole_ids), ids_to_cards(board_ids)
+
+    def sample_ids(
+        self,
+        num_board_cards: int,
+        target_rank: Union[HandRank, str, int]
+    ) -> Tuple[List[int], List[int]]:
+        """sample의 정수 카드 id 버전"""
+        table = _get_table(2 + num_board_cards)
+        category = _category_value(target_rank)
+        total = table.category_count(category) if 0 <= category < NUM_CATEGORIES else 0
+        if total == 0:
+            raise ValueError(f"카드 {table.num_cards}장으로 만들 수 없는 족보입니다: {target_rank}")
+
+        # 1. 목표 족보 조합 수에 비례해 랭크 패턴 선택
+        index = int(np.searchsorted(
+            table.cumulative[:, category], self.rng.integers(total), side="right"
+        ))
+        pattern = table.patterns[index]
+
+        # 2. 패턴 안에서 무늬 배정을 균등하게 선택
+        if category in FLUSH_CATEGORIES:
+            card_ids = self._flush_assignment(pattern, category)
+        else:
+            card_ids = self._plain_assignment(pattern)
+
+        # 3. 홀카드/보드로 무작위 분할 (어느 분할이든 족보는 같음)
+        self.rng.shuffle(card_ids)
+        return card_ids[:2], card_ids[2:]
+
+    def _plain_assignment(self, pattern) -> List[int]:
+        """플러시가 없는 무늬 배정 (플러시가 나오면 다시 뽑음, 거절 확률 6% 미만)"""
+        while True:
+            card_ids = [
+                rank * 4 + int(suit)
+                for rank, count in enumerate(pattern) if count
+                for suit in self.rng.choice(4, size=count, replace=False)
+            ]
+            suit_counts = np.bincount(np.array(card_ids) & 3, minlength=4)
+            if suit_counts.max() < 5:
+                return card_ids
+
+    def _flush_assignment(self, pattern, category: int) -> List[int]:
+        """목표 족보가 되는 플러시 랭크 집합 S를 배정 수에 비례해 고른 뒤 나머지 무늬를 채움"""
+        _, flush_table, _ = lookup_evaluator.get_tables()
+        options = [
+            (mask, ways) for mask, subset_category, ways in _flush_subsets(pattern, flush_table)
+            if subset_category == category
+        ]
+        weights = np.array([ways for _, ways in options], dtype=np.float64)
+        mask = options[int(self.rng.choice(len(options), p=weights / weights.sum()))][0]
+
+        flush_suit = int(self.rng.integers(4))
+        other_suits = [suit for suit in range(4) if suit != flush_suit]
+        card_ids = []
+        for rank, count in enumerate(pattern):
+            if not count:
+                continue
+            in_flush = bool(mask >> rank & 1)
+            if in_flush:
+                card_ids.append(rank * 4 + flush_suit)
+            for suit in self.rng.choice(other_suits, size=count - in_flush, replace=False):
+                card_ids.append(rank * 4 + int(suit))
+        return card_ids
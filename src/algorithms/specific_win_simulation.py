@@ -4,9 +4,12 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"
 
 import time
 from typing import List, Tuple, Dict
-from src.core.card import Card, Deck, Suit, Rank
-from src.algorithms.hand_evaluator import HandEvaluator
-from src.algorithms.monte_carlo import MonteCarloSimulator
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms.scenario_generator import ScenarioGenerator
+from src.algorithms.vector_monte_carlo import VectorMonteCarloSimulator
 
 # =========================================================
 # 1. 사용자 설정 구간 (여기만 바꾸면 됩니다!)
@@ -17,9 +20,13 @@ TARGET_RANK_NAME = "TWO_PAIR"  # 찾고 싶은 족보 이름 (대문자)
                             #     "STRAIGHT", "FLUSH", "FULL_HOUSE", "FOUR_OF_A_KIND", "STRAIGHT_FLUSH"
 
 NUM_TEST_CASES = 300       # 해당 조건의 상황을 몇 번이나 만들어서 테스트할지
-MC_SIMULATIONS = 20000       # 각 상황마다 돌릴 몬테카를로 시뮬레이션 횟수
+MC_SIMULATIONS = 20000       # 각 상황마다 돌릴 몬테카를로 시뮬레이션 최대 횟수
+TARGET_STD_ERROR = 0.0035    # 목표 표준오차 (20000회 고정 시행의 최대 오차와 같음, 도달하면 조기 종료)
 # =========================================================
 
+RNG = np.random.default_rng()
+GENERATOR = ScenarioGenerator(rng=RNG)
+
 
 def get_card_count_by_phase(phase_name: str) -> int:
     if phase_name == "Flop": return 3
@@ -29,39 +36,18 @@ def get_card_count_by_phase(phase_name: str) -> int:
 
 def generate_scenario_with_condition(
     target_phase: str, 
-    target_rank_name: str, 
-    max_attempts: int = 100000
+    target_rank_name: str
 ) -> Tuple[List[Card], List[Card], str]:
     """
-    원하는 족보가 나올 때까지 무한정 카드를 다시 뽑는 함수 (Rejection Sampling)
+    원하는 족보의 상황을 바로 구성하는 함수
+    (족보별 카드 조합 수에 비례한 균등 표본 - 재시도 없이 희귀 족보도 상수 시간)
     """
-    evaluator = HandEvaluator()
-    deck = Deck() # 덱은 루프 안에서 매번 새로 생성해야 함 (섞기 위함)
-    
     card_count = get_card_count_by_phase(target_phase)
-    
-    for attempt in range(max_attempts):
-        deck = Deck() # 새 덱
-        
-        # 1. 내 패 2장
-        hero_cards = [deck.deal(), deck.deal()]
-        
-        # 2. 커뮤니티 카드 (페이즈에 맞게)
-        community_cards = [deck.deal() for _ in range(card_count)]
-        
-        # 3. 족보 확인
-        current_cards = hero_cards + community_cards
-        current_rank, _, _ = evaluator.evaluate_hand(current_cards)
-        
-        # 4. 조건 검사 (Enum의 이름과 문자열 비교)
-        if current_rank.name == target_rank_name:
-            # 찾았다!
-            return hero_cards, community_cards, current_rank.name
-            
-    raise TimeoutError(f"{max_attempts}회 시도 후 {target_phase} 페이즈에서 {target_rank_name} 생성 실패.")
+    hero_cards, community_cards = GENERATOR.sample(card_count, target_rank_name)
+    return hero_cards, community_cards, target_rank_name
 
 def run_targeted_analysis():
-    simulator = MonteCarloSimulator(num_simulations=MC_SIMULATIONS)
+    simulator = VectorMonteCarloSimulator(num_simulations=MC_SIMULATIONS, rng=RNG)
     
     print(f"=== [타겟 분석 모드] ===")
     print(f"설정: [{TARGET_PHASE}] 페이즈에서 내 패가 [{TARGET_RANK_NAME}]인 상황 분석")
@@ -75,26 +61,23 @@ def run_targeted_analysis():
     for i in range(NUM_TEST_CASES):
         try:
             # 1. 조건에 맞는 상황 생성
-            # (희귀한 족보일수록 이 단계에서 시간이 걸릴 수 있습니다)
             hero_cards, community_cards, rank_name = generate_scenario_with_condition(
                 TARGET_PHASE, TARGET_RANK_NAME
             )
             
-            # 2. 시뮬레이션 실행 (병렬 처리)
-            equity = simulator.parallel_simulation(
+            # 2. 시뮬레이션 실행 (NumPy 배열로 전체 시행을 한 번에 처리)
+            equity = simulator.estimate_equity(
                 hole_cards=hero_cards,
                 community_cards=community_cards,
                 num_opponents=1,
-                num_threads=4
-            )
+                target_stderr=TARGET_STD_ERROR
+            ).equity
             
             results.append(equity)
             
             # 3. 개별 결과 출력 (옵션)
             print(f"Case {i+1:02d}: {hero_cards} + {community_cards} -> 승률: {equity*100:6.2f}%")
             
-        except TimeoutError as e:
-            print(f"Case {i+1:02d}: 생성 실패 (너무 희귀한 확률입니다)")
         except Exception as e:
             print(f"Error: {e}")
 
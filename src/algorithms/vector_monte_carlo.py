@@ -0,0 +1,219 @@
+"""
+NumPy 벡터화 몬테카를로 승률 계산
+시행마다 파이썬 루프를 돌지 않고, 모든 런아웃/상대 홀카드를 정수 배열로 한 번에 뽑아 배치 판정
+
+MonteCarloSimulator와 같은 승률(승 1.0, 무 0.5, 패 0.0의 평균)을 계산합니다.
+"""
+
+import time
+from itertools import combinations
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.core.card import Card
+from src.algorithms.batch_evaluator import BoardBatch, evaluate_batch, deal_batch
+from src.algorithms.monte_carlo import (
+    EquityEstimate,
+    MonteCarloSimulator,
+    run_until_precise,
+    target_std_error,
+)
+
+
+class VectorMonteCarloSimulator:
+    """NumPy 배열 기반 몬테카를로 시뮬레이션 클래스"""
+
+    # 한 번에 배열로 만드는 시행 수 (메모리 사용량 상한)
+    BATCH_SIZE = 50000
+
+    # equities_for_hands: 남은 런아웃이 이 수 이하면 전부 나열해 정확히 계산
+    EXACT_RUNOUT_LIMIT = 20000
+
+    def __init__(
+        self,
+        num_simulations: int = 1000,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ):
+        """
+        Args:
+            num_simulations: 스팟당 시행 횟수
+            rng: NumPy 난수 생성기 또는 시드 (기본값: 새 생성기)
+        """
+        self.num_simulations = num_simulations
+        self.rng = np.random.default_rng(rng)
+
+    def calculate_win_probability(
+        self,
+        hole_cards: List[Card],
+        community_cards: List[Card],
+        num_opponents: int = 1
+    ) -> float:
+        """
+        승률 계산
+        반환값: 0.0 ~ 1.0 사이의 승률
+        """
+        hole_ids, board_ids, remaining_ids = MonteCarloSimulator._split_ids(
+            hole_cards, community_cards
+        )
+        total_score = 0.0
+        done = 0
+        while done < self.num_simulations:
+            count = min(self.BATCH_SIZE, self.num_simulations - done)
+            total_score += self.simulate_ids(
+                hole_ids, board_ids, remaining_ids, num_opponents, count
+            ).sum()
+            done += count
+        return float(total_score) / self.num_simulations
+
+    def estimate_equity(
+        self,
+        hole_cards: List[Card],
+        community_cards: List[Card],
+        num_opponents: int = 1,
+        target_stderr: Optional[float] = None,
+        ci_half_width: Optional[float] = None,
+        max_trials: Optional[int] = None,
+        batch_size: int = 2000
+    ) -> EquityEstimate:
+        """
+        목표 정확도에 도달하면 멈추는 적응형 승률 계산
+        (인자와 반환값은 MonteCarloSimulator.estimate_equity와 같음)
+        """
+        target = target_std_error(target_stderr, ci_half_width)
+        hole_ids, board_ids, remaining_ids = MonteCarloSimulator._split_ids(
+            hole_cards, community_cards
+        )
+
+        def run_batch(count: int):
+            scores = self.simulate_ids(hole_ids, board_ids, remaining_ids, num_opponents, count)
+            return float(scores.sum()), float(np.square(scores).sum())
+
+        return run_until_precise(
+            run_batch,
+            target,
+            max_trials or self.num_simulations,
+            min(batch_size, self.BATCH_SIZE),
+            min_trials=batch_size
+        )
+
+    def simulate_ids(
+        self,
+        hole_ids: List[int],
+        board_ids: List[int],
+        remaining_ids: List[int],
+        num_opponents: int,
+        num_trials: int
+    ) -> np.ndarray:
+        """
+        num_trials번의 핸드를 한 번에 시뮬레이션합니다 (정수 카드 id 버전).
+
+        Returns:
+            (num_trials,) float 배열 - 시행별 1.0 (승리), 0.5 (무승부), 0.0 (패배)
+        """
+        board_count = len(board_ids)
+        missing_count = 5 - board_count
+        # 남은 카드가 부족하면 받을 수 있는 상대 수까지만 분배 (안전장치)
+        num_opponents = min(num_opponents, (len(remaining_ids) - missing_count) // 2)
+        dealt_count = 2 * num_opponents
+
+        # 행마다 상대 홀카드(앞 dealt_count장) + 남은 커뮤니티를 비복원 추출
+        drawn = deal_batch(
+            self.rng, num_trials, dealt_count + missing_count, np.asarray(remaining_ids)
+        )
+
+        # (N, 7) 배열: 앞 2칸은 홀카드, 뒤 5칸은 완성된 보드
+        hands = np.empty((num_trials, 7), dtype=np.intp)
+        hands[:, 2:2 + board_count] = board_ids
+        hands[:, 2 + board_count:] = drawn[:, dealt_count:]
+        hands[:, :2] = hole_ids
+        my_score = evaluate_batch(hands)
+
+        if num_opponents == 0:
+            return np.ones(num_trials)
+
+        # 상대 전원의 핸드를 한 배열로 쌓아 배치 판정 한 번으로 점수화
+        opponent_hands = np.tile(hands, (num_opponents, 1))
+        opponent_hands[:, :2] = (
+            drawn[:, :dealt_count].reshape(num_trials, num_opponents, 2)
+            .transpose(1, 0, 2).reshape(-1, 2)
+        )
+        best_opponent = evaluate_batch(opponent_hands).reshape(num_opponents, num_trials).max(axis=0)
+
+        # 가장 강한 상대와만 비교하면 승/무/패가 결정됨
+        return np.where(
+            my_score > best_opponent, 1.0, np.where(my_score == best_opponent, 0.5, 0.0)
+        )
+
+    def equities_for_hands(
+        self,
+        hands: Sequence[Sequence[Card]],
+        community_cards: List[Card],
+        deadline_ms: Optional[float] = None,
+        batch_size: int = 2000
+    ) -> List[float]:
+        """
+        홀카드가 모두 알려진 여러 플레이어의 승률을 같은 런아웃으로 한 번에 계산합니다.
+
+        런아웃마다 모든 핸드를 점수화하고 최고 점수인 플레이어끼리 팟을 나눕니다
+        (k명 동점이면 각자 1/k). 모든 플레이어가 같은 런아웃을 보므로 승률의 합은 항상 1입니다.
+        남은 런아웃이 EXACT_RUNOUT_LIMIT 이하면 전부 나열하고, 아니면 num_simulations개를 뽑습니다.
+
+        Args:
+            hands: 플레이어별 홀카드 2장 목록
+            community_cards: 현재 커뮤니티 카드 (0~5장)
+            deadline_ms: 런아웃을 뽑을 때의 시간 예산 (밀리초, 지나면 batch_size 단위로
+                그때까지 뽑은 런아웃의 평균을 반환, 최소 한 배치)
+            batch_size: deadline_ms가 있을 때 시간을 확인하는 런아웃 수
+
+        Returns:
+            hands와 같은 순서의 승률 목록
+        """
+        deadline = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000.0
+        hole_ids = np.array([[card.id for card in hand] for hand in hands], dtype=np.intp)
+        board_ids = [card.id for card in community_cards]
+        used = hole_ids.ravel().tolist() + board_ids
+        if hole_ids.ndim != 2 or hole_ids.shape[1] != 2 or len(board_ids) > 5:
+            raise ValueError("플레이어마다 홀카드 2장, 보드는 최대 5장이어야 합니다.")
+        if len(set(used)) != len(used):
+            raise ValueError("같은 카드가 두 번 쓰였습니다.")
+        if len(hole_ids) == 1:
+            return [1.0]
+
+        remaining = np.array([card_id for card_id in range(52) if card_id not in set(used)])
+        missing = 5 - len(board_ids)
+        total = 1
+        for k in range(missing):
+            total = total * (len(remaining) - k) // (k + 1)
+        if total <= self.EXACT_RUNOUT_LIMIT:
+            runouts = remaining[
+                np.array(list(combinations(range(len(remaining)), missing)), dtype=np.intp)
+                .reshape(total, missing)
+            ]
+            return (self._runout_shares(hole_ids, board_ids, runouts) / total).tolist()
+
+        shares = np.zeros(len(hole_ids))
+        done = 0
+        while done < self.num_simulations:
+            count = self.num_simulations - done
+            if deadline is not None:
+                count = min(batch_size, count)
+            shares += self._runout_shares(
+                hole_ids, board_ids, deal_batch(self.rng, count, missing, remaining)
+            )
+            done += count
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return (shares / done).tolist()
+
+    @staticmethod
+    def _runout_shares(hole_ids: np.ndarray, board_ids: List[int], runouts: np.ndarray) -> np.ndarray:
+        """런아웃 배열에서 플레이어별로 가져간 팟 몫의 합 (동점이면 1/k씩)"""
+        boards = np.empty((len(runouts), 5), dtype=np.intp)
+        boards[:, :len(board_ids)] = board_ids
+        boards[:, len(board_ids):] = runouts
+        batch = BoardBatch(boards)
+        scores = np.stack([batch.score_hole(first, second) for first, second in hole_ids])
+
+        winners = scores == scores.max(axis=0)
+        return (winners / winners.sum(axis=0)).sum(axis=1)
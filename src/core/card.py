@@ -4,7 +4,7 @@ Card/Deck 클래스 및 Fisher-Yates 셔플 알고리즘
 """
 
 from enum import Enum
-from typing import List
+from typing import Iterable, List, Tuple
 import random
 
 
@@ -48,11 +48,48 @@ class Rank(Enum):
 
 
 class Card:
-    """포커 카드 클래스"""
+    """
+    포커 카드 클래스
 
-    def __init__(self, suit: Suit, rank: Rank):
-        self.suit = suit
-        self.rank = rank
+    52장의 카드는 각각 하나의 인스턴스만 존재합니다 (interning).
+    Card(suit, rank)는 새 객체를 만들지 않고 미리 만들어 둔 카드를 돌려주며,
+    각 카드는 0~51의 정수 id와 미리 계산한 랭크/무늬 비트를 가집니다.
+
+    id = 랭크 인덱스(TWO=0 ... ACE=12) * 4 + 무늬 인덱스(SPADES=0 ... CLUBS=3)
+    """
+
+    __slots__ = ("suit", "rank", "id", "rank_index", "suit_index", "rank_bit", "suit_bit")
+
+    _interned: List["Card"] = []
+
+    def __new__(cls, suit: Suit, rank: Rank):
+        return cls._interned[_RANK_INDEX[rank] * 4 + _SUIT_INDEX[suit]]
+
+    @classmethod
+    def _create(cls, suit: Suit, rank: Rank) -> "Card":
+        card = object.__new__(cls)
+        rank_index = _RANK_INDEX[rank]
+        suit_index = _SUIT_INDEX[suit]
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(card, "id", rank_index * 4 + suit_index)
+        object.__setattr__(card, "rank_index", rank_index)
+        object.__setattr__(card, "suit_index", suit_index)
+        object.__setattr__(card, "rank_bit", 1 << rank_index)
+        object.__setattr__(card, "suit_bit", 1 << suit_index)
+        return card
+
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """정수 id(0~51)에 해당하는 카드 반환"""
+        return cls._interned[card_id]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card는 변경할 수 없습니다")
+
+    def __reduce__(self):
+        # 복사/피클 시에도 같은 인스턴스로 복원
+        return (Card.from_id, (self.id,))
 
     def __str__(self) -> str:
         return f"{self.suit.value}{self.rank.symbol}"
@@ -63,10 +100,33 @@ class Card:
     def __eq__(self, other) -> bool:
         if not isinstance(other, Card):
             return False
-        return self.suit == other.suit and self.rank == other.rank
+        return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash((self.suit, self.rank))
+        return self.id
+
+
+_RANK_INDEX = {rank: i for i, rank in enumerate(Rank)}
+_SUIT_INDEX = {suit: i for i, suit in enumerate(Suit)}
+
+Card._interned = [
+    Card._create(suit, rank)
+    for rank in Rank
+    for suit in Suit
+]
+
+# id 순서로 정렬된 52장 전체
+ALL_CARDS: Tuple[Card, ...] = tuple(Card._interned)
+
+
+def cards_to_ids(cards: Iterable[Card]) -> List[int]:
+    """카드 목록 -> 정수 id 목록"""
+    return [card.id for card in cards]
+
+
+def ids_to_cards(card_ids: Iterable[int]) -> List[Card]:
+    """정수 id 목록 -> 카드 목록"""
+    return [ALL_CARDS[card_id] for card_id in card_ids]
 
 
 class Deck:
@@ -77,17 +137,27 @@ class Deck:
         self.reset()
 
     def reset(self) -> None:
-        """덱을 초기 상태로 리셋"""
-        self.cards = [Card(suit, rank) for suit in Suit for rank in Rank]
-        self.shuffle()
+        """
+        덱을 초기 상태로 리셋
+
+        52장을 미리 섞지 않고 deal()이 한 장씩 Fisher-Yates 단계를 수행합니다.
+        한 핸드에 쓰는 카드는 10여 장뿐이라 전체 셔플보다 훨씬 적은 난수로 같은 분포를 얻습니다.
+        """
+        self.cards = list(ALL_CARDS)
 
     def shuffle(self) -> None:
         """Fisher-Yates 셔플 알고리즘 - O(n) 복잡도"""
         random.shuffle(self.cards)
 
     def deal(self) -> Card:
-        """카드 한 장 뽑기"""
-        return self.cards.pop() if self.cards else None
+        """카드 한 장 뽑기 - 남은 카드 중 무작위 한 장을 맨 뒤와 바꿔 꺼냄 (Fisher-Yates 한 단계)"""
+        cards = self.cards
+        if not cards:
+            return None
+        last = len(cards) - 1
+        pick = random.randrange(last + 1)
+        cards[pick], cards[last] = cards[last], cards[pick]
+        return cards.pop()
 
     def is_empty(self) -> bool:
         """덱이 비어있는지 확인"""
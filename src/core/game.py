@@ -3,11 +3,12 @@
 게임 상태 관리 (FSM), 턴 진행, 베팅 라운드 구현
 """
 
-from typing import List, Optional, Dict, Tuple
+from typing import Callable, List, Optional, Dict, Tuple
 from enum import Enum
 
-from src.core.card import Deck, Card
+from src.core.card import Deck, Card, ALL_CARDS
 from src.core.player import Player
+from src.core.hand_log import EventType, HandEvent, HandEventLog
 from src.algorithms.hand_evaluator import HandEvaluator, HandRank
 
 
@@ -29,6 +30,16 @@ class Action(Enum):
     ALL_IN = "all_in"
 
 
+# 한 스트리트에서 플레이어 수 x 이 값만큼 액션이 나오면 라운드를 끝냄 (무한 루프 방지)
+MAX_ACTIONS_PER_SEAT = 4
+
+# 플레이어 결정 함수: (게임, 차례인 플레이어) -> (Action, amount)
+DecisionFn = Callable[["PokerGame", Player], Tuple["Action", int]]
+
+# 로그 메시지를 받는 함수
+EventSink = Callable[[str], None]
+
+
 class PokerGame:
     """
     텍사스 홀덤 포커 게임 클래스
@@ -41,13 +52,24 @@ class PokerGame:
     - Week 7: 승자 결정, 게임 플로우 테스트, 디버그 기능
     """
 
-    def __init__(self, small_blind: int = 10, big_blind: int = 20):
+    def __init__(
+        self,
+        small_blind: int = 10,
+        big_blind: int = 20,
+        headless: bool = False,
+        event_sink: Optional[EventSink] = None,
+        event_log: Optional[HandEventLog] = None
+    ):
         """
         게임 초기화
 
         Args:
             small_blind: 스몰 블라인드 금액 (기본값: 10)
             big_blind: 빅 블라인드 금액 (기본값: 20)
+            headless: True면 콘솔 출력/입력 없이 진행 (봇 자체 대전용, 모든 플레이어에 결정 함수 필요)
+            event_sink: 로그 메시지를 받을 함수 (헤드리스 모드에서도 호출됨)
+            event_log: 구조화된 핸드 이벤트 로그
+                       (기본값: 최근 이벤트만 보관하는 로그, 헤드리스 모드에서는 기록 안 함)
 
         """
         # 게임 상태 관련
@@ -55,6 +77,7 @@ class PokerGame:
         self.players: List[Player] = []         # 플레이어 목록
         self.community_cards: List[Card] = []   # 커뮤니티 카드
         self.pot = 0                            # 총 팟
+        self.blinds_in_pot = 0                  # 팟에 미리 넣은 블라인드 (collect_bets에서 중복 합산 방지)
         self.side_pots: List[Dict] = []         # 사이드 팟(특정 상황 시)
         self.current_phase = GamePhase.PREFLOP  # 현재 페이즈
         self.dealer_position = 0                # 데일러 위치
@@ -68,41 +91,68 @@ class PokerGame:
         # 턴 진행 관련
         self.last_raiser_index = -1             # 마지막 레이저 플레이어 인덱스
         self.min_raise = big_blind              # 최소 레이즈
+        self.street_actions = 0                 # 이번 베팅 라운드에서 받은 액션 수
 
         # 디버그 모드
         self.debug_mode = False                 # 디버그 모드 활성화 여부
-        self.action_history: List[str] = []     # 게임 진행 중 발생한 액션 기록
+        self.action_history: List[str] = []     # 현재 핸드의 액션 로그 문자열 (new_hand에서 비움)
+        if event_log is None and not headless:
+            event_log = HandEventLog()
+        self.events: Optional[HandEventLog] = event_log  # 구조화된 이벤트 링 버퍼
+        self.hand_id = 0                        # 현재 핸드 번호
         self.last_winners: List[Player] = []    # 마지막 핸드 승자
 
-    def add_player(self, name: str, chips: int = 1000) -> None:
-        """플레이어 추가"""
+        # 헤드리스 모드 관련
+        self.headless = headless                # 콘솔 출력/입력 끄기
+        self.event_sink = event_sink            # 로그 메시지 수신 함수
+        self.decision_makers: Dict[str, DecisionFn] = {}  # 플레이어 이름 -> 결정 함수
+
+    def add_player(self, name: str, chips: int = 1000, decide: Optional[DecisionFn] = None) -> None:
+        """
+        플레이어 추가
+
+        Args:
+            name: 플레이어 이름
+            chips: 초기 칩 수
+            decide: 결정 함수 (없으면 콘솔 입력으로 액션을 받음)
+        """
         player = Player(name, chips)
         self.players.append(player)
+        if decide is not None:
+            self.decision_makers[player.name] = decide
 
     def start(self) -> None:
         """게임 시작"""
         if len(self.players) < 2:
-            print("게임을 시작하려면 최소 2명의 플레이어가 필요합니다.")
+            if not self.headless:
+                print("게임을 시작하려면 최소 2명의 플레이어가 필요합니다.")
             return
 
-        print("새 핸드를 시작합니다...")
+        if not self.headless:
+            print("새 핸드를 시작합니다...")
         self.new_hand()
 
     def new_hand(self) -> None:
         """새 핸드 시작"""
-        # 게임 초기화 로직
+        # 게임 초기화 로직 (reset은 52장을 되돌리기만 하고 deal()이 무작위로 뽑으므로 별도 셔플 없음)
         self.deck.reset()
-        self.deck.shuffle()
         self.community_cards = []
         self.pot = 0
+        self.blinds_in_pot = 0
         self.current_phase = GamePhase.PREFLOP
         self.current_bet = 0
+        self.min_raise = self.big_blind
+        self.street_actions = 0
         self.last_winners = []
+        self.action_history = []
 
         # 플레이어 상태 리셋
         for player in self.players:
             player.reset_for_new_hand()
 
+        self.hand_id = self.events.start_hand() if self.events is not None else self.hand_id + 1
+        self.record_event(EventType.HAND_START, self.dealer_position, self.big_blind)
+
         # 홀 카드 딜링
         self.deal_hole_cards()
         self.display_game_state()
@@ -113,6 +163,9 @@ class PokerGame:
             for player in self.players:
                 if player.is_active:
                     player.receive_card(self.deck.deal())
+        # 블라인드 전이므로 칩은 핸드 시작 시 칩
+        for seat, player in enumerate(self.players):
+            self.record_event(EventType.SEAT, seat, player.chips, tuple(card.id for card in player.hand))
 
     def deal_flop(self) -> None:
         """플롭 딜링 (3장)"""
@@ -121,6 +174,7 @@ class PokerGame:
         for _ in range(3):
             self.community_cards.append(self.deck.deal())
         self.current_phase = GamePhase.FLOP
+        self.record_event(EventType.BOARD, cards=tuple(card.id for card in self.community_cards[-3:]))
 
     def deal_turn(self) -> None:
         """턴 딜링 (1장)"""
@@ -128,6 +182,7 @@ class PokerGame:
         self.deck.deal()  # Burn card
         self.community_cards.append(self.deck.deal())
         self.current_phase = GamePhase.TURN
+        self.record_event(EventType.BOARD, cards=tuple(card.id for card in self.community_cards[-1:]))
 
     def deal_river(self) -> None:
         """리버 딜링 (1장)"""
@@ -135,9 +190,13 @@ class PokerGame:
         self.deck.deal()  # Burn card
         self.community_cards.append(self.deck.deal())
         self.current_phase = GamePhase.RIVER
+        self.record_event(EventType.BOARD, cards=tuple(card.id for card in self.community_cards[-1:]))
 
     def display_game_state(self) -> None:
         """현재 게임 상태 출력"""
+        if self.headless:
+            return
+
         print(f"\n--- 게임 상태 ---")
         print(f"단계: {self.current_phase.value}")
         print(f"팟: {self.pot}")
@@ -185,26 +244,22 @@ class PokerGame:
         Returns:
             모든 플레이어가 같은 금액을 베팅했거나 폴드/올인한 경우 True
         """
-        active_players = self.get_active_players()
-
-        if len(active_players) <= 1:
-            return True
-
-        players_who_can_act = self.get_players_who_can_act()
-
-        # 액션 가능한 플레이어가 없으면 라운드 종료
-        if not players_who_can_act:
-            return True
-
-        # 모든 액션 가능한 플레이어가 같은 금액을 베팅했는지 확인
-        for player in players_who_can_act:
-            if player.current_bet != self.current_bet:
-                return False
-            # 추가: 이번 라운드에서 액션을 취했는지 확인 (BB 옵션 등 처리)
-            if not player.acted_this_round:
-                return False
+        # 베팅 루프에서 매 액션마다 불리므로 목록을 만들지 않고 한 번에 훑음
+        num_active = 0
+        waiting = False
+        for player in self.players:
+            if player.has_folded or not player.is_active:
+                continue
+            num_active += 1
+            if player.is_all_in:
+                continue
+            # 액션 가능한 플레이어가 같은 금액을 베팅하지 않았거나
+            # 이번 라운드에서 아직 액션을 취하지 않았으면 (BB 옵션 등) 계속 진행
+            if player.current_bet != self.current_bet or not player.acted_this_round:
+                waiting = True
 
-        return True
+        # 한 명만 남았거나 액션 가능한 플레이어가 없으면 라운드 종료
+        return num_active <= 1 or not waiting
 
     # ===== 베팅 라운드 구현 =====
 
@@ -219,6 +274,8 @@ class PokerGame:
         if sb_player.can_act():
             sb_amount = sb_player.bet(min(self.small_blind, sb_player.chips))
             self.pot += sb_amount
+            self.blinds_in_pot += sb_amount
+            self.record_event(EventType.BLIND, sb_position, sb_amount)
             self.log_action(f"{sb_player.name}가 스몰 블라인드 {sb_amount} 베팅")
             # 블라인드 포스팅은 자발적 액션이 아니므로 acted_this_round는 False 유지 (옵션 위해)
 
@@ -228,7 +285,9 @@ class PokerGame:
         if bb_player.can_act():
             bb_amount = bb_player.bet(min(self.big_blind, bb_player.chips))
             self.pot += bb_amount
+            self.blinds_in_pot += bb_amount
             self.current_bet = bb_amount
+            self.record_event(EventType.BLIND, bb_position, bb_amount)
             self.log_action(f"{bb_player.name}가 빅 블라인드 {bb_amount} 베팅")
             # 블라인드 포스팅은 자발적 액션이 아니므로 acted_this_round는 False 유지
 
@@ -258,10 +317,10 @@ class PokerGame:
             # (블라인드 플레이어도 옵션이 있으므로 False 상태여야 함)
             pass
 
-        rounds_without_action = 0
-        max_rounds = len(self.players) * 4  # 무한 루프 방지 (넉넉하게)
+        self.street_actions = 0
+        max_rounds = len(self.players) * MAX_ACTIONS_PER_SEAT  # 무한 루프 방지 (넉넉하게)
 
-        while not self.is_betting_round_complete() and rounds_without_action < max_rounds:
+        while not self.is_betting_round_complete() and self.street_actions < max_rounds:
             player = self.players[self.current_player_index]
 
             if not player.can_act():
@@ -274,21 +333,30 @@ class PokerGame:
 
             # 다음 플레이어로
             self.current_player_index = (self.current_player_index + 1) % len(self.players)
-            rounds_without_action += 1
+            self.street_actions += 1
 
         # 라운드 종료 후 팟에 베팅 추가
         self.collect_bets()
 
     def get_player_action(self, player: Player) -> Tuple[Action, int]:
         """
-        플레이어로부터 액션을 받음 (임시로 간단한 입력 처리)
+        플레이어로부터 액션을 받음 (결정 함수가 없으면 콘솔 입력)
 
         Args:
             player: 액션을 수행할 플레이어
 
         Returns:
             (Action, amount) 튜플
+
+        Raises:
+            RuntimeError: 헤드리스 모드에서 결정 함수가 없는 플레이어의 차례일 때
         """
+        decide = self.decision_makers.get(player.name)
+        if decide is not None:
+            return decide(self, player)
+        if self.headless:
+            raise RuntimeError(f"헤드리스 모드에서는 결정 함수가 필요합니다: {player.name}")
+
         print(f"\n{player.name}의 차례 (칩: {player.chips}, 현재 베팅: {player.current_bet})")
         print(f"현재 콜 금액: {self.current_bet - player.current_bet}")
 
@@ -351,17 +419,21 @@ class PokerGame:
         베팅 액션 처리, 올인 상황 처리
         """
         player.acted_this_round = True # 액션 수행 표시
+        seat = self.players.index(player)  # 현재 차례가 아닌 플레이어도 자기 자리로 기록
 
         if action == Action.FOLD:
             player.fold()
+            self.record_event(EventType.FOLD, seat)
             self.log_action(f"{player.name}가 폴드했습니다")
 
         elif action == Action.CHECK:
+            self.record_event(EventType.CHECK, seat)
             self.log_action(f"{player.name}가 체크했습니다")
 
         elif action == Action.CALL:
             call_amount = self.current_bet - player.current_bet
             actual_bet = player.bet(call_amount)
+            self.record_event(EventType.CALL, seat, actual_bet)
             self.log_action(f"{player.name}가 {actual_bet} 콜했습니다")
 
             if player.is_all_in:
@@ -383,6 +455,7 @@ class PokerGame:
                 if p != player:
                     p.acted_this_round = False
 
+            self.record_event(EventType.RAISE, seat, actual_bet)
             self.log_action(f"{player.name}가 {actual_bet} 레이즈했습니다 (현재 베팅: {self.current_bet})")
 
             if player.is_all_in:
@@ -402,16 +475,18 @@ class PokerGame:
                     if p != player:
                         p.acted_this_round = False
 
+            self.record_event(EventType.ALL_IN, seat, actual_bet)
             self.log_action(f"{player.name}가 {actual_bet}으로 올인했습니다!")
 
     def collect_bets(self) -> None:
-        """현재 베팅을 팟에 추가"""
+        """현재 베팅을 팟에 추가 (블라인드는 post_blinds에서 이미 팟에 들어가 있으므로 제외)"""
         total_collected = 0
         for player in self.players:
             total_collected += player.current_bet
             player.current_bet = 0
 
-        self.pot += total_collected
+        self.pot += total_collected - self.blinds_in_pot
+        self.blinds_in_pot = 0
         self.current_bet = 0
 
     def calculate_side_pots(self) -> None:
@@ -466,22 +541,22 @@ class PokerGame:
         if len(active_players) == 1:
             return active_players
 
-        # 모든 활성 플레이어의 핸드 평가
+        # 모든 활성 플레이어의 핸드 평가 (보드는 한 번만 분석)
+        board = HandEvaluator.prepare_board(self.community_cards)
+        logging = self.is_logging()
         player_hands = []
         for player in active_players:
-            # 홀 카드와 커뮤니티 카드 결합
-            full_hand = player.hand + self.community_cards
-            rank, kickers, best_cards = HandEvaluator.evaluate_hand(full_hand)
+            score = board.score_cards(player.hand)
             player_hands.append({
                 'player': player,
-                'rank': rank,
-                'kickers': kickers,
-                'best_cards': best_cards,
-                'score_key': (rank.value, kickers)
+                'score_key': score
             })
             
-            # 핸드 결과 로깅
-            self.log_action(f"{player.name}: {rank.korean_name} ({', '.join(str(c) for c in best_cards)})")
+            # 핸드 결과 로깅 (족보 이름과 최상 5장은 표시할 때만 계산)
+            if logging:
+                rank, _ = HandEvaluator.decode_score(score)
+                best_cards = HandEvaluator.best_hand_cards(player.hand + self.community_cards, score)
+                self.log_action(f"{player.name}: {rank.korean_name} ({', '.join(str(c) for c in best_cards)})")
 
         # 최고의 점수 키 찾기
         best_score_key = max(p['score_key'] for p in player_hands)
@@ -512,6 +587,7 @@ class PokerGame:
                     for i, winner in enumerate(eligible_winners):
                         amount = share + (1 if i < remainder else 0)
                         winner.chips += amount
+                        self.record_event(EventType.WIN, self.players.index(winner), amount)
                         self.log_action(f"{winner.name}가 사이드 팟에서 {amount} 획득")
         else:
             # 메인 팟만 분배
@@ -521,6 +597,7 @@ class PokerGame:
             for i, winner in enumerate(winners):
                 amount = share + (1 if i < remainder else 0)
                 winner.chips += amount
+                self.record_event(EventType.WIN, self.players.index(winner), amount)
                 self.log_action(f"{winner.name}가 {amount} 획득")
 
         # 팟 초기화
@@ -538,22 +615,26 @@ class PokerGame:
 
         active_players = self.get_active_players()
 
-        print("\n참가자 핸드:")
-        for player in active_players:
-            hand_str = ", ".join([str(card) for card in player.hand])
-            print(f"  {player.name}: {hand_str}")
+        if not self.headless:
+            print("\n참가자 핸드:")
+            for player in active_players:
+                hand_str = ", ".join([str(card) for card in player.hand])
+                print(f"  {player.name}: {hand_str}")
 
-        community_str = ", ".join([str(card) for card in self.community_cards])
-        print(f"커뮤니티 카드: {community_str}")
+            community_str = ", ".join([str(card) for card in self.community_cards])
+            print(f"커뮤니티 카드: {community_str}")
 
         # 승자 결정
         winners = self.determine_winner()
         self.last_winners = winners  # 승자 저장
 
-        print(f"\n승자: {', '.join([w.name for w in winners])}")
+        if not self.headless:
+            print(f"\n승자: {', '.join([w.name for w in winners])}")
 
         # 팟 분배
         self.distribute_pot(winners)
+        if self.events is not None:
+            self.events.end_hand()
 
         self.log_action("========== 핸드 종료 ==========\n")
 
@@ -584,6 +665,53 @@ class PokerGame:
         elif self.current_phase == GamePhase.RIVER:
             self.showdown()
 
+    # ===== 상태 스냅샷 =====
+
+    def snapshot(self):
+        """
+        현재 테이블 상태를 불변 TableState로 반환 (O(플레이어 수 + 덱))
+
+        트리 탐색, What-if 분석, 웹 테이블 복구 등에서 restore()와 함께 사용합니다.
+        결정 함수/출력 설정/액션 기록은 포함하지 않습니다.
+
+        Returns:
+            TableState (src.core.table_state)
+        """
+        from src.core.table_state import from_game
+
+        return from_game(self)
+
+    def restore(self, state) -> None:
+        """
+        snapshot()으로 만든 TableState로 테이블 상태를 되돌림
+
+        플레이어 수가 같으면 기존 Player 객체를 그대로 두고 값만 덮어씁니다.
+
+        Args:
+            state: 되돌릴 TableState
+        """
+        if len(self.players) == len(state.seats):
+            for player, seat in zip(self.players, state.seats):
+                player.restore(seat)
+        else:
+            self.players = [Player.from_snapshot(seat) for seat in state.seats]
+
+        self.community_cards = [ALL_CARDS[card_id] for card_id in state.community]
+        self.deck.cards = [ALL_CARDS[card_id] for card_id in state.deck]
+        self.pot = state.pot
+        self.blinds_in_pot = state.blinds_in_pot
+        self.side_pots = []
+        self.current_bet = state.current_bet
+        self.min_raise = state.min_raise
+        self.current_phase = state.phase
+        self.dealer_position = state.dealer_position
+        self.current_player_index = state.current_player_index
+        self.last_raiser_index = state.last_raiser_index
+        self.street_actions = state.street_actions
+        self.small_blind = state.small_blind
+        self.big_blind = state.big_blind
+        self.last_winners = [self.players[index] for index in state.winners]
+
     # ===== 디버그 기능 =====
 
     def enable_debug_mode(self) -> None:
@@ -596,16 +724,50 @@ class PokerGame:
         self.debug_mode = False
         print("디버그 모드가 비활성화되었습니다.")
 
+    def is_logging(self) -> bool:
+        """로그 메시지를 받을 곳이 있는지 (헤드리스 + 싱크 없음이면 False)"""
+        return not self.headless or self.event_sink is not None
+
     def log_action(self, message: str) -> None:
         """
         액션 로깅
 
-        게임 진행 상황 추적
+        게임 진행 상황 추적 (헤드리스 모드에서는 이벤트 싱크로만 전달)
         """
+        if self.event_sink is not None:
+            self.event_sink(message)
+        if self.headless:
+            return
+
         self.action_history.append(message)
         if self.debug_mode or True:  # 항상 출력
             print(message)
 
+    def record_event(
+        self,
+        event_type: EventType,
+        seat: int = -1,
+        amount: int = 0,
+        cards: Tuple[int, ...] = ()
+    ) -> None:
+        """
+        구조화된 핸드 이벤트 기록 (이벤트 로그가 없으면 무시)
+
+        pot은 아직 모으지 않은 베팅까지 포함한 이번 핸드의 총액입니다.
+
+        Args:
+            event_type: 이벤트 종류
+            seat: 플레이어 인덱스 (테이블 이벤트는 -1)
+            amount: 칩 수
+            cards: 정수 카드 id
+        """
+        if self.events is None:
+            return
+        pot = self.pot - self.blinds_in_pot
+        for player in self.players:
+            pot += player.current_bet
+        self.events.record(HandEvent(self.hand_id, self.current_phase, seat, event_type, amount, pot, cards))
+
     def print_action_history(self) -> None:
         """액션 히스토리 출력"""
         print("\n========== 액션 히스토리 ==========")
@@ -651,14 +813,20 @@ class PokerGame:
             if len(self.get_active_players()) <= 1:
                 winner = self.get_active_players()[0]
                 self.log_action(f"\n{winner.name}가 유일한 참가자로 팟 {self.pot} 획득!")
+                self.record_event(EventType.WIN, self.players.index(winner), self.pot)
                 winner.chips += self.pot
                 self.pot = 0
+                if self.events is not None:
+                    self.events.end_hand()
                 self.last_winners = [winner] # 조기 승리도 승자 저장
                 break
 
             self.advance_phase()
 
         # 최종 상태 표시
+        if self.headless:
+            return
+
         print("\n========== 최종 결과 ==========")
         for player in self.players:
             print(f"{player.name}: {player.chips} chips")
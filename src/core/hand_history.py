@@ -0,0 +1,342 @@
+"""
+핸드 히스토리 파일 - 끝난 핸드 이벤트를 압축 바이너리로 이어 쓰고 다시 읽기/재실행
+
+데이터 파일 (이어 쓰기 전용):
+    헤더 8바이트: magic "HHIS" | 형식 버전 u16 | 0 패딩
+    핸드 레코드:  페이로드 길이 varint | 페이로드
+    페이로드:     hand_id varint | 이벤트 수 varint | 이벤트...
+    이벤트:       (종류 코드 << 3 | 스트리트 코드) u8 | seat + 1 varint | amount varint
+                  | SEAT/BOARD만: 카드 수 u8 + 카드 id u8 x 카드 수
+
+인덱스 파일 (데이터 파일 경로 + ".idx"):
+    헤더 8바이트: magic "HHIX" | 형식 버전 u16 | 0 패딩
+    핸드별 레코드 시작 위치 u64 (리틀 엔디언) -> n번째 핸드로 바로 이동
+
+pot은 베팅 이벤트 amount의 누적합이라 저장하지 않고 읽을 때 다시 계산합니다.
+varint는 7비트씩 끊어 쓰는 부호 없는 LEB128이며, 대부분의 값이 1바이트에 들어갑니다.
+"""
+
+import os
+import struct
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from src.core.game import Action, GamePhase
+from src.core.hand_log import EventType, HandEvent
+from src.core import table_state
+from src.core.table_state import TableState
+
+
+MAGIC = b"HHIS"
+INDEX_MAGIC = b"HHIX"
+FORMAT_VERSION = 1
+HEADER_SIZE = 8
+
+_HEADER = struct.Struct("<4sH")
+
+# 파일에 기록되는 코드 순서 (형식의 일부이므로 바꾸지 말고 뒤에만 추가)
+EVENT_TYPES: Tuple[EventType, ...] = (
+    EventType.HAND_START, EventType.SEAT, EventType.BLIND, EventType.FOLD, EventType.CHECK,
+    EventType.CALL, EventType.RAISE, EventType.ALL_IN, EventType.BOARD, EventType.WIN,
+)
+STREETS: Tuple[GamePhase, ...] = (
+    GamePhase.PREFLOP, GamePhase.FLOP, GamePhase.TURN, GamePhase.RIVER, GamePhase.SHOWDOWN,
+)
+
+_TYPE_CODE = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+_STREET_CODE = {street: code for code, street in enumerate(STREETS)}
+_CARD_TYPES = frozenset(_TYPE_CODE[event_type] for event_type in (EventType.SEAT, EventType.BOARD))
+_BET_TYPES = frozenset(
+    _TYPE_CODE[event_type]
+    for event_type in (EventType.BLIND, EventType.CALL, EventType.RAISE, EventType.ALL_IN)
+)
+
+# 재실행 시 이벤트 종류 -> 엔진 액션
+_ACTIONS = {
+    EventType.FOLD: Action.FOLD,
+    EventType.CHECK: Action.CHECK,
+    EventType.CALL: Action.CALL,
+    EventType.RAISE: Action.RAISE,
+    EventType.ALL_IN: Action.ALL_IN,
+}
+
+
+# ===== varint =====
+
+def write_varint(out: bytearray, value: int) -> None:
+    """음이 아닌 정수를 LEB128 varint로 덧붙임"""
+    if value < 0:
+        raise ValueError("varint는 음이 아닌 정수만 기록할 수 있습니다.")
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """pos에서 varint 하나를 읽음 -> (값, 다음 위치)"""
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos + 1
+        shift += 7
+
+
+# ===== 핸드 인코딩 =====
+
+def encode_hand(events: Sequence[HandEvent]) -> bytes:
+    """한 핸드의 이벤트 목록 -> 페이로드"""
+    if not events:
+        raise ValueError("빈 핸드는 기록할 수 없습니다.")
+    out = bytearray()
+    write_varint(out, events[0].hand_id)
+    write_varint(out, len(events))
+    for event in events:
+        code = _TYPE_CODE[event.type]
+        out.append(code << 3 | _STREET_CODE[event.street])
+        write_varint(out, event.seat + 1)
+        write_varint(out, event.amount)
+        if code in _CARD_TYPES:
+            out.append(len(event.cards))
+            out.extend(event.cards)
+    return bytes(out)
+
+
+def decode_hand(data: bytes, pos: int = 0) -> Tuple[List[HandEvent], int]:
+    """페이로드 시작 위치에서 한 핸드를 읽음 -> (이벤트 목록, 다음 위치)"""
+    hand_id, pos = read_varint(data, pos)
+    count, pos = read_varint(data, pos)
+    events = []
+    pot = 0
+    for _ in range(count):
+        header = data[pos]
+        code = header >> 3
+        # seat + 1과 amount는 거의 항상 1바이트 (varint 빠른 경로)
+        seat = data[pos + 1]
+        if seat < 0x80:
+            pos += 2
+        else:
+            seat, pos = read_varint(data, pos + 1)
+        amount = data[pos]
+        if amount < 0x80:
+            pos += 1
+        else:
+            amount, pos = read_varint(data, pos)
+        cards = ()
+        if code in _CARD_TYPES:
+            end = pos + 1 + data[pos]
+            cards = tuple(data[pos + 1:end])
+            pos = end
+        if code in _BET_TYPES:
+            pot += amount
+        events.append(HandEvent(
+            hand_id, STREETS[header & 7], seat - 1, EVENT_TYPES[code], amount, pot, cards
+        ))
+    return events, pos
+
+
+# ===== 파일 =====
+
+def _check_header(raw: bytes, magic: bytes, path: str) -> None:
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"핸드 히스토리 파일 헤더가 잘렸습니다: {path}")
+    file_magic, version = _HEADER.unpack(raw[:_HEADER.size])
+    if file_magic != magic:
+        raise ValueError(f"핸드 히스토리 파일이 아닙니다: {path}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 핸드 히스토리 형식 버전입니다: {version}")
+
+
+def _open_append(path: str, magic: bytes):
+    """헤더를 확인(없으면 기록)한 뒤 이어 쓰기용으로 연 파일"""
+    f = open(path, "ab+")
+    f.seek(0)
+    raw = f.read(HEADER_SIZE)
+    if raw:
+        _check_header(raw, magic, path)
+    else:
+        f.write(_HEADER.pack(magic, FORMAT_VERSION).ljust(HEADER_SIZE, b"\0"))
+    f.seek(0, os.SEEK_END)
+    return f
+
+
+class HandHistoryWriter:
+    """
+    핸드 히스토리 이어 쓰기
+
+    HandEventLog의 archive로 바로 넘길 수 있습니다.
+
+        writer = HandHistoryWriter("hands.hh")
+        game = PokerGame(event_log=HandEventLog(archive=writer))
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 데이터 파일 경로 (있으면 뒤에 이어 씀, 인덱스는 path + ".idx")
+        """
+        self.path = path
+        self.data_file = _open_append(path, MAGIC)
+        self.index_file = _open_append(path + ".idx", INDEX_MAGIC)
+
+    def write_hand(self, events: Sequence[HandEvent]) -> None:
+        """한 핸드 기록 (인덱스에 레코드 시작 위치 추가)"""
+        payload = encode_hand(events)
+        record = bytearray()
+        write_varint(record, len(payload))
+        record += payload
+        offset = self.data_file.tell()
+        self.data_file.write(record)
+        self.index_file.write(struct.pack("<Q", offset))
+
+    __call__ = write_hand
+
+    def flush(self) -> None:
+        self.data_file.flush()
+        self.index_file.flush()
+
+    def close(self) -> None:
+        self.data_file.close()
+        self.index_file.close()
+
+    def __enter__(self) -> "HandHistoryWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class HandHistoryReader:
+    """
+    핸드 히스토리 읽기
+
+    인덱스로 n번째 핸드를 바로 읽거나, 처음부터 순서대로 훑습니다.
+    인덱스 파일이 없거나 데이터보다 짧으면(쓰는 도중 종료 등) 빠진 부분을 데이터에서 다시 찾습니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 데이터 파일 경로
+        """
+        with open(path, "rb") as f:
+            self.data = f.read()
+        _check_header(self.data, MAGIC, path)
+        self.offsets = self._load_offsets(path + ".idx")
+
+    def _load_offsets(self, index_path: str) -> np.ndarray:
+        offsets = np.zeros(0, dtype="<u8")
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                _check_header(f.read(HEADER_SIZE), INDEX_MAGIC, index_path)
+            offsets = np.fromfile(index_path, dtype="<u8", offset=HEADER_SIZE)
+
+        # 데이터가 잘려 끝나지 않은 레코드를 가리키는 인덱스 항목은 버림
+        while len(offsets) and self._record_end(int(offsets[-1])) is None:
+            offsets = offsets[:-1]
+
+        # 인덱스 뒤에 남은 레코드를 길이 접두어로 따라가며 보충
+        pos = self._record_end(int(offsets[-1])) if len(offsets) else HEADER_SIZE
+        extra = []
+        end = self._record_end(pos)
+        while end is not None:
+            extra.append(pos)
+            pos, end = end, self._record_end(end)
+        if extra:
+            offsets = np.concatenate([offsets, np.array(extra, dtype="<u8")])
+        return offsets
+
+    def _record_end(self, pos: int):
+        """pos에서 시작하는 레코드의 끝 위치 (레코드가 없거나 잘렸으면 None)"""
+        try:
+            length, start = read_varint(self.data, pos)
+        except IndexError:
+            return None
+        return start + length if start + length <= len(self.data) else None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> List[HandEvent]:
+        """index번째 핸드의 이벤트 목록"""
+        _, start = read_varint(self.data, int(self.offsets[index]))
+        return decode_hand(self.data, start)[0]
+
+    def __iter__(self) -> Iterator[List[HandEvent]]:
+        """모든 핸드를 파일 순서대로"""
+        data = self.data
+        for offset in self.offsets.tolist():
+            _, start = read_varint(data, offset)
+            yield decode_hand(data, start)[0]
+
+
+# ===== 재실행 =====
+
+def replay_hand(events: Sequence[HandEvent]) -> TableState:
+    """
+    기록된 핸드를 순수 상태 API(table_state)로 다시 실행한 최종 상태
+
+    홀카드/보드가 기록과 같도록 덱을 다시 구성하고 기록된 액션을 순서대로 적용합니다.
+
+    Raises:
+        ValueError: 기록된 액션이 규칙상 불가능하거나 결과(승자/칩)가 기록과 다를 때
+    """
+    dealer_position = big_blind = 0
+    stacks: List[int] = []
+    holes: List[Tuple[int, ...]] = []
+    blinds = {}
+    board: List[int] = []
+    actions: List[HandEvent] = []
+    wins = {}
+    for event in events:
+        if event.type == EventType.HAND_START:
+            dealer_position, big_blind = event.seat, event.amount
+        elif event.type == EventType.SEAT:
+            stacks.append(event.amount)
+            holes.append(event.cards)
+        elif event.type == EventType.BLIND:
+            blinds[event.seat] = event.amount
+        elif event.type == EventType.BOARD:
+            board.extend(event.cards)
+        elif event.type == EventType.WIN:
+            wins[event.seat] = wins.get(event.seat, 0) + event.amount
+        else:
+            actions.append(event)
+
+    # 딜 순서: 홀카드 두 바퀴 -> (번 카드 + 보드) x 3, 번 카드/안 깔린 보드는 남는 카드로 채움
+    used = {card_id for hole in holes for card_id in hole} | set(board)
+    spare = iter([card_id for card_id in range(52) if card_id not in used])
+    deal_order = [hole[round_index] for round_index in range(2) for hole in holes if hole]
+    streets = [board[:3], board[3:4], board[4:5]]
+    for street, count in zip(streets, (3, 1, 1)):
+        deal_order.append(next(spare))
+        deal_order.extend(street + [next(spare) for _ in range(count - len(street))])
+
+    # 스몰 블라인드는 실제 낸 금액을 그대로 크기로 사용 (숏스택이어도 같은 금액이 나감)
+    small_blind = blinds.get((dealer_position + 1) % len(stacks), big_blind // 2)
+    state = table_state.start_hand(
+        stacks, dealer_position, small_blind, big_blind, deck=deal_order[::-1]
+    )
+    for event in actions:
+        if state.is_over or state.current_player_index != event.seat:
+            raise ValueError(f"기록과 차례가 다릅니다: 핸드 {event.hand_id}, 좌석 {event.seat}")
+        amount = event.amount - state.call_amount() if event.type == EventType.RAISE else 0
+        state = table_state.apply(state, (_ACTIONS[event.type], amount))
+
+    expected = list(stacks)
+    for event in events:
+        if _TYPE_CODE[event.type] in _BET_TYPES:
+            expected[event.seat] -= event.amount
+    for seat, amount in wins.items():
+        expected[seat] += amount
+    if not state.is_over or [seat.chips for seat in state.seats] != expected:
+        raise ValueError(f"재실행 결과가 기록과 다릅니다: 핸드 {events[0].hand_id}")
+    return state
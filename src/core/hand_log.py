@@ -0,0 +1,99 @@
+"""
+핸드 이벤트 로그 - 구조화된 이벤트를 고정 크기 링 버퍼에 보관
+
+PokerGame.action_history(표시용 문자열)와 달리 이벤트는 분석용 값 그대로 남깁니다.
+- 끝난 핸드의 이벤트는 최근 capacity개만 메모리에 유지 (오래 켜 둔 테이블도 메모리 일정)
+- 끝난 핸드의 이벤트 목록은 archive 함수로 넘겨 파일/DB 등에 보관
+"""
+
+from collections import deque
+from enum import Enum
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Deque, Iterator, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.core.game import GamePhase
+
+
+class EventType(Enum):
+    """이벤트 종류 (액션 5종은 Action과 같은 값)"""
+    HAND_START = "hand_start"   # seat: 딜러 위치, amount: 빅 블라인드
+    SEAT = "seat"               # amount: 핸드 시작 시 칩, cards: 홀카드 2장
+    BLIND = "blind"             # amount: 블라인드 금액
+    FOLD = "fold"
+    CHECK = "check"
+    CALL = "call"               # amount: 실제로 낸 칩
+    RAISE = "raise"             # amount: 실제로 낸 칩 (콜 금액 포함)
+    ALL_IN = "all_in"           # amount: 실제로 낸 칩
+    BOARD = "board"             # cards: 이번 스트리트에 깔린 카드
+    WIN = "win"                 # amount: 받은 칩
+
+
+class HandEvent(NamedTuple):
+    """
+    핸드 이벤트 하나
+
+    seat은 PokerGame.players 인덱스(테이블 이벤트는 -1), pot은 이벤트 직후
+    이번 핸드에 들어간 칩 총액(아직 모으지 않은 베팅 포함), cards는 정수 카드 id입니다.
+    """
+    hand_id: int
+    street: "GamePhase"
+    seat: int
+    type: EventType
+    amount: int
+    pot: int
+    cards: Tuple[int, ...] = ()
+
+
+# 끝난 핸드의 이벤트 목록을 받는 함수
+HandArchive = Callable[[List[HandEvent]], None]
+
+
+class HandEventLog:
+    """
+    최근 이벤트 링 버퍼 + 핸드 단위 아카이브
+
+    진행 중인 핸드의 이벤트는 current_hand에 모았다가 end_hand()에서 한 번에 버퍼로 옮깁니다.
+    """
+
+    DEFAULT_CAPACITY = 4096
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, archive: Optional[HandArchive] = None):
+        """
+        Args:
+            capacity: 메모리에 남길 최근 이벤트 수
+            archive: 핸드가 끝날 때마다 그 핸드의 이벤트 목록을 받을 함수
+        """
+        self.events: Deque[HandEvent] = deque(maxlen=capacity)
+        self.archive = archive
+        self.hand_id = 0
+        self.current_hand: List[HandEvent] = []
+
+    def start_hand(self) -> int:
+        """새 핸드 번호 발급 (끝내지 않은 이전 핸드가 있으면 먼저 아카이브)"""
+        if self.current_hand:
+            self.end_hand()
+        self.hand_id += 1
+        return self.hand_id
+
+    def record(self, event: HandEvent) -> None:
+        """진행 중인 핸드에 이벤트 추가"""
+        self.current_hand.append(event)
+
+    def end_hand(self) -> None:
+        """현재 핸드를 버퍼로 옮기고 (가장 오래된 이벤트는 밀려남) 아카이브로 넘김"""
+        hand, self.current_hand = self.current_hand, []
+        self.events.extend(hand)
+        if self.archive is not None and hand:
+            self.archive(hand)
+
+    def hand(self, hand_id: int) -> List[HandEvent]:
+        """메모리에 남아 있는 특정 핸드의 이벤트"""
+        return [event for event in self if event.hand_id == hand_id]
+
+    def __len__(self) -> int:
+        return len(self.events) + len(self.current_hand)
+
+    def __iter__(self) -> Iterator[HandEvent]:
+        """버퍼의 끝난 핸드 이벤트 다음에 진행 중인 핸드 이벤트"""
+        return chain(self.events, self.current_hand)
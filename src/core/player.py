@@ -4,7 +4,7 @@
 """
 
 from typing import List
-from src.core.card import Card
+from src.core.card import Card, ALL_CARDS
 
 
 class Player:
@@ -141,6 +141,61 @@ class Player:
         self.acted_this_round = False
         self.is_active = self.chips > 0
 
+    # 상태 스냅샷 (트리 탐색 / What-if 분석 / 테이블 복구용)
+
+    def snapshot(self):
+        """
+        현재 상태를 불변 SeatState로 반환 (카드는 정수 id)
+
+        Returns:
+            SeatState (src.core.table_state)
+        """
+        from src.core.table_state import SeatState
+
+        return SeatState(
+            self.name,
+            self.chips,
+            self.current_bet,
+            tuple(card.id for card in self.hand),
+            self.is_active,
+            self.has_folded,
+            self.is_all_in,
+            self.acted_this_round,
+        )
+
+    def restore(self, seat) -> None:
+        """
+        snapshot()으로 만든 SeatState로 상태를 되돌림
+
+        Args:
+            seat: 되돌릴 SeatState
+        """
+        (self.name, self.chips, self.current_bet, hole,
+         self.is_active, self.has_folded, self.is_all_in, self.acted_this_round) = seat
+        self.hand = [ALL_CARDS[card_id] for card_id in hole]
+
+    @classmethod
+    def from_snapshot(cls, seat) -> "Player":
+        """
+        SeatState로 새 플레이어 생성 (입력 검증 없이 바로 복원)
+
+        Args:
+            seat: 복원할 SeatState
+
+        Returns:
+            새 Player
+        """
+        player = cls.__new__(cls)
+        player.restore(seat)
+        return player
+
+    def copy(self) -> "Player":
+        """독립적인 복사본 (카드 객체는 불변이라 공유)"""
+        player = self.__class__.__new__(self.__class__)
+        player.__dict__.update(self.__dict__)
+        player.hand = list(self.hand)
+        return player
+
     def can_bet(self, amount: int) -> bool:
         """
         지정된 금액을 베팅할 수 있는지 확인
@@ -215,7 +270,7 @@ class Player:
              return 0.0
 
         try:
-            best_rank, kickers, _ = HandEvaluator.evaluate_hand(all_cards)
+            best_rank, kickers = HandEvaluator.rank_hand(all_cards)
             
             # 점수 정규화 (0.0 ~ 1.0)
             # HandRank: 1 ~ 10
@@ -0,0 +1,389 @@
+"""
+순수 테이블 상태 / 전이 API - PokerGame 베팅 규칙의 불변(immutable) 버전
+
+PokerGame은 betting_round가 get_player_action으로 액션을 끌어오는 블로킹 루프라서
+탐색, 자체 대전, 웹 어댑터가 각자 스레드/큐로 우회해야 합니다.
+여기서는 한 핸드의 테이블 상태를 NamedTuple 하나(TableState)로 두고
+
+    legal_actions(state)           -> 차례인 플레이어가 할 수 있는 액션 목록
+    apply(state, (action, amount)) -> 액션을 적용한 새 상태
+
+두 함수로 진행합니다. 규칙은 PokerGame과 같습니다.
+- 액션 처리: process_action (레이즈/올인 시 다른 플레이어 acted_this_round 초기화 등)
+- 라운드 종료: is_betting_round_complete + 무한 루프 방지 상한 (플레이어 수 x MAX_ACTIONS_PER_SEAT)
+- 페이즈 전이: play_full_hand / advance_phase (번 카드, 한 명 남으면 조기 종료, 리버 후 쇼다운)
+
+원래 상태는 바뀌지 않으므로 같은 상태에서 여러 액션을 시험하는 탐색에 그대로 쓸 수 있습니다.
+"""
+
+import random
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.core.game import Action, GamePhase, MAX_ACTIONS_PER_SEAT, PokerGame
+from src.algorithms.lookup_evaluator import BoardState
+
+
+# (Action, amount) - PokerGame.process_action / 결정 함수와 같은 형식
+ActionChoice = Tuple[Action, int]
+
+# 상태를 받아 액션을 고르는 함수 (자체 대전용)
+StatePolicy = Callable[["TableState"], ActionChoice]
+
+# 현재 페이즈 -> (번 후 딜할 카드 수, 다음 페이즈)
+_NEXT_STREET = {
+    GamePhase.PREFLOP: (3, GamePhase.FLOP),
+    GamePhase.FLOP: (1, GamePhase.TURN),
+    GamePhase.TURN: (1, GamePhase.RIVER),
+}
+
+
+class SeatState(NamedTuple):
+    """좌석 하나의 상태 (Player의 게임 관련 필드, 카드는 정수 id)"""
+    name: str
+    chips: int
+    current_bet: int
+    hole: Tuple[int, ...]
+    is_active: bool
+    has_folded: bool
+    is_all_in: bool
+    acted_this_round: bool
+
+    def can_act(self) -> bool:
+        """Player.can_act와 같은 조건"""
+        return self.is_active and not self.has_folded and not self.is_all_in
+
+
+class TableState(NamedTuple):
+    """
+    한 핸드 진행 중인 테이블 상태
+
+    deck은 앞으로 딜할 카드 id이며 PokerGame의 Deck처럼 끝에서부터 딜합니다.
+    winners가 비어 있지 않으면 핸드가 끝난 상태입니다 (팟 분배 완료).
+    """
+    seats: Tuple[SeatState, ...]
+    community: Tuple[int, ...]
+    deck: Tuple[int, ...]
+    pot: int
+    blinds_in_pot: int
+    current_bet: int
+    min_raise: int
+    phase: GamePhase
+    dealer_position: int
+    current_player_index: int
+    last_raiser_index: int
+    street_actions: int
+    small_blind: int
+    big_blind: int
+    winners: Tuple[int, ...] = ()
+
+    @property
+    def is_over(self) -> bool:
+        """핸드가 끝났는지"""
+        return bool(self.winners)
+
+    @property
+    def current_seat(self) -> SeatState:
+        """차례인 좌석"""
+        return self.seats[self.current_player_index]
+
+    def call_amount(self) -> int:
+        """차례인 플레이어의 콜 금액"""
+        return self.current_bet - self.current_seat.current_bet
+
+
+# ===== 상태 만들기 =====
+
+def start_hand(
+    stacks: Sequence[int],
+    dealer_position: int = 0,
+    small_blind: int = 10,
+    big_blind: int = 20,
+    names: Optional[Sequence[str]] = None,
+    deck: Optional[Sequence[int]] = None,
+    rng: Optional[random.Random] = None
+) -> TableState:
+    """
+    새 핸드의 상태 (PokerGame.new_hand + post_blinds와 같은 순서로 딜/블라인드)
+
+    Args:
+        stacks: 좌석별 칩
+        dealer_position: 딜러 좌석
+        small_blind / big_blind: 블라인드 금액
+        names: 좌석별 이름 (기본값: "P0", "P1", ...)
+        deck: 딜 순서대로 놓인 카드 id (끝에서부터 딜, 기본값: 이 핸드에 쓰일 카드만 무작위로)
+        rng: deck이 없을 때 섞는 데 쓸 난수 생성기
+    """
+    if len(stacks) < 2:
+        raise ValueError("게임을 시작하려면 최소 2명의 플레이어가 필요합니다.")
+    if names is None:
+        names = [f"P{i}" for i in range(len(stacks))]
+    if deck is None:
+        # 이 핸드에 쓰일 카드(홀카드 + 번 3장 + 보드 5장)만 뽑아 딜 순서로 둠
+        deck = (rng or random).sample(range(52), 2 * len(stacks) + 8)
+    cards = list(deck)
+
+    # 홀카드: 한 장씩 두 바퀴 (칩이 있는 좌석만)
+    holes = [[] for _ in stacks]
+    for _ in range(2):
+        for seat, chips in enumerate(stacks):
+            if chips > 0:
+                holes[seat].append(cards.pop())
+
+    seats = [
+        SeatState(name, chips, 0, tuple(hole), chips > 0, False, False, False)
+        for name, chips, hole in zip(names, stacks, holes)
+    ]
+    num_seats = len(seats)
+    pot = 0
+    current_bet = 0
+
+    # 블라인드 (자발적 액션이 아니므로 acted_this_round는 False 유지)
+    sb_position = (dealer_position + 1) % num_seats
+    if seats[sb_position].can_act():
+        seats[sb_position], posted = _bet(seats[sb_position], small_blind)
+        pot += posted
+    bb_position = (dealer_position + 2) % num_seats
+    if seats[bb_position].can_act():
+        seats[bb_position], posted = _bet(seats[bb_position], big_blind)
+        pot += posted
+        current_bet = posted
+
+    state = TableState(
+        seats=tuple(seats),
+        community=(),
+        deck=tuple(cards),
+        pot=pot,
+        blinds_in_pot=pot,
+        current_bet=current_bet,
+        min_raise=big_blind,
+        phase=GamePhase.PREFLOP,
+        dealer_position=dealer_position,
+        current_player_index=(bb_position + 1) % num_seats,
+        last_raiser_index=bb_position,
+        street_actions=0,
+        small_blind=small_blind,
+        big_blind=big_blind,
+    )
+    return _settle(state)
+
+
+def from_game(game: PokerGame) -> TableState:
+    """진행 중인 PokerGame의 현재 상태를 TableState로 옮깁니다 (카드는 id, 덱 순서 포함)."""
+    seats = tuple(
+        SeatState(
+            player.name,
+            player.chips,
+            player.current_bet,
+            tuple(card.id for card in player.hand),
+            player.is_active,
+            player.has_folded,
+            player.is_all_in,
+            player.acted_this_round,
+        )
+        for player in game.players
+    )
+    return TableState(
+        seats=seats,
+        community=tuple(card.id for card in game.community_cards),
+        deck=tuple(card.id for card in game.deck.cards),
+        pot=game.pot,
+        blinds_in_pot=game.blinds_in_pot,
+        current_bet=game.current_bet,
+        min_raise=game.min_raise,
+        phase=game.current_phase,
+        dealer_position=game.dealer_position,
+        current_player_index=game.current_player_index,
+        last_raiser_index=game.last_raiser_index,
+        street_actions=game.street_actions,
+        small_blind=game.small_blind,
+        big_blind=game.big_blind,
+        winners=tuple(game.players.index(winner) for winner in game.last_winners),
+    )
+
+
+# ===== 규칙 =====
+
+def is_betting_round_complete(state: TableState) -> bool:
+    """PokerGame.is_betting_round_complete와 같은 조건"""
+    num_active = 0
+    waiting = False
+    for seat in state.seats:
+        if seat.has_folded or not seat.is_active:
+            continue
+        num_active += 1
+        if seat.is_all_in:
+            continue
+        if seat.current_bet != state.current_bet or not seat.acted_this_round:
+            waiting = True
+    return num_active <= 1 or not waiting
+
+
+def legal_actions(state: TableState) -> List[Action]:
+    """차례인 플레이어가 할 수 있는 액션 (PokerGame.get_available_actions와 같은 규칙)"""
+    if state.is_over:
+        return []
+    seat = state.current_seat
+    call_amount = state.current_bet - seat.current_bet
+
+    actions = [Action.FOLD]
+    if call_amount == 0:
+        actions.append(Action.CHECK)
+    if call_amount > 0 and seat.chips >= call_amount:
+        actions.append(Action.CALL)
+    if seat.chips > call_amount + state.min_raise:
+        actions.append(Action.RAISE)
+    if seat.chips > 0:
+        actions.append(Action.ALL_IN)
+    return actions
+
+
+def apply(state: TableState, choice: ActionChoice) -> TableState:
+    """
+    차례인 플레이어의 액션을 적용한 새 상태를 돌려줍니다.
+
+    Args:
+        state: 현재 상태 (바뀌지 않음)
+        choice: (Action, amount) - RAISE의 amount는 콜 금액 위에 더하는 레이즈 금액,
+                CALL/ALL_IN의 amount는 무시 (process_action과 같음)
+
+    Raises:
+        ValueError: 핸드가 끝났거나 지금 할 수 없는 액션일 때
+    """
+    action, amount = choice
+    if state.is_over:
+        raise ValueError("이미 끝난 핸드입니다.")
+    if action not in legal_actions(state):
+        raise ValueError(f"지금 할 수 없는 액션입니다: {action.value}")
+
+    index = state.current_player_index
+    seats = list(state.seats)
+    seat = seats[index]._replace(acted_this_round=True)
+    current_bet = state.current_bet
+    min_raise = state.min_raise
+    last_raiser_index = state.last_raiser_index
+    reopened = False
+
+    if action == Action.FOLD:
+        seat = seat._replace(has_folded=True, is_active=False)
+
+    elif action == Action.CALL:
+        seat, _ = _bet(seat, current_bet - seat.current_bet)
+
+    elif action == Action.RAISE:
+        seat, _ = _bet(seat, current_bet - seat.current_bet + amount)
+        min_raise = seat.current_bet - current_bet
+        current_bet = seat.current_bet
+        last_raiser_index = index
+        reopened = True
+
+    elif action == Action.ALL_IN:
+        seat, _ = _bet(seat, seat.chips)
+        if seat.current_bet > current_bet:
+            min_raise = seat.current_bet - current_bet
+            current_bet = seat.current_bet
+            last_raiser_index = index
+            reopened = True
+
+    # 레이즈(올인으로 인한 베팅 증가 포함) 발생 시 다른 플레이어는 다시 액션해야 함
+    if reopened:
+        seats = [other._replace(acted_this_round=False) for other in seats]
+    seats[index] = seat
+
+    state = state._replace(
+        seats=tuple(seats),
+        current_bet=current_bet,
+        min_raise=min_raise,
+        last_raiser_index=last_raiser_index,
+        current_player_index=(index + 1) % len(seats),
+        street_actions=state.street_actions + 1,
+    )
+    return _settle(state)
+
+
+def play_hand(state: TableState, policy: StatePolicy) -> TableState:
+    """핸드가 끝날 때까지 policy로 액션을 골라 진행한 최종 상태"""
+    while not state.is_over:
+        state = apply(state, policy(state))
+    return state
+
+
+# ===== 내부 전이 =====
+
+def _bet(seat: SeatState, amount: int) -> Tuple[SeatState, int]:
+    """Player.bet과 같은 규칙의 베팅 (보유 칩 이상이면 올인) -> (새 좌석, 실제 베팅액)"""
+    if amount <= 0:
+        raise ValueError("베팅 금액은 0보다 커야 합니다 (체크는 별도 처리)")
+    if amount >= seat.chips:
+        actual = seat.chips
+        seat = seat._replace(is_all_in=True)
+    else:
+        actual = amount
+    return seat._replace(chips=seat.chips - actual, current_bet=seat.current_bet + actual), actual
+
+
+def _settle(state: TableState) -> TableState:
+    """
+    액션 뒤 상태 정리
+
+    라운드가 끝나지 않았으면 다음 액션 가능 좌석으로 차례를 넘기고,
+    끝났으면 베팅을 팟에 모은 뒤 조기 종료 / 다음 스트리트 / 쇼다운으로 넘어갑니다.
+    """
+    num_seats = len(state.seats)
+    while True:
+        if not is_betting_round_complete(state) and state.street_actions < num_seats * MAX_ACTIONS_PER_SEAT:
+            index = state.current_player_index
+            while not state.seats[index].can_act():
+                index = (index + 1) % num_seats
+            return state._replace(current_player_index=index)
+
+        # collect_bets (블라인드는 이미 팟에 들어가 있음)
+        pot = state.pot + sum(seat.current_bet for seat in state.seats) - state.blinds_in_pot
+        active = [
+            seat_index for seat_index, seat in enumerate(state.seats)
+            if not seat.has_folded and seat.is_active
+        ]
+        if len(active) <= 1 or state.phase == GamePhase.RIVER:
+            state = state._replace(
+                seats=tuple(seat._replace(current_bet=0) for seat in state.seats),
+                pot=pot,
+                blinds_in_pot=0,
+                current_bet=0,
+            )
+            # 유일한 참가자가 팟 획득, 아니면 쇼다운
+            return _award(state, active) if len(active) <= 1 else _showdown(state, active)
+
+        # 다음 스트리트: 번 카드 1장 + 딜, 베팅 라운드 초기화
+        count, phase = _NEXT_STREET[state.phase]
+        deck = state.deck[:-1]
+        dealt = deck[-count:][::-1]
+        state = state._replace(
+            seats=tuple(seat._replace(current_bet=0, acted_this_round=False) for seat in state.seats),
+            community=state.community + dealt,
+            deck=deck[:-count],
+            pot=pot,
+            blinds_in_pot=0,
+            current_bet=0,
+            phase=phase,
+            current_player_index=(state.dealer_position + 1) % num_seats,
+            last_raiser_index=-1,
+            street_actions=0,
+        )
+
+
+def _award(state: TableState, winners: List[int]) -> TableState:
+    """팟을 승자들에게 나눔 (distribute_pot과 같이 나머지는 앞 좌석부터 1씩)"""
+    share, remainder = divmod(state.pot, len(winners))
+    seats = list(state.seats)
+    for order, seat_index in enumerate(winners):
+        seat = seats[seat_index]
+        seats[seat_index] = seat._replace(chips=seat.chips + share + (1 if order < remainder else 0))
+    return state._replace(seats=tuple(seats), pot=0, winners=tuple(winners))
+
+
+def _showdown(state: TableState, active: List[int]) -> TableState:
+    """보드를 한 번만 분석해 활성 좌석을 점수화하고 최고 점수 좌석들에게 팟 분배"""
+    board = BoardState(state.community)
+    scores = [board.score_hole(*state.seats[seat_index].hole) for seat_index in active]
+    best = max(scores)
+    winners = [seat_index for seat_index, score in zip(active, scores) if score == best]
+    return _award(state._replace(phase=GamePhase.SHOWDOWN), winners)
@@ -5,18 +5,27 @@ from typing import Optional, Tuple, List, Dict
 
 from src.core.game import PokerGame, Action, GamePhase
 from src.core.player import Player
-from src.algorithms.monte_carlo import MonteCarloSimulator
+from src.algorithms.vector_monte_carlo import VectorMonteCarloSimulator
+from src.algorithms.equity_cache import EquityCache, canonical_hands_key
+
+# 모든 웹 게임이 공유하는 승률 캐시 (무늬만 다른 같은 핸드/보드 조합은 다시 계산하지 않음)
+EQUITY_CACHE = EquityCache(maxsize=8192)
 
 class WebPokerGame(PokerGame):
     """
     콘솔 입출력 대신 큐를 사용하는 웹 전용 PokerGame 클래스
     """
+    # 프리플랍처럼 런아웃이 많을 때 뽑는 공유 런아웃 수 (최대치, 실제로는 시간 예산에서 멈춤)
+    EQUITY_SIMULATIONS = 20000
+    # 상태 브로드캐스트 한 번에 승률 계산에 쓰는 시간 예산 (밀리초)
+    EQUITY_BUDGET_MS = 120.0
+
     def __init__(self, broadcast_callback, small_blind: int = 10, big_blind: int = 20):
         super().__init__(small_blind, big_blind)
         self.broadcast_callback = broadcast_callback  # 업데이트 전송을 위한 비동기 함수
         self.input_queues: Dict[str, queue.Queue] = {} # 플레이어 이름 -> 큐
         self.game_running = False
-        self.monte_carlo = MonteCarloSimulator(num_simulations=1000)
+        self.equity_engine = VectorMonteCarloSimulator(num_simulations=self.EQUITY_SIMULATIONS)
 
     def add_player(self, name: str, chips: int = 1000) -> None:
         super().add_player(name, chips)
@@ -35,24 +44,27 @@ class WebPokerGame(PokerGame):
         win_rates = {}
         active_players = self.get_active_players()
         
-        # 게임 진행 중이고 쇼다운이 아닐 때만 계산
-        if self.current_phase != GamePhase.SHOWDOWN and len(active_players) > 1:
-            # 참고: 동기적으로 수행하면 느릴 수 있음.
-            # 성능을 위해 병렬로 실행하거나 시뮬레이션 횟수를 줄일 수 있음.
-            # 여기서는 MonteCarloSimulator의 parallel_simulation 메서드 사용
-            
-            community_cards = self.community_cards
-            for player in active_players:
-                # 상대방 수 추정 (활성 플레이어 - 자신)
-                opponents_count = len(active_players) - 1
-                if opponents_count > 0:
-                    win_rate = self.monte_carlo.parallel_simulation(
-                        player.hand, 
-                        community_cards, 
-                        num_opponents=opponents_count,
-                        num_threads=4
-                    )
-                    win_rates[player.name] = round(win_rate * 100, 1)
+        # 게임 진행 중이고 쇼다운이 아닐 때만 계산 (홀카드를 모두 받은 뒤)
+        if (
+            self.current_phase != GamePhase.SHOWDOWN
+            and len(active_players) > 1
+            and all(len(player.hand) == 2 for player in active_players)
+        ):
+            # 서버는 모든 플레이어의 핸드를 알고 있으므로 랜덤 상대가 아닌 실제 핸드끼리,
+            # 같은 런아웃으로 전원의 승률을 한 번에 계산 (합이 100%, 플랍 이후는 전수 조사)
+            # 프리플랍 샘플링은 EQUITY_BUDGET_MS에서 멈추고, 같은 스팟은 캐시에서 바로 응답
+            hands = [player.hand for player in active_players]
+            key = canonical_hands_key(
+                [[card.id for card in hand] for hand in hands],
+                [card.id for card in self.community_cards]
+            )
+            equities = EQUITY_CACHE.get(key)
+            if equities is None:
+                equities = EQUITY_CACHE.put(key, self.equity_engine.equities_for_hands(
+                    hands, self.community_cards, deadline_ms=self.EQUITY_BUDGET_MS
+                ))
+            for player, equity in zip(active_players, equities):
+                win_rates[player.name] = round(equity * 100, 1)
 
         # 상태 객체 생성
         state = {
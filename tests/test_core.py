@@ -2,8 +2,11 @@
 Core 모듈 테스트
 """
 
+import copy
+import pickle
+
 import pytest
-from src.core.card import Card, Deck, Suit, Rank
+from src.core.card import Card, Deck, Suit, Rank, ALL_CARDS, cards_to_ids, ids_to_cards
 from src.core.player import Player
 from src.core.game import PokerGame
 
@@ -25,6 +28,29 @@ class TestCard:
         assert card1 == card2
         assert card1 != card3
 
+    def test_card_interned(self):
+        """같은 무늬/랭크는 항상 같은 인스턴스"""
+        card = Card(Suit.HEARTS, Rank.KING)
+        assert card is Card(Suit.HEARTS, Rank.KING)
+        assert card is copy.deepcopy(card)
+        assert card is pickle.loads(pickle.dumps(card))
+
+    def test_card_ids(self):
+        """0~51 정수 id와 변환 헬퍼"""
+        assert [card.id for card in ALL_CARDS] == list(range(52))
+        assert Card(Suit.SPADES, Rank.TWO).id == 0
+        assert Card(Suit.CLUBS, Rank.ACE).id == 51
+        assert hash(Card(Suit.HEARTS, Rank.ACE)) == Card(Suit.HEARTS, Rank.ACE).id
+
+        cards = [Card(Suit.DIAMONDS, Rank.TEN), Card(Suit.SPADES, Rank.QUEEN)]
+        assert ids_to_cards(cards_to_ids(cards)) == cards
+        assert Card.from_id(cards[0].id) is cards[0]
+
+    def test_card_immutable(self):
+        card = Card(Suit.SPADES, Rank.ACE)
+        with pytest.raises(AttributeError):
+            card.rank = Rank.KING
+
 
 class TestDeck:
     """Deck 클래스 테스트"""
@@ -39,6 +65,29 @@ class TestDeck:
         assert isinstance(card, Card)
         assert len(deck.cards) == 51
 
+    def test_deck_deals_every_card_once(self):
+        deck = Deck()
+        dealt = [deck.deal() for _ in range(52)]
+        assert sorted(card.id for card in dealt) == list(range(52))
+
+    def test_deck_reset_restores_unshuffled_cards(self):
+        # reset은 섞지 않고 52장을 되돌리며, 무작위성은 deal()이 담당
+        deck = Deck()
+        deck.deal()
+        deck.reset()
+        assert deck.cards == list(ALL_CARDS)
+
+    def test_deck_deal_is_uniform(self):
+        import random
+        random.seed(7)
+        counts = [0] * 52
+        deck = Deck()
+        for _ in range(52000):
+            deck.reset()
+            counts[deck.deal().id] += 1
+        # 카드당 기대값 1000, 표준편차 약 31
+        assert min(counts) > 850 and max(counts) < 1150
+
     def test_deck_empty(self):
         deck = Deck()
         # 모든 카드 뽑기
@@ -225,6 +274,41 @@ class TestPlayer:
         assert player.is_active is False  # 칩이 0이므로 비활성
         assert player.chips == 0
 
+    def test_player_snapshot_restore(self):
+        """스냅샷으로 상태 되돌리기"""
+        player = Player("Test", 1000)
+        player.receive_card(Card(Suit.SPADES, Rank.ACE))
+        player.receive_card(Card(Suit.HEARTS, Rank.KING))
+        player.bet(100)
+        seat = player.snapshot()
+
+        assert seat.chips == 900
+        assert seat.hole == (player.hand[0].id, player.hand[1].id)
+
+        player.bet(900)
+        player.reset_for_new_hand()
+        player.restore(seat)
+
+        assert player.chips == 900
+        assert player.current_bet == 100
+        assert player.is_all_in is False
+        assert player.hand == [Card(Suit.SPADES, Rank.ACE), Card(Suit.HEARTS, Rank.KING)]
+        assert Player.from_snapshot(seat).snapshot() == seat
+
+    def test_player_copy_is_independent(self):
+        """복사본 변경이 원본에 영향 없음"""
+        player = Player("Test", 1000)
+        player.receive_card(Card(Suit.SPADES, Rank.ACE))
+        clone = player.copy()
+
+        clone.bet(1000)
+        clone.receive_card(Card(Suit.HEARTS, Rank.KING))
+
+        assert player.chips == 1000
+        assert player.is_all_in is False
+        assert len(player.hand) == 1
+        assert clone.snapshot() != player.snapshot()
+
     # 상태 확인 테스트
     def test_player_can_bet(self):
         """베팅 가능 여부 확인"""
@@ -0,0 +1,794 @@
+"""
+승률(Equity) 계산 엔진 테스트 - 몬테카를로 시뮬레이터
+"""
+
+import os
+import random
+import time
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from src.core.card import Card, Suit, Rank
+from src.algorithms import (
+    batch_evaluator,
+    equity_tables,
+    flop_database,
+    hand_classes,
+    lookup_evaluator,
+    monte_carlo,
+    preflop_table,
+)
+from src.algorithms.batch_evaluator import BoardBatch
+from src.algorithms.equity_cache import EquityCache, canonical_hands_key, canonical_spot
+from src.algorithms.hand_evaluator import HandRank
+from src.algorithms.hand_potential import HandStrengthEngine
+from src.algorithms.hand_range import HandRange
+from src.algorithms.monte_carlo import MonteCarloSimulator
+from src.algorithms.preflop_matchups import (
+    PreflopMatchupTable,
+    build_matchup_matrix,
+    get_matchup_table,
+)
+from src.algorithms.preflop_table import (
+    PreflopEquityTable,
+    build_preflop_table,
+    get_preflop_table,
+    heads_up_equities,
+)
+from src.algorithms.range_equity import RangeEquityCalculator
+from src.algorithms.river_showdown import river_showdown_values
+from src.algorithms.scenario_generator import ScenarioGenerator
+from src.algorithms.vector_monte_carlo import VectorMonteCarloSimulator
+
+
+def cards_from(text):
+    """'As Kh 10d' 형태의 문자열을 카드 목록으로 변환"""
+    suits = {"s": Suit.SPADES, "h": Suit.HEARTS, "d": Suit.DIAMONDS, "c": Suit.CLUBS}
+    ranks = {rank.symbol: rank for rank in Rank}
+    return [Card(suits[token[-1]], ranks[token[:-1]]) for token in text.split()]
+
+
+class TestParallelBackends:
+    """parallel_simulation 스레드/프로세스 백엔드 테스트"""
+
+    def test_process_backend_matches_known_equity(self):
+        # AA vs 랜덤 1명 (약 85%)
+        simulator = MonteCarloSimulator(num_simulations=4000)
+        equity = simulator.parallel_simulation(
+            cards_from("As Ah"), [], num_opponents=1, num_threads=2, backend="process"
+        )
+        assert 0.82 < equity < 0.88
+
+    def test_process_backend_is_reproducible_with_seed(self):
+        simulator = MonteCarloSimulator(num_simulations=2000)
+        hole, board = cards_from("Ks Qs"), cards_from("Js 10d 2c")
+        random.seed(42)
+        first = simulator.parallel_simulation(hole, board, 2, num_threads=2, backend="process")
+        random.seed(42)
+        second = simulator.parallel_simulation(hole, board, 2, num_threads=2, backend="process")
+        assert first == second
+
+    def test_process_pool_is_reused(self):
+        simulator = MonteCarloSimulator(num_simulations=100)
+        hole = cards_from("7c 7d")
+        simulator.parallel_simulation(hole, [], num_threads=2, backend="process")
+        pool = monte_carlo._process_pool
+        simulator.parallel_simulation(hole, [], num_threads=2, backend="process")
+        assert monte_carlo._process_pool is pool
+
+    def test_river_nuts_always_win(self):
+        simulator = MonteCarloSimulator(num_simulations=200)
+        hole, board = cards_from("As Ks"), cards_from("Qs Js 10s 2d 3c")
+        for backend in monte_carlo.BACKENDS:
+            equity = simulator.parallel_simulation(hole, board, 3, num_threads=2, backend=backend)
+            assert equity == 1.0
+
+    def test_default_backend_setting(self):
+        assert monte_carlo.get_default_backend() == "thread"
+        monte_carlo.set_default_backend("process")
+        try:
+            assert monte_carlo.get_default_backend() == "process"
+        finally:
+            monte_carlo.set_default_backend("thread")
+        with pytest.raises(ValueError):
+            monte_carlo.set_default_backend("gpu")
+
+
+class TestVectorMonteCarlo:
+    """NumPy 벡터화 몬테카를로 테스트"""
+
+    def test_matches_known_preflop_equity(self):
+        # AA vs 랜덤 1명 (약 85.2%), AA vs 랜덤 4명 (약 55.9%)
+        simulator = VectorMonteCarloSimulator(num_simulations=40000, rng=3)
+        assert 0.84 < simulator.calculate_win_probability(cards_from("As Ah"), [], 1) < 0.86
+        assert 0.54 < simulator.calculate_win_probability(cards_from("As Ah"), [], 4) < 0.58
+
+    def test_agrees_with_scalar_simulator_on_flop(self):
+        hole, board = cards_from("Ks Qs"), cards_from("Js 10d 2c")
+        random.seed(8)
+        scalar = MonteCarloSimulator(num_simulations=20000).calculate_win_probability(hole, board, 2)
+        vector = VectorMonteCarloSimulator(num_simulations=20000, rng=8).calculate_win_probability(
+            hole, board, 2
+        )
+        assert abs(scalar - vector) < 0.02
+
+    def test_river_results(self):
+        simulator = VectorMonteCarloSimulator(num_simulations=1000, rng=0)
+        board = cards_from("Qs Js 10s 2d 3c")
+        assert simulator.calculate_win_probability(cards_from("As Ks"), board, 5) == 1.0
+        # 보드가 로열 플러시면 모두 무승부
+        royal = cards_from("As Ks Qs Js 10s")
+        assert simulator.calculate_win_probability(cards_from("2c 3d"), royal, 3) == 0.5
+
+    def test_batches_are_split(self):
+        simulator = VectorMonteCarloSimulator(num_simulations=2500, rng=1)
+        simulator.BATCH_SIZE = 1000
+        hole_ids, board_ids, remaining = MonteCarloSimulator._split_ids(cards_from("9c 9d"), [])
+        trials = simulator.simulate_ids(hole_ids, board_ids, remaining, 2, 700)
+        assert trials.shape == (700,)
+        assert set(trials.tolist()) <= {0.0, 0.5, 1.0}
+        assert 0.0 < simulator.calculate_win_probability(cards_from("9c 9d"), [], 2) < 1.0
+
+
+class TestExactEquity:
+    """전수 조사(exact) 모드 테스트"""
+
+    def test_river_heads_up_counts_every_holding(self):
+        # 보드 스트레이트 K-Q-J-10-9: A를 가진 상대만 이기고 나머지는 모두 무승부
+        simulator = MonteCarloSimulator()
+        hole, board = cards_from("2c 3d"), cards_from("Ks Qd Jh 10c 9s")
+        equity = simulator.calculate_win_probability(hole, board, 1, exact=True)
+        # 남은 45장 중 A 4장: A가 포함된 홀카드 4*41 + C(4,2) = 170개
+        assert equity == pytest.approx(0.5 * (990 - 170) / 990)
+
+    def test_exact_matches_vector_estimate(self):
+        hole, board = cards_from("Ks Qs"), cards_from("Js 10d 2c 3h")
+        exact = MonteCarloSimulator().calculate_win_probability(hole, board, 2, exact=True)
+        estimate = VectorMonteCarloSimulator(num_simulations=200000, rng=4).calculate_win_probability(
+            hole, board, 2
+        )
+        assert abs(exact - estimate) < 0.005
+
+    def test_auto_switch_is_deterministic(self):
+        simulator = MonteCarloSimulator(num_simulations=1000)
+        hole, board = cards_from("Ah Kd"), cards_from("Ac 7d 2s 9h")
+        first = simulator.calculate_win_probability(hole, board, 1)
+        assert first == simulator.calculate_win_probability(hole, board, 1)
+        assert first == simulator.parallel_simulation(hole, board, 1)
+        assert first == simulator.calculate_win_probability(hole, board, 1, exact=True)
+
+    def test_multiway_river_matches_recursive_count(self):
+        simulator = MonteCarloSimulator()
+        hole, board = cards_from("Qh Qc"), cards_from("Qs 8d 5c 2h Kd")
+        three = simulator.calculate_win_probability(hole, board, 3, exact=True)
+        two = simulator.calculate_win_probability(hole, board, 2, exact=True)
+        assert 0.0 < three < two < 1.0
+
+    def test_exact_rejects_large_multiway_river(self):
+        # 상대 4명부터는 재귀 쌍 세기가 예산을 넘으므로 오래 돌지 않고 바로 거부
+        hole, board = cards_from("Qh Qc"), cards_from("Qs 8d 5c 2h Kd")
+        start = time.perf_counter()
+        with pytest.raises(ValueError):
+            MonteCarloSimulator().calculate_win_probability(hole, board, 4, exact=True)
+        assert time.perf_counter() - start < 1.0
+
+    def test_exact_rejects_preflop(self):
+        with pytest.raises(ValueError):
+            MonteCarloSimulator().calculate_win_probability(cards_from("As Ah"), [], 1, exact=True)
+
+    def test_disjoint_pair_count_matches_brute_force(self):
+        rng = random.Random(5)
+        pairs = rng.sample(list(combinations(range(12), 2)), 30)
+        for k in (1, 2, 3):
+            brute = sum(
+                1 for group in combinations(pairs, k)
+                if len({card for pair in group for card in pair}) == 2 * k
+            )
+            assert monte_carlo._count_disjoint_pairs(pairs, k) == brute
+
+
+class TestAdaptivePrecision:
+    """목표 오차 도달 시 조기 종료하는 적응형 승률 테스트"""
+
+    def test_lopsided_spot_stops_early(self):
+        # 플랍 셋 vs 랜덤: 약 95%라서 분산이 작음
+        random.seed(3)
+        simulator = MonteCarloSimulator(num_simulations=20000)
+        result = simulator.estimate_equity(
+            cards_from("9c 9d"), cards_from("9s 4h 2c"), 1, target_stderr=0.005
+        )
+        assert result.trials < 5000
+        assert result.std_error <= 0.005
+        assert 0.9 < result.equity < 0.99
+
+    def test_close_spot_uses_more_trials(self):
+        simulator = VectorMonteCarloSimulator(num_simulations=20000, rng=6)
+        close = simulator.estimate_equity(cards_from("Ks Qs"), cards_from("Js 10d 2c"), 1,
+                                          ci_half_width=0.01)
+        lopsided = simulator.estimate_equity(cards_from("9c 9d"), cards_from("9s 4h 2c"), 1,
+                                             ci_half_width=0.01)
+        assert lopsided.trials < close.trials
+        assert close.std_error * monte_carlo.Z_95 <= 0.01
+
+    def test_max_trials_caps_the_run(self):
+        random.seed(4)
+        result = MonteCarloSimulator().estimate_equity(
+            cards_from("Ks Qs"), [], 2, target_stderr=0.0001, max_trials=600, batch_size=200
+        )
+        assert result.trials == 600
+        assert result.std_error > 0.0001
+
+    def test_exact_spot_has_no_error(self):
+        result = MonteCarloSimulator().estimate_equity(
+            cards_from("Ks Qs"), cards_from("Js 10d 2c 3h 4h"), 1, target_stderr=0.01
+        )
+        assert result.std_error == 0.0
+        assert result.trials == 0
+
+    def test_requires_exactly_one_target(self):
+        with pytest.raises(ValueError):
+            MonteCarloSimulator().estimate_equity(cards_from("As Ah"), [], 1)
+        with pytest.raises(ValueError):
+            MonteCarloSimulator().estimate_equity(
+                cards_from("As Ah"), [], 1, target_stderr=0.01, ci_half_width=0.02
+            )
+
+
+class TestTimeBudget:
+    """시간 예산 승률(equity_within) 테스트"""
+
+    def test_returns_when_deadline_passes(self):
+        simulator = MonteCarloSimulator()
+        hole = cards_from("Ks Qs")
+        simulator.equity_within(hole, [], 3, deadline_ms=5)  # 테이블 준비
+        start = time.perf_counter()
+        result = simulator.equity_within(hole, [], 3, deadline_ms=30)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert elapsed_ms < 200
+        assert result.trials >= 100
+        assert 0.0 < result.equity < 1.0
+        assert 0.0 < result.std_error < 0.1
+
+    def test_longer_budget_runs_more_trials(self):
+        simulator = MonteCarloSimulator()
+        hole, board = cards_from("8h 8d"), cards_from("Kc 7s 2d")
+        short = simulator.equity_within(hole, board, 1, deadline_ms=5)
+        long = simulator.equity_within(hole, board, 1, deadline_ms=60)
+        assert long.trials > short.trials
+        assert long.std_error < short.std_error
+
+    def test_target_error_stops_before_deadline(self):
+        simulator = MonteCarloSimulator()
+        result = simulator.equity_within(
+            cards_from("9c 9d"), cards_from("9s 4h 2c"), 1, deadline_ms=5000, target_stderr=0.02
+        )
+        assert result.trials < 2000
+        assert result.std_error <= 0.02
+
+    def test_zero_variance_batch_runs_until_deadline(self):
+        # 로열 플러시는 매 시행 승리라 첫 배치의 표준오차가 0 - 목표가 없으면 시간까지 계속해야 함
+        result = MonteCarloSimulator().equity_within(
+            cards_from("As Ks"), cards_from("Qs Js 10s"), 1, deadline_ms=30, exact=False
+        )
+        assert result.equity == 1.0
+        assert result.trials > 100
+
+    def test_river_is_exact(self):
+        result = MonteCarloSimulator().equity_within(
+            cards_from("Ks Qs"), cards_from("Js 10d 2c 3h 4h"), 1, deadline_ms=1
+        )
+        assert result.std_error == 0.0
+
+
+class TestEquityCache:
+    """무늬 동형 정규화와 LRU 승률 캐시 테스트"""
+
+    def test_suit_relabelled_spots_share_a_key(self):
+        spade = canonical_spot(cards_from("As Ks"), cards_from("Qs Js 2d"), 1)
+        heart = canonical_spot(cards_from("Kh Ah"), cards_from("2c Jh Qh"), 1)
+        assert spade == heart
+        offsuit = canonical_spot(cards_from("As Kh"), cards_from("Qs Js 2d"), 1)
+        assert offsuit != spade
+        assert canonical_spot(cards_from("As Ks"), cards_from("Qs Js 2d"), 2) != spade
+
+    def test_lru_eviction_and_counters(self):
+        cache = EquityCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1       # a가 최근 항목이 됨
+        cache.put("c", 3)                # 가장 오래된 b 제거
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 2, "misses": 1, "evictions": 1}
+
+    def test_simulator_serves_isomorphic_spot_from_cache(self):
+        cache = EquityCache()
+        simulator = MonteCarloSimulator(num_simulations=500, cache=cache)
+        first = simulator.calculate_win_probability(cards_from("As Ks"), cards_from("Qs Js 2d"), 1)
+        second = simulator.parallel_simulation(cards_from("Ah Kh"), cards_from("Qh Jh 2c"), 1)
+        assert first == second
+        assert cache.hits == 1 and cache.misses == 1
+
+        estimate = simulator.equity_within(cards_from("Ad Kd"), cards_from("Qd Jd 2s"), 1, deadline_ms=5)
+        reused = simulator.equity_within(cards_from("Ac Kc"), cards_from("2h Qc Jc"), 1, target_stderr=1.0)
+        assert reused == estimate
+        assert cache.stats()["size"] == 2
+
+    def test_longer_budget_refines_cached_estimate(self):
+        cache = EquityCache()
+        simulator = MonteCarloSimulator(cache=cache)
+        hole, board = cards_from("8h 8d"), cards_from("Kc 7s 2d")
+        short = simulator.equity_within(hole, board, 1, deadline_ms=5)
+        long = simulator.equity_within(hole, board, 1, deadline_ms=60)
+        assert long.trials > short.trials
+        # 더 짧은 예산으로 다시 물어도 시행이 많은 쪽이 남음
+        assert simulator.equity_within(hole, board, 1, deadline_ms=1) == long
+        assert cache.stats()["size"] == 1
+
+    def test_different_trial_counts_do_not_share_entries(self):
+        cache = EquityCache()
+        hole, board = cards_from("7c 7d"), cards_from("Kc 8s 2d")
+        MonteCarloSimulator(num_simulations=200, cache=cache).calculate_win_probability(hole, board, 1)
+        MonteCarloSimulator(num_simulations=400, cache=cache).calculate_win_probability(hole, board, 1)
+        assert cache.misses == 2
+
+
+class TestPreflopTable:
+    """169 핸드 클래스와 프리플랍 승률 테이블 테스트"""
+
+    def test_hand_classes_cover_all_combos(self):
+        classes = {}
+        for first, second in combinations(range(52), 2):
+            classes.setdefault(hand_classes.hand_class(first, second), []).append((first, second))
+        assert len(classes) == hand_classes.NUM_CLASSES
+        for index, combos in classes.items():
+            assert sorted(combos) == sorted(
+                tuple(sorted(combo)) for combo in hand_classes.class_combos(index)
+            )
+        assert hand_classes.class_name(hand_classes.hand_class_of_cards(cards_from("Ks As"))) == "AKs"
+        assert hand_classes.class_name(hand_classes.hand_class_of_cards(cards_from("10h 9d"))) == "T9o"
+        assert hand_classes.class_name(hand_classes.hand_class_of_cards(cards_from("2c 2d"))) == "22"
+
+    def test_table_file_round_trip(self, tmp_path):
+        table = build_preflop_table(trials=300, max_opponents=2, workers=1, seed=1)
+        path = str(tmp_path / "preflop.bin")
+        PreflopEquityTable(table, 300).save(path)
+        loaded = PreflopEquityTable.load(path)
+        assert loaded.trials == 300
+        assert loaded.max_opponents == 2
+        assert loaded.equity(cards_from("Ah Ad"), 1) == pytest.approx(float(table[0, 0]))
+        assert loaded.equity(cards_from("Ah Ad"), 1) > loaded.equity(cards_from("7c 2d"), 1)
+        with pytest.raises(ValueError):
+            loaded.equity(cards_from("Ah Ad"), 3)
+        with pytest.raises(ValueError):
+            equity_tables.open_table(path, b"XXXX")
+
+    def test_heads_up_column_is_exact_from_matchups(self):
+        matchups = get_matchup_table(build=False)
+        if matchups is None:
+            pytest.skip("생성된 행렬 파일이 없습니다 (python -m src.algorithms.preflop_matchups)")
+        exact = heads_up_equities(matchups.matrix)
+        assert exact[hand_classes.hand_class_of_cards(cards_from("As Ah"))] == pytest.approx(0.8520, abs=1e-4)
+        assert exact[hand_classes.hand_class_of_cards(cards_from("7c 2d"))] == pytest.approx(0.3458, abs=1e-4)
+
+        table = build_preflop_table(
+            trials=300, max_opponents=2, workers=1, seed=1, matchups=matchups.matrix
+        )
+        assert np.allclose(table[:, 0], exact, atol=1e-6)
+        shipped = get_preflop_table(build=False)
+        if shipped is not None:
+            assert np.allclose(shipped.table[:, 0], exact, atol=1e-6)
+
+    def test_missing_table_is_built_once_on_first_use(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_build(**kwargs):
+            calls.append(kwargs)
+            return np.full((hand_classes.NUM_CLASSES, 9), 0.25, dtype=np.float32)
+
+        path = str(tmp_path / "data" / "preflop.bin")
+        monkeypatch.setattr(preflop_table, "DEFAULT_PATH", path)
+        monkeypatch.setattr(preflop_table, "_default_table", None)
+        monkeypatch.setattr(preflop_table, "build_preflop_table", fake_build)
+        monkeypatch.setattr(preflop_table, "get_matchup_table", lambda: PreflopMatchupTable(np.zeros((1, 1))))
+        assert get_preflop_table(build=False) is None
+        assert calls == []
+
+        table = get_preflop_table()
+        assert table.trials == preflop_table.DEFAULT_TRIALS
+        assert table.equity(cards_from("As Ah"), 9) == pytest.approx(0.25)
+        assert len(calls) == 1
+        assert os.listdir(tmp_path / "data") == ["preflop.bin"]
+
+        monkeypatch.setattr(preflop_table, "_default_table", None)
+        assert get_preflop_table() is not None
+        assert len(calls) == 1
+
+    def test_shipped_table_matches_known_equities(self):
+        table = get_preflop_table(build=False)
+        if table is None:
+            pytest.skip("생성된 테이블 파일이 없습니다 (python -m src.algorithms.preflop_table)")
+        assert table.max_opponents == 9
+        assert table.equity(cards_from("As Ah"), 1) == pytest.approx(0.852, abs=0.003)
+        assert table.equity(cards_from("7c 2d"), 1) == pytest.approx(0.346, abs=0.003)
+        assert table.equity(cards_from("As Ah"), 9) == pytest.approx(0.312, abs=0.005)
+
+
+class TestPreflopMatchups:
+    """BoardBatch와 169 x 169 핸드 대 핸드 승률 행렬 테스트"""
+
+    def test_board_batch_matches_lookup_evaluator(self):
+        rng = random.Random(5)
+        for board_size in (3, 4, 5):
+            boards, holes = [], []
+            for _ in range(300):
+                cards = rng.sample(range(52), board_size + 2)
+                boards.append(cards[:board_size])
+                holes.append(cards[board_size:])
+            batch = BoardBatch(np.array(boards))
+            first = np.array([hole[0] for hole in holes])
+            second = np.array([hole[1] for hole in holes])
+            expected = [lookup_evaluator.score_ids(board + hole) for board, hole in zip(boards, holes)]
+            assert batch.score_hole(first, second).tolist() == expected
+
+    def test_board_batch_avoiding_filters_dead_cards(self):
+        batch = BoardBatch(np.array([[0, 1, 2, 3, 4], [10, 11, 12, 13, 14]]))
+        assert batch.avoiding([3, 40]).tolist() == [False, True]
+        assert len(batch.subset(batch.avoiding([40]))) == 2
+
+    def test_small_matrix_is_antisymmetric(self):
+        matrix = build_matchup_matrix(workers=1, max_boards=3000, seed=7)
+        assert matrix.shape == (hand_classes.NUM_CLASSES, hand_classes.NUM_CLASSES)
+        assert np.allclose(matrix + matrix.T, 1.0, atol=1e-6)
+        assert np.allclose(np.diag(matrix), 0.5)
+        # AA vs KK (약 82%)
+        assert 0.75 < matrix[0, 14] < 0.89
+
+    def test_shipped_matrix_matches_known_equities(self):
+        table = get_matchup_table(build=False)
+        if table is None:
+            pytest.skip("생성된 행렬 파일이 없습니다 (python -m src.algorithms.preflop_matchups)")
+        assert table.num_boards == 2598960
+        assert table.equity(cards_from("As Ah"), cards_from("Kd Kc")) == pytest.approx(0.8195, abs=0.002)
+        assert table.equity(cards_from("Ah Kd"), cards_from("Qs Qc")) == pytest.approx(0.43, abs=0.01)
+        assert table.equity(cards_from("7c 2d"), cards_from("As Ah")) < 0.15
+
+
+class TestFlopDatabase:
+    """정규 플랍 1,755개 승률 데이터베이스 테스트"""
+
+    def test_canonical_flops_cover_all_flops(self):
+        assert len(flop_database.canonical_flops()) == flop_database.NUM_FLOPS
+        seen = {flop_database.canonical_flop(flop)[0] for flop in combinations(range(52), 3)}
+        assert seen == set(range(flop_database.NUM_FLOPS))
+
+    def test_flop_equities_match_exact_enumeration(self):
+        flop = cards_from("Ks 9s 4d")
+        values = flop_database.flop_equities([card.id for card in flop])
+        hole = cards_from("Qs Js")
+        exact = MonteCarloSimulator().calculate_win_probability(hole, flop, 1, exact=True)
+        equity, ehs2 = values[hand_classes.combo_index(hole[0].id, hole[1].id)]
+        assert equity == pytest.approx(exact, abs=1e-9)
+        # 드로우는 승률에 비해 E[HS²]가 크다 (리버 강도의 분산이 큼)
+        assert ehs2 > equity * equity
+
+    def test_lookup_is_suit_isomorphic(self, tmp_path):
+        flop = cards_from("Ks 9s 4d")
+        number, _ = flop_database.canonical_flop([card.id for card in flop])
+        data = flop_database.build_flop_database(workers=1, flop_numbers=[number])
+        path = str(tmp_path / "flop.bin")
+        flop_database.FlopEquityDatabase(data).save(path)
+        database = flop_database.FlopEquityDatabase.load(path)
+
+        equity = database.equity(cards_from("Qs Js"), flop)
+        assert database.equity(cards_from("Jh Qh"), cards_from("4c Kh 9h")) == pytest.approx(equity)
+        assert equity == pytest.approx(
+            MonteCarloSimulator().calculate_win_probability(cards_from("Qs Js"), flop, 1, exact=True),
+            abs=1e-4
+        )
+        with pytest.raises(ValueError):
+            database.lookup(cards_from("Qs Js"), cards_from("Ks 9s 4d 2c"))
+
+    def test_shipped_database_matches_enumeration(self):
+        database = flop_database.get_flop_database(build=False)
+        if database is None:
+            pytest.skip("생성된 데이터베이스 파일이 없습니다 (python -m src.algorithms.flop_database)")
+        flop = cards_from("Ah 7c 2d")
+        values = flop_database.flop_equities([card.id for card in flop])
+        for text in ("As Kd", "7h 7d", "5c 4c"):
+            hole = cards_from(text)
+            expected = values[hand_classes.combo_index(hole[0].id, hole[1].id)]
+            assert database.lookup(hole, flop) == pytest.approx(tuple(expected), abs=1e-4)
+
+
+class TestHandRange:
+    """1,326 조합 가중치 레인지와 레인지 승률 엔진 테스트"""
+
+    def test_parse_range_notation(self):
+        assert len(HandRange.parse("QQ+")) == 18
+        assert len(HandRange.parse("AKs")) == 4
+        assert len(HandRange.parse("ATo+")) == 48
+        assert len(HandRange.parse("AK")) == 16
+        assert len(HandRange.parse("22-55")) == 24
+        assert len(HandRange.parse("A2s-A5s")) == 16
+        assert len(HandRange.parse("QQ+,AKs,ATo+")) == 70
+        assert HandRange.parse("AsKs").combos() == [tuple(sorted(card.id for card in cards_from("As Ks")))]
+        assert HandRange.parse("KQo:0.5").total_weight == pytest.approx(6.0)
+        assert cards_from("Kd Kc") in HandRange.parse("QQ+")
+        assert cards_from("Jd Jc") not in HandRange.parse("QQ+")
+        for bad in ("AKx", "ZZ", "AK-QJ", "AsAs", "QQ:2"):
+            with pytest.raises(ValueError):
+                HandRange.parse(bad)
+
+    def test_without_removes_blocked_combos(self):
+        board = cards_from("As 7d 2c")
+        aces = HandRange.parse("AA").without(card.id for card in board)
+        assert len(aces) == 3
+
+    def test_hero_vs_uniform_range_matches_exact_enumeration(self):
+        flop, hole = cards_from("Ks 9s 4d"), cards_from("Qs Js")
+        calculator = RangeEquityCalculator(max_work=10 ** 7)
+        exact = MonteCarloSimulator().calculate_win_probability(hole, flop, 1, exact=True)
+        assert calculator.hero_vs_range(hole, flop, HandRange.uniform()) == pytest.approx(exact, abs=1e-9)
+
+    def test_river_matches_brute_force(self):
+        board = cards_from("Ks 9s 4d 2c 7h")
+        board_ids = [card.id for card in board]
+        hero_range = HandRange.parse("A9,KQ,44")
+        villain_range = HandRange.parse("QQ+,AKs,ATo+,K9s")
+
+        won = total = 0.0
+        per_hand = {}
+        for hero in hero_range.combos():
+            if set(hero) & set(board_ids):
+                continue
+            hero_score = lookup_evaluator.score_ids(list(hero) + board_ids)
+            hand_won = hand_total = 0.0
+            for villain in villain_range.combos():
+                if set(villain) & (set(hero) | set(board_ids)):
+                    continue
+                villain_score = lookup_evaluator.score_ids(list(villain) + board_ids)
+                hand_won += 1.0 if hero_score > villain_score else 0.5 if hero_score == villain_score else 0.0
+                hand_total += 1.0
+            per_hand[hero] = hand_won / hand_total
+            won += hand_won
+            total += hand_total
+
+        calculator = RangeEquityCalculator()
+        assert calculator.range_vs_range(hero_range, villain_range, board) == pytest.approx(won / total)
+        equities = calculator.combo_equities(villain_range, board, hero_range)
+        for hero, expected in per_hand.items():
+            hole = [Card.from_id(card_id) for card_id in hero]
+            assert calculator.hero_vs_range(hole, board, villain_range) == pytest.approx(expected)
+            assert equities[hand_classes.combo_index(*hero)] == pytest.approx(expected)
+
+    def test_preflop_range_vs_range(self):
+        calculator = RangeEquityCalculator(rng=3)
+        equity = calculator.range_vs_range(HandRange.parse("AA"), HandRange.parse("KK"), [])
+        assert equity == pytest.approx(0.82, abs=0.02)
+
+    def test_flop_default_matches_exact_enumeration(self):
+        flop = cards_from("Ks 9d 4c")
+        exact = RangeEquityCalculator(max_work=10 ** 8)
+
+        # 좁은 레인지끼리는 기본 설정에서도 전수 조사
+        hero_range = HandRange.parse("TT+,AQs+,AKo")
+        villain_range = HandRange.parse("99+,ATs+,KQs,AJo+")
+        estimate = RangeEquityCalculator().range_vs_range_estimate(hero_range, villain_range, flop)
+        assert estimate.std_error == 0.0 and estimate.trials == 0
+        assert estimate.equity == pytest.approx(exact.range_vs_range(hero_range, villain_range, flop), abs=1e-12)
+
+        # 넓은 레인지는 런아웃 표본 + 표준오차
+        hero_range = HandRange.parse("QQ+,AKs,ATo+")
+        villain_range = HandRange.parse("22+,A2s+,KTs+,QTs+,ATo+,KJo+")
+        estimate = RangeEquityCalculator(rng=6).range_vs_range_estimate(hero_range, villain_range, flop)
+        assert 0 < estimate.trials < 1081
+        assert 0.0 < estimate.std_error < 0.005
+        expected = exact.range_vs_range(hero_range, villain_range, flop)
+        assert abs(estimate.equity - expected) < 4 * estimate.std_error
+
+    def test_flop_hero_vs_range_is_fast(self):
+        calculator = RangeEquityCalculator(rng=4)
+        flop, hole = cards_from("Ks 9s 4d"), cards_from("Qs Js")
+        villain_range = HandRange.parse("22+,A2s+,KTs+,QTs+,ATo+,KJo+")
+        calculator.hero_vs_range(hole, flop, villain_range)
+        start = time.perf_counter()
+        calculator.hero_vs_range(hole, flop, villain_range)
+        assert time.perf_counter() - start < 0.1
+
+
+class TestRiverShowdown:
+    """리버 쇼다운 가치 벡터 테스트"""
+
+    def test_matches_pairwise_comparison(self):
+        board = cards_from("Ks 9s 4d 2c 7h")
+        board_ids = [card.id for card in board]
+        villain_range = HandRange.parse("QQ+,AKs,ATo+,K9s,77:0.5,98s")
+        values = river_showdown_values(board, villain_range)
+
+        rng = random.Random(17)
+        live_combos = [combo for combo in hand_classes.ALL_COMBOS if not set(combo) & set(board_ids)]
+        for hero in rng.sample(live_combos, 60):
+            hero_score = lookup_evaluator.score_ids(list(hero) + board_ids)
+            won = tied = total = 0.0
+            for index, villain in enumerate(hand_classes.ALL_COMBOS):
+                weight = villain_range.weights[index]
+                if not weight or set(villain) & (set(hero) | set(board_ids)):
+                    continue
+                villain_score = lookup_evaluator.score_ids(list(villain) + board_ids)
+                total += weight
+                won += weight * (hero_score > villain_score)
+                tied += weight * (hero_score == villain_score)
+            index = hand_classes.combo_index(*hero)
+            assert values.win[index] == pytest.approx(won / total)
+            assert values.tie[index] == pytest.approx(tied / total)
+            assert values.loss[index] == pytest.approx(1 - (won + tied) / total)
+
+    def test_blocked_combos_are_nan(self):
+        board = cards_from("Ks 9s 4d 2c 7h")
+        values = river_showdown_values(board, HandRange.uniform())
+        assert np.isnan(values.equity[hand_classes.combo_index(board[0].id, 51)])
+        assert np.count_nonzero(~np.isnan(values.equity)) == 1081
+        with pytest.raises(ValueError):
+            river_showdown_values(board[:4], HandRange.uniform())
+
+    def test_agrees_with_range_equity_engine(self):
+        board = cards_from("Ah Jd 8d 3s 3c")
+        villain_range = HandRange.parse("88+,AJs+,KQs,AJo+")
+        values = river_showdown_values(board, villain_range)
+        equities = RangeEquityCalculator().combo_equities(villain_range, board)
+        valid = ~np.isnan(values.equity) & ~np.isnan(equities)
+        assert np.allclose(values.equity[valid], equities[valid])
+
+
+class TestSharedRunoutEquities:
+    """equities_for_hands (모든 플레이어 승률을 같은 런아웃으로) 테스트"""
+
+    def test_turn_matches_brute_force(self):
+        hands = [cards_from("As Ah"), cards_from("Kd Kc"), cards_from("9s 8s")]
+        board = cards_from("Ks 9d 4c 2h")
+        used = {card.id for hand in hands for card in hand} | {card.id for card in board}
+        expected = [0.0, 0.0, 0.0]
+        rivers = [card_id for card_id in range(52) if card_id not in used]
+        for river in rivers:
+            scores = [
+                lookup_evaluator.score_ids([card.id for card in hand + board] + [river])
+                for hand in hands
+            ]
+            winners = [index for index, score in enumerate(scores) if score == max(scores)]
+            for index in winners:
+                expected[index] += 1.0 / len(winners) / len(rivers)
+
+        equities = VectorMonteCarloSimulator().equities_for_hands(hands, board)
+        assert equities == pytest.approx(expected)
+
+    def test_ties_are_split_and_equities_sum_to_one(self):
+        simulator = VectorMonteCarloSimulator(num_simulations=20000, rng=18)
+        equities = simulator.equities_for_hands([cards_from("As Ah"), cards_from("Ad Ac")], [])
+        assert sum(equities) == pytest.approx(1.0)
+        assert equities[0] == pytest.approx(0.5, abs=0.01)
+
+        # 보드 플레이: 둘 다 보드의 로열 플러시
+        board = cards_from("As Ks Qs Js 10s")
+        assert simulator.equities_for_hands([cards_from("2c 3d"), cards_from("4h 5c")], board) == [0.5, 0.5]
+
+    def test_preflop_matches_known_matchup(self):
+        simulator = VectorMonteCarloSimulator(num_simulations=40000, rng=19)
+        equities = simulator.equities_for_hands([cards_from("As Ah"), cards_from("Kd Kc")], [])
+        assert equities[0] == pytest.approx(0.82, abs=0.01)
+
+    def test_deadline_bounds_sampling(self):
+        simulator = VectorMonteCarloSimulator(num_simulations=10 ** 7, rng=20)
+        hands = [cards_from("As Ah"), cards_from("Kd Kc"), cards_from("9s 8s")]
+        start = time.perf_counter()
+        equities = simulator.equities_for_hands(hands, [], deadline_ms=20)
+        assert (time.perf_counter() - start) * 1000 < 200
+        assert sum(equities) == pytest.approx(1.0)
+        assert equities[0] > equities[1]
+
+    def test_suit_relabelled_hands_share_a_key(self):
+        def ids(text):
+            return [card.id for card in cards_from(text)]
+
+        spade = canonical_hands_key([ids("As Ks"), ids("Qs Js")], ids("10s 2d 2h"))
+        heart = canonical_hands_key([ids("Kh Ah"), ids("Jh Qh")], ids("2c 10h 2s"))
+        assert spade == heart
+        # 결과가 핸드 순서를 따르므로 핸드 순서가 바뀌면 다른 키
+        assert canonical_hands_key([ids("Qs Js"), ids("As Ks")], ids("10s 2d 2h")) != spade
+
+    def test_rejects_duplicate_cards(self):
+        with pytest.raises(ValueError):
+            VectorMonteCarloSimulator().equities_for_hands(
+                [cards_from("As Ah"), cards_from("As Kc")], []
+            )
+
+
+class TestHandPotential:
+    """HS / PPot / NPot / EHS 엔진 테스트"""
+
+    def test_exact_ehs2_matches_flop_database(self):
+        flop, hole = cards_from("Ks 9s 4d"), cards_from("Qs Js")
+        result = HandStrengthEngine(max_work=10 ** 7).evaluate(hole, flop)
+        expected = flop_database.flop_equities([card.id for card in flop])
+        index = hand_classes.combo_index(*sorted(card.id for card in hole))
+        assert result.ehs2 == pytest.approx(expected[index, 1], abs=1e-9)
+        assert result.histogram.sum() == pytest.approx(1.0)
+
+    def test_draw_has_more_potential_than_made_hand(self):
+        engine = HandStrengthEngine(max_work=10 ** 7)
+        flop = cards_from("Ks 9s 4d")
+        draw = engine.evaluate(cards_from("Qs Js"), flop)
+        made = engine.evaluate(cards_from("Kh Kd"), flop)
+        assert draw.ppot > 0.3 > made.ppot
+        assert draw.ehs > draw.hand_strength
+        assert made.hand_strength > 0.95
+
+    def test_river_has_no_potential(self):
+        result = HandStrengthEngine().evaluate(cards_from("As Ks"), cards_from("Ah Kd 7c 5s 2h"))
+        assert result.ppot == result.npot == 0.0
+        assert result.ehs == result.hand_strength
+
+    def test_sampled_flop_is_close_to_exact(self):
+        flop, hole = cards_from("Ah 8d 5c"), cards_from("7h 6h")
+        exact = HandStrengthEngine(max_work=10 ** 7).evaluate(hole, flop)
+        sampled = HandStrengthEngine(rng=1).evaluate(hole, flop)
+        assert sampled.ehs == pytest.approx(exact.ehs, abs=0.05)
+        assert sampled.hand_strength == exact.hand_strength
+
+    def test_isomorphic_spot_is_served_from_cache(self):
+        engine = HandStrengthEngine()
+        first = engine.evaluate(cards_from("Qs Js"), cards_from("Ks 9s 4d 2c"))
+        second = engine.evaluate(cards_from("Qh Jh"), cards_from("Kh 9h 4c 2d"))
+        assert second is first
+        assert engine.cache.hits == 1
+
+    def test_invalid_input_raises(self):
+        engine = HandStrengthEngine()
+        with pytest.raises(ValueError):
+            engine.evaluate(cards_from("As Ks"), cards_from("Ah Kd"))
+        with pytest.raises(ValueError):
+            engine.evaluate(cards_from("As Ks"), cards_from("As 7d 2c"))
+
+
+class TestScenarioGenerator:
+    """족보 지정 상황 생성기 테스트"""
+
+    def test_counts_match_known_seven_card_frequencies(self):
+        assert ScenarioGenerator.count(5, "STRAIGHT_FLUSH") == 37260
+        assert ScenarioGenerator.count(5, "ROYAL_FLUSH") == 4324
+        assert ScenarioGenerator.count(5, "FOUR_OF_A_KIND") == 224848
+        assert ScenarioGenerator.count(5, "FLUSH") == 4047644
+        assert ScenarioGenerator.count(5, "ONE_PAIR") == 58627800
+        assert sum(ScenarioGenerator.count(3, rank) for rank in HandRank) == 2598960
+
+    @pytest.mark.parametrize("num_board_cards", [3, 4, 5])
+    def test_samples_have_the_requested_rank(self, num_board_cards):
+        generator = ScenarioGenerator(rng=3)
+        for rank in HandRank:
+            deals = np.array([
+                sum(generator.sample_ids(num_board_cards, rank), []) for _ in range(50)
+            ])
+            assert len(set(deals[0])) == 2 + num_board_cards
+            categories = batch_evaluator.evaluate_batch(deals) >> lookup_evaluator.CATEGORY_SHIFT
+            assert (categories == rank.value).all()
+
+    def test_samples_are_uniform_within_the_class(self):
+        # 플랍 포카드: 랭크 13개가 같은 비율로 나와야 함
+        generator = ScenarioGenerator(rng=5)
+        quad_ranks = []
+        for _ in range(2600):
+            hole, board = generator.sample(3, HandRank.FOUR_OF_A_KIND)
+            ranks = [card.rank for card in hole + board]
+            quad_ranks.append(max(set(ranks), key=ranks.count))
+        counts = [quad_ranks.count(rank) for rank in Rank]
+        assert min(counts) > 140 and max(counts) < 260
+
+    def test_rare_rank_is_fast(self):
+        generator = ScenarioGenerator(rng=7)
+        generator.sample(5, "STRAIGHT_FLUSH")
+        start = time.perf_counter()
+        for _ in range(200):
+            generator.sample(5, "STRAIGHT_FLUSH")
+        assert time.perf_counter() - start < 1.0
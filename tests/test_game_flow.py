@@ -3,9 +3,17 @@
 전체 게임 진행 테스트 및 디버그 기능 검증
 """
 
+import os
+import random
+
 import pytest
+from src.core.card import Card, Deck
 from src.core.game import PokerGame, GamePhase, Action
 from src.core.player import Player
+from src.core import table_state
+from src.core.hand_log import EventType, HandEventLog
+from src.core import hand_history
+from src.core.hand_history import HandHistoryReader, HandHistoryWriter
 
 
 class TestGameFlow:
@@ -249,6 +257,21 @@ class TestGameFlow:
         # 팟에 블라인드가 추가되었는지 확인
         assert game.pot >= 30  # SB(10) + BB(20)
 
+    def test_blinds_counted_once_in_pot(self):
+        """블라인드가 post_blinds와 collect_bets에서 두 번 더해지지 않는지 테스트"""
+        game = PokerGame(small_blind=10, big_blind=20)
+        game.add_player("Alice", 1000)
+        game.add_player("Bob", 1000)
+        game.add_player("Charlie", 1000)
+
+        game.new_hand()
+        game.post_blinds()
+        assert game.pot == 30
+
+        game.collect_bets()
+        assert game.pot == 30
+        assert sum(player.chips for player in game.players) + game.pot == 3000
+
     def test_pot_distribution_single_winner(self):
         """단일 승자 팟 분배 테스트"""
         game = PokerGame()
@@ -455,5 +478,456 @@ class TestSidePots:
         assert game.players[2].chips == initial_chips + 500
 
 
+def calling_bot(game, player):
+    """체크 가능하면 체크, 아니면 콜하는 결정 함수"""
+    call_amount = game.current_bet - player.current_bet
+    if call_amount == 0:
+        return (Action.CHECK, 0)
+    return (Action.CALL, call_amount)
+
+
+def make_random_bot(rng):
+    """가능한 액션 중 무작위로 고르는 결정 함수 (레이즈는 최소 금액)"""
+    def decide(game, player):
+        actions = game.get_available_actions(player)
+        action = rng.choice(actions)
+        if action == Action.CALL:
+            return (action, game.current_bet - player.current_bet)
+        if action == Action.RAISE:
+            return (action, game.min_raise)
+        if action == Action.ALL_IN:
+            return (action, player.chips)
+        return (action, 0)
+    return decide
+
+
+class TestHeadlessMode:
+    """헤드리스 모드 (결정 함수 + 콘솔 출력 없음) 테스트"""
+
+    def test_headless_hands_print_nothing(self, capsys):
+        game = PokerGame(headless=True)
+        game.add_player("Alice", 1000, decide=calling_bot)
+        game.add_player("Bob", 1000, decide=calling_bot)
+
+        for _ in range(50):
+            game.play_full_hand()
+
+        assert capsys.readouterr().out == ""
+        assert game.action_history == []
+        assert sum(player.chips for player in game.players) == 2000
+
+    def test_random_bots_conserve_chips(self):
+        rng = random.Random(11)
+        game = PokerGame(headless=True)
+        for name in ("Alice", "Bob", "Charlie"):
+            game.add_player(name, 1000, decide=make_random_bot(rng))
+
+        for hand in range(300):
+            game.dealer_position = hand % len(game.players)
+            game.play_full_hand()
+            assert sum(player.chips for player in game.players) == 3000
+
+    def test_event_sink_receives_log_messages(self):
+        messages = []
+        game = PokerGame(headless=True, event_sink=messages.append)
+        game.add_player("Alice", 1000, decide=calling_bot)
+        game.add_player("Bob", 1000, decide=calling_bot)
+
+        game.play_full_hand()
+
+        assert any("블라인드" in message for message in messages)
+        assert any("FLOP" in message for message in messages)
+
+    def test_missing_decision_function_raises(self):
+        game = PokerGame(headless=True)
+        game.add_player("Alice", 1000, decide=calling_bot)
+        game.add_player("Bob", 1000)
+
+        with pytest.raises(RuntimeError):
+            game.play_full_hand()
+
+    def test_decision_function_replaces_console_input(self, monkeypatch):
+        # 헤드리스가 아니어도 결정 함수가 있으면 input()을 부르지 않음
+        monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("input() 호출"))
+        game = PokerGame()
+        game.add_player("Alice", 1000, decide=calling_bot)
+        game.add_player("Bob", 1000, decide=calling_bot)
+
+        game.play_full_hand()
+
+        assert sum(player.chips for player in game.players) == 2000
+
+
+class TestSnapshot:
+    """PokerGame.snapshot / restore 테스트"""
+
+    def make_game(self, seed):
+        rng = random.Random(seed)
+        game = PokerGame(headless=True)
+        for name in ("Alice", "Bob", "Charlie"):
+            game.add_player(name, 1000, decide=make_random_bot(rng))
+        return game, rng
+
+    def finish_hand(self, game):
+        """블라인드 이후 남은 핸드 진행 (play_full_hand의 나머지 부분)"""
+        game.betting_round()
+        while game.current_phase != GamePhase.SHOWDOWN:
+            if len(game.get_active_players()) <= 1:
+                winner = game.get_active_players()[0]
+                winner.chips += game.pot
+                game.pot = 0
+                game.last_winners = [winner]
+                break
+            game.advance_phase()
+
+    def test_restore_replays_same_hand(self):
+        game, rng = self.make_game(21)
+        for _ in range(30):
+            game.new_hand()
+            game.post_blinds()
+            state = game.snapshot()
+            # Deck.deal은 전역 random으로 남은 카드 중 하나를 뽑으므로 함께 되돌림
+            rng_state = rng.getstate()
+            deal_state = random.getstate()
+
+            self.finish_hand(game)
+            first = game.snapshot()
+
+            # 되돌린 뒤 같은 결정으로 다시 진행하면 결과가 같아야 함
+            game.restore(state)
+            rng.setstate(rng_state)
+            random.setstate(deal_state)
+            assert game.snapshot() == state
+            self.finish_hand(game)
+            assert game.snapshot() == first
+            assert sum(player.chips for player in game.players) == 3000
+
+    def test_restore_keeps_player_objects(self):
+        game, _ = self.make_game(22)
+        players = list(game.players)
+        game.new_hand()
+        state = game.snapshot()
+
+        game.players[0].fold()
+        game.community_cards.append(game.deck.deal())
+        game.restore(state)
+
+        assert [id(player) for player in game.players] == [id(player) for player in players]
+        assert game.players[0].has_folded is False
+        assert game.community_cards == []
+        assert game.deck.cards_left() == 52 - 6
+
+    def test_restore_into_new_game(self):
+        game, _ = self.make_game(23)
+        game.new_hand()
+        game.post_blinds()
+        state = game.snapshot()
+
+        copy_game = PokerGame(headless=True)
+        copy_game.restore(state)
+
+        assert [player.name for player in copy_game.players] == ["Alice", "Bob", "Charlie"]
+        assert copy_game.snapshot() == state
+
+
+class TestHandEventLog:
+    """구조화된 핸드 이벤트 로그 테스트"""
+
+    def test_hand_events_in_order(self):
+        game = PokerGame(headless=True, event_log=HandEventLog())
+        game.add_player("Alice", 1000, decide=calling_bot)
+        game.add_player("Bob", 1000, decide=calling_bot)
+
+        game.play_full_hand()
+
+        types = [event.type for event in game.events]
+        assert types[:5] == [
+            EventType.HAND_START, EventType.SEAT, EventType.SEAT, EventType.BLIND, EventType.BLIND,
+        ]
+        seats = [event for event in game.events if event.type == EventType.SEAT]
+        assert [event.cards for event in seats] == [
+            tuple(card.id for card in player.hand) for player in game.players
+        ]
+        assert types.count(EventType.BOARD) == 3
+        assert types[-1] == EventType.WIN
+        assert all(event.hand_id == 1 for event in game.events)
+
+        board = [card_id for event in game.events if event.type == EventType.BOARD for card_id in event.cards]
+        assert board == [card.id for card in game.community_cards]
+
+    def test_win_amounts_match_pot(self):
+        rng = random.Random(31)
+        hands = []
+        game = PokerGame(headless=True, event_log=HandEventLog(archive=hands.append))
+        for name in ("Alice", "Bob", "Charlie"):
+            game.add_player(name, 1000, decide=make_random_bot(rng))
+
+        for hand in range(100):
+            game.dealer_position = hand % len(game.players)
+            game.play_full_hand()
+
+        assert [events[0].hand_id for events in hands] == list(range(1, 101))
+        for events in hands:
+            wins = [event for event in events if event.type == EventType.WIN]
+            bets = [event for event in events if event.type != EventType.WIN]
+            assert wins
+            assert sum(event.amount for event in wins) == bets[-1].pot
+
+    def test_headless_records_nothing_by_default(self):
+        game = PokerGame(headless=True)
+        game.add_player("Alice", 1000, decide=calling_bot)
+        game.add_player("Bob", 1000, decide=calling_bot)
+
+        game.play_full_hand()
+        game.play_full_hand()
+
+        assert game.events is None
+        assert game.hand_id == 2
+
+    def test_action_recorded_under_acting_players_seat(self):
+        game = PokerGame(event_log=HandEventLog())
+        for name in ("Alice", "Bob", "Charlie"):
+            game.add_player(name, 1000)
+        game.new_hand()
+
+        # 현재 차례가 아닌 플레이어의 액션도 그 플레이어 자리로 기록
+        seat = (game.current_player_index + 1) % len(game.players)
+        game.process_action(game.players[seat], Action.FOLD, 0)
+
+        event = game.events.current_hand[-1]
+        assert event.type == EventType.FOLD
+        assert event.seat == seat != game.current_player_index
+
+    def test_memory_stays_bounded(self, capsys):
+        archived = []
+        game = PokerGame(event_log=HandEventLog(capacity=50, archive=archived.append))
+        game.add_player("Alice", 1000, decide=calling_bot)
+        game.add_player("Bob", 1000, decide=calling_bot)
+
+        for _ in range(200):
+            game.play_full_hand()
+
+        # 문자열 로그는 현재 핸드 것만, 이벤트는 최근 capacity개만 남음
+        assert 0 < len(game.action_history) < 30
+        assert len(game.events) == 50
+        assert len(archived) == 200
+        assert game.events.hand(200) == archived[-1]
+        assert game.events.current_hand == []
+
+
+class TestHandHistory:
+    """바이너리 핸드 히스토리 기록/읽기/재실행 테스트"""
+
+    def record_hands(self, path, num_hands, seed=41):
+        """무작위 봇 4명으로 핸드를 진행하며 파일에 기록 -> 기록된 이벤트 목록"""
+        rng = random.Random(seed)
+        archived = []
+        with HandHistoryWriter(path) as writer:
+            def archive(events):
+                archived.append(events)
+                writer.write_hand(events)
+
+            game = PokerGame(headless=True, event_log=HandEventLog(archive=archive))
+            for name in ("Alice", "Bob", "Charlie", "Dave"):
+                game.add_player(name, 500, decide=make_random_bot(rng))
+            for hand in range(num_hands):
+                if sum(player.chips > 0 for player in game.players) < 2:
+                    for player in game.players:
+                        player.chips = 500
+                game.dealer_position = hand % len(game.players)
+                game.play_full_hand()
+        return archived
+
+    def test_varint_round_trip(self):
+        out = bytearray()
+        values = [0, 1, 127, 128, 300, 16383, 16384, 2 ** 40]
+        for value in values:
+            hand_history.write_varint(out, value)
+
+        pos = 0
+        for value in values:
+            decoded, pos = hand_history.read_varint(out, pos)
+            assert decoded == value
+        assert pos == len(out)
+        assert len(out) == 1 + 1 + 1 + 2 + 2 + 2 + 3 + 6
+
+    def test_round_trip_and_random_access(self, tmp_path):
+        path = str(tmp_path / "hands.hh")
+        archived = self.record_hands(path, 300)
+
+        reader = HandHistoryReader(path)
+        assert len(reader) == 300
+        assert list(reader) == archived
+        assert reader[123] == archived[123]
+        assert reader[-1] == archived[-1]
+
+    def test_replay_reproduces_results(self, tmp_path):
+        path = str(tmp_path / "hands.hh")
+        archived = self.record_hands(path, 300)
+
+        for events in HandHistoryReader(path):
+            final = hand_history.replay_hand(events)
+            winners = {event.seat for event in events if event.type == EventType.WIN}
+            assert set(final.winners) == winners
+
+    def test_replay_rejects_tampered_hand(self, tmp_path):
+        path = str(tmp_path / "hands.hh")
+        events = next(
+            events for events in self.record_hands(path, 50)
+            if any(event.type == EventType.WIN and event.amount > 1 for event in events)
+        )
+        tampered = [
+            event._replace(amount=event.amount - 1) if event.type == EventType.WIN else event
+            for event in events
+        ]
+
+        with pytest.raises(ValueError):
+            hand_history.replay_hand(tampered)
+
+    def test_append_and_recover_without_index(self, tmp_path):
+        path = str(tmp_path / "hands.hh")
+        first = self.record_hands(path, 20, seed=1)
+        second = self.record_hands(path, 20, seed=2)   # 같은 파일에 이어 쓰기
+        assert list(HandHistoryReader(path)) == first + second
+
+        # 인덱스가 없거나 마지막 레코드가 잘려도 온전한 핸드는 모두 읽힘
+        os.remove(path + ".idx")
+        with open(path, "ab") as f:
+            f.write(b"\x50\x01\x02")
+        assert list(HandHistoryReader(path)) == first + second
+
+
+def random_choice(rng, actions, call_amount, chips, min_raise):
+    """가능한 액션 중 무작위 (레이즈 금액도 무작위)"""
+    action = rng.choice(actions)
+    if action == Action.RAISE:
+        return (action, rng.randint(min_raise, chips - call_amount))
+    if action == Action.CALL:
+        return (action, call_amount)
+    return (action, 0)
+
+
+class TestTableState:
+    """순수 상태/전이 API 테스트"""
+
+    def test_start_hand_posts_blinds(self):
+        state = table_state.start_hand([1000, 1000, 1000], dealer_position=0, rng=random.Random(1))
+
+        assert state.phase == GamePhase.PREFLOP
+        assert [seat.current_bet for seat in state.seats] == [0, 10, 20]
+        assert state.pot == 30 and state.current_bet == 20
+        assert state.current_player_index == 0
+        assert all(len(seat.hole) == 2 for seat in state.seats)
+        assert len(state.deck) == 8    # 번 3장 + 보드 5장
+        assert table_state.legal_actions(state) == [Action.FOLD, Action.CALL, Action.RAISE, Action.ALL_IN]
+
+    def test_apply_does_not_modify_the_original_state(self):
+        state = table_state.start_hand([1000, 1000], rng=random.Random(2))
+        after_call = table_state.apply(state, (Action.CALL, 10))
+
+        assert state.seats[1].chips == 990
+        assert after_call.seats[1].chips == 980
+        # 콜 후 BB 옵션이 남아 있으므로 아직 프리플랍
+        assert after_call.phase == GamePhase.PREFLOP
+        after_check = table_state.apply(after_call, (Action.CHECK, 0))
+        assert after_check.phase == GamePhase.FLOP
+        assert len(after_check.community) == 3
+        assert after_check.pot == 40
+
+    def test_fold_ends_hand_early(self):
+        state = table_state.start_hand([1000, 1000], dealer_position=0, rng=random.Random(3))
+        state = table_state.apply(state, (Action.FOLD, 0))
+
+        assert state.is_over
+        assert state.winners == (0,)
+        assert [seat.chips for seat in state.seats] == [1010, 990]
+        assert table_state.legal_actions(state) == []
+        with pytest.raises(ValueError):
+            table_state.apply(state, (Action.CHECK, 0))
+
+    def test_illegal_action_raises(self):
+        state = table_state.start_hand([1000, 1000], rng=random.Random(4))
+        with pytest.raises(ValueError):
+            table_state.apply(state, (Action.CHECK, 0))
+
+    def run_lockstep(self, monkeypatch, rng, num_players, stack_choices, choose, num_hands=300):
+        """엔진과 상태 API를 같은 덱/액션으로 진행하며 매 결정마다 상태를 비교"""
+        # 엔진 덱을 정해진 순서로 끝에서부터 딜하도록 고정해 같은 카드로 진행
+        order = []
+        monkeypatch.setattr("src.core.card.random.randrange", lambda n: n - 1)
+        monkeypatch.setattr(Deck, "reset", lambda deck: setattr(deck, "cards", [Card.from_id(i) for i in order]))
+
+        box = {}
+
+        def decide(game, player):
+            state = box["state"]
+            assert table_state.from_game(game) == state
+            choice = choose(state)
+            box["state"] = table_state.apply(state, choice)
+            return choice
+
+        game = PokerGame(headless=True)
+        for seat in range(num_players):
+            game.add_player(f"P{seat}", 1, decide=decide)
+
+        for hand in range(num_hands):
+            # 빈 스택을 섞어 비활성 좌석도 검사
+            for player in game.players:
+                player.chips = rng.choice(stack_choices)
+            if sum(player.chips > 0 for player in game.players) < 2:
+                continue
+            order[:] = rng.sample(range(52), 52)
+            game.dealer_position = hand % num_players
+            box["state"] = table_state.start_hand(
+                [player.chips for player in game.players],
+                dealer_position=game.dealer_position,
+                names=[player.name for player in game.players],
+                deck=order,
+            )
+            game.play_full_hand()
+
+            final = box["state"]
+            assert final.is_over
+            assert [seat.chips for seat in final.seats] == [player.chips for player in game.players]
+            assert final.winners == tuple(game.players.index(winner) for winner in game.last_winners)
+
+    def test_matches_engine_with_random_actions(self, monkeypatch):
+        rng = random.Random(5)
+
+        def choose(state):
+            return random_choice(
+                rng, table_state.legal_actions(state), state.call_amount(),
+                state.current_seat.chips, state.min_raise
+            )
+
+        self.run_lockstep(monkeypatch, rng, 3, [0, 40, 500, 500, 500], choose)
+
+    def test_matches_engine_action_cap_in_raise_war(self, monkeypatch):
+        # 계속 최소 레이즈 -> 스트리트당 액션 상한(플레이어 수 x 4)에서 라운드 종료
+        rng = random.Random(6)
+
+        def choose(state):
+            if Action.RAISE in table_state.legal_actions(state):
+                return (Action.RAISE, state.min_raise)
+            return (Action.CALL, state.call_amount())
+
+        self.run_lockstep(monkeypatch, rng, 2, [100000], choose, num_hands=20)
+
+    def test_play_hand_with_policy(self):
+        rng = random.Random(7)
+
+        def policy(state):
+            return random_choice(
+                rng, table_state.legal_actions(state), state.call_amount(),
+                state.current_seat.chips, state.min_raise
+            )
+
+        for _ in range(200):
+            state = table_state.start_hand([300, 300, 300, 300], rng=rng)
+            final = table_state.play_hand(state, policy)
+            assert final.is_over
+            assert sum(seat.chips for seat in final.seats) == 1200
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
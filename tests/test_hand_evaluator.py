@@ -0,0 +1,194 @@
+"""
+족보 판정 테스트 - 룩업 테이블 백엔드
+"""
+
+import random
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from src.core.card import Card, Deck, Suit, Rank, cards_to_ids, ids_to_cards
+from src.algorithms.hand_evaluator import HandEvaluator, HandRank
+from src.algorithms.batch_evaluator import evaluate_batch, deal_batch
+from src.algorithms.lookup_evaluator import CATEGORY_SHIFT
+
+
+def reference_evaluate(cards):
+    """C(7,5) 조합 순회 방식의 기존 판정 (참조 구현)"""
+    best_key = (-1, [])
+    best = None
+    for combo in combinations(cards, 5):
+        rank, kickers = HandEvaluator._evaluate_5_card_hand(list(combo))
+        if (rank.value, kickers) > best_key:
+            best_key = (rank.value, kickers)
+            best = (rank, kickers, list(combo))
+    return best
+
+
+def cards_from(text):
+    """'As Kh 10d' 형태의 문자열을 카드 목록으로 변환"""
+    suits = {"s": Suit.SPADES, "h": Suit.HEARTS, "d": Suit.DIAMONDS, "c": Suit.CLUBS}
+    ranks = {rank.symbol: rank for rank in Rank}
+    return [Card(suits[token[-1]], ranks[token[:-1]]) for token in text.split()]
+
+
+class TestLookupEvaluator:
+    """룩업 테이블 판정이 기존 조합 판정과 같은 결과를 내는지 테스트"""
+
+    def test_matches_reference_on_random_hands(self):
+        rng = random.Random(1234)
+        for _ in range(3000):
+            deck = Deck()
+            rng.shuffle(deck.cards)
+            hand = deck.cards[:rng.choice([5, 6, 7])]
+            assert HandEvaluator.evaluate_hand(hand) == reference_evaluate(hand)
+
+    def test_royal_flush(self):
+        cards = cards_from("As Ks Qs Js 10s 2d 3c")
+        rank, kickers, best = HandEvaluator.evaluate_hand(cards)
+        assert rank == HandRank.ROYAL_FLUSH
+        assert kickers == [14, 13, 12, 11, 10]
+        assert best == cards[:5]
+
+    def test_steel_wheel(self):
+        cards = cards_from("Ah 2h 3h 4h 5h 6d Kc")
+        rank, kickers, _ = HandEvaluator.evaluate_hand(cards)
+        assert rank == HandRank.STRAIGHT_FLUSH
+        assert kickers == [5, 4, 3, 2, 1]
+
+    def test_wheel_straight(self):
+        cards = cards_from("Ah 2d 3h 4c 5s 9d Kc")
+        rank, kickers, best = HandEvaluator.evaluate_hand(cards)
+        assert rank == HandRank.STRAIGHT
+        assert kickers == [5, 4, 3, 2, 1]
+        assert best == cards[:5]
+
+    def test_two_trips_make_full_house(self):
+        cards = cards_from("9s 9h 9d 4c 4s 4h Ac")
+        rank, kickers, _ = HandEvaluator.evaluate_hand(cards)
+        assert rank == HandRank.FULL_HOUSE
+        assert kickers == [9, 9, 9, 4, 4]
+
+    def test_four_of_a_kind_uses_best_kicker(self):
+        cards = cards_from("7s 7h 7d 7c Ks Kh 2d")
+        rank, kickers, _ = HandEvaluator.evaluate_hand(cards)
+        assert rank == HandRank.FOUR_OF_A_KIND
+        assert kickers == [7, 7, 7, 7, 13]
+
+    def test_three_pairs_keep_best_kicker(self):
+        cards = cards_from("Qs Qh 8d 8c 3s 3h 5d")
+        rank, kickers, _ = HandEvaluator.evaluate_hand(cards)
+        assert rank == HandRank.TWO_PAIR
+        assert kickers == [12, 12, 8, 8, 5]
+
+    def test_flush_beats_straight(self):
+        cards = cards_from("2h 7h 9h Jh Kh 10d Qc")
+        rank, kickers, best = HandEvaluator.evaluate_hand(cards)
+        assert rank == HandRank.FLUSH
+        assert kickers == [13, 11, 9, 7, 2]
+        assert all(card.suit == Suit.HEARTS for card in best)
+
+
+class TestHandScore:
+    """정수 점수 API 테스트"""
+
+    def test_score_order_matches_rank_and_kickers(self):
+        rng = random.Random(99)
+        hands = []
+        for _ in range(500):
+            deck = Deck()
+            rng.shuffle(deck.cards)
+            hands.append(deck.cards[:7])
+
+        for a, b in zip(hands, hands[1:]):
+            rank_a, kickers_a, _ = HandEvaluator.evaluate_hand(a)
+            rank_b, kickers_b, _ = HandEvaluator.evaluate_hand(b)
+            key_a = (rank_a.value, kickers_a)
+            key_b = (rank_b.value, kickers_b)
+            score_a = HandEvaluator.score(a)
+            score_b = HandEvaluator.score(b)
+            assert (score_a > score_b) == (key_a > key_b)
+            assert (score_a == score_b) == (key_a == key_b)
+
+    def test_decode_score_round_trip(self):
+        cards = cards_from("Qs Qh 8d 8c 3s 3h 5d")
+        score = HandEvaluator.score(cards)
+        rank, kickers = HandEvaluator.decode_score(score)
+        assert rank == HandRank.TWO_PAIR
+        assert kickers == [12, 12, 8, 8, 5]
+        assert HandEvaluator.encode_score(rank, kickers) == score
+
+    def test_score_rejects_wrong_card_count(self):
+        with pytest.raises(ValueError):
+            HandEvaluator.score(cards_from("As Ks Qs Js"))
+
+    def test_rank_hand_and_lazy_best_cards(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            deck = Deck()
+            rng.shuffle(deck.cards)
+            hand = deck.cards[:7]
+            rank, kickers, best = HandEvaluator.evaluate_hand(hand)
+            assert HandEvaluator.rank_hand(hand) == (rank, kickers)
+            assert HandEvaluator.best_hand_cards(hand) == best
+            assert HandEvaluator.best_hand_cards(hand, HandEvaluator.score(hand)) == best
+
+
+class TestBoardState:
+    """보드 공유 판정 테스트"""
+
+    def test_board_state_matches_full_score(self):
+        rng = random.Random(2024)
+        for _ in range(2000):
+            deck = Deck()
+            rng.shuffle(deck.cards)
+            board_size = rng.choice([3, 4, 5])
+            community = deck.cards[:board_size]
+            board = HandEvaluator.prepare_board(community)
+            for i in range(board_size, board_size + 8, 2):
+                hole = deck.cards[i:i + 2]
+                assert board.score_cards(hole) == HandEvaluator.score(hole + community)
+
+    def test_board_flush_needs_both_hole_cards(self):
+        board = HandEvaluator.prepare_board(cards_from("2h 7h 9h Kd 3c"))
+        flush = board.score_cards(cards_from("Ah 4h"))
+        no_flush = board.score_cards(cards_from("Ah 4s"))
+        assert HandEvaluator.decode_score(flush)[0] == HandRank.FLUSH
+        assert HandEvaluator.decode_score(no_flush)[0] == HandRank.HIGH_CARD
+
+    def test_prepare_board_rejects_wrong_card_count(self):
+        with pytest.raises(ValueError):
+            HandEvaluator.prepare_board(cards_from("As Ks"))
+
+
+class TestBatchEvaluator:
+    """NumPy 배치 판정 테스트"""
+
+    def test_batch_matches_scalar_score(self):
+        rng = np.random.default_rng(5)
+        for num_cards in (5, 6, 7):
+            deals = deal_batch(rng, 2000, num_cards)
+            scores = evaluate_batch(deals)
+            assert scores.shape == (2000,)
+            for row, score in zip(deals, scores):
+                assert score == HandEvaluator.score(ids_to_cards(row.tolist()))
+
+    def test_batch_flush_rows(self):
+        hands = np.array([
+            cards_to_ids(cards_from("As Ks Qs Js 10s 2d 3c")),
+            cards_to_ids(cards_from("2h 7h 9h Jh Kh 10d Qc")),
+            cards_to_ids(cards_from("9s 9h 9d 4c 4s 4h Ac")),
+        ])
+        categories = evaluate_batch(hands) >> CATEGORY_SHIFT
+        assert categories.tolist() == [
+            HandRank.ROYAL_FLUSH.value, HandRank.FLUSH.value, HandRank.FULL_HOUSE.value
+        ]
+
+    def test_deal_batch_has_distinct_cards(self):
+        rng = np.random.default_rng(11)
+        available = np.array([0, 5, 9, 13, 20, 33, 40, 51])
+        deals = deal_batch(rng, 500, 4, available)
+        assert np.isin(deals, available).all()
+        ordered = np.sort(deals, axis=1)
+        assert (ordered[:, 1:] != ordered[:, :-1]).all()